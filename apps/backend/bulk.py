@@ -0,0 +1,81 @@
+"""Leitura e validação de payloads de importação em lote (array JSON ou NDJSON)."""
+import json
+from typing import Any, List, Tuple, Type, TypeVar
+
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, ValidationError
+
+from apps.backend.schemas import BulkImportResponse, BulkRowResult
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+_UNPARSEABLE = object()
+_BLANK = object()  # linha vazia do NDJSON: ocupa o número da linha, não é item
+
+M = TypeVar("M", bound=BaseModel)
+
+
+async def read_bulk_payload(request: Request) -> List[Any]:
+    """
+    Corpo da requisição como lista de itens.
+    NDJSON (Content-Type application/x-ndjson): um objeto por linha; a posição na lista
+    é a linha física (0-based), então linhas vazias ficam como marcador ignorado por
+    `parse_rows` e os índices dos resultados apontam a linha certa do arquivo. Linha
+    malformada vira item inválido em vez de derrubar o lote. Demais: array JSON.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_MEDIA_TYPES:
+        items: List[Any] = []
+        for line in body.splitlines():
+            if not line.strip():
+                items.append(_BLANK)
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                items.append(_UNPARSEABLE)
+        return items
+    try:
+        data = json.loads(body)
+    except ValueError as err:
+        raise HTTPException(status_code=422, detail="Corpo não é JSON válido") from err
+    if not isinstance(data, list):
+        raise HTTPException(
+            status_code=422,
+            detail="Esperado array JSON (ou NDJSON com Content-Type application/x-ndjson)",
+        )
+    return data
+
+
+def invalid_row(index: int, error: str) -> BulkRowResult:
+    return BulkRowResult(index=index, status="INVALID", error=error)
+
+
+def parse_rows(items: List[Any], model: Type[M]) -> Tuple[List[Tuple[int, M]], List[BulkRowResult]]:
+    """Valida cada item contra `model`: (índice, item válido) e resultados INVALID dos demais."""
+    valid: List[Tuple[int, M]] = []
+    invalid: List[BulkRowResult] = []
+    for index, item in enumerate(items):
+        if item is _BLANK:
+            continue
+        if item is _UNPARSEABLE:
+            invalid.append(invalid_row(index, "JSON inválido"))
+            continue
+        try:
+            valid.append((index, model.model_validate(item)))
+        except ValidationError as err:
+            first = err.errors()[0]
+            field = ".".join(str(part) for part in first["loc"]) or "item"
+            invalid.append(invalid_row(index, f"{field}: {first['msg']}"))
+    return valid, invalid
+
+
+def bulk_response(results: List[BulkRowResult]) -> BulkImportResponse:
+    results = sorted(results, key=lambda r: r.index)
+    return BulkImportResponse(
+        created=sum(r.status == "CREATED" for r in results),
+        duplicates=sum(r.status == "DUPLICATE" for r in results),
+        invalid=sum(r.status == "INVALID" for r in results),
+        results=results,
+    )
@@ -1,12 +1,11 @@
 """Dependencies para FastAPI - sessão e repositório"""
 from pathlib import Path
-from apps.backend.src.infrastructure.database.setup import SessionLocal, init_db
+from apps.backend.src.infrastructure.database.setup import SessionLocal
 from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
 
 
 def get_repo():
-    """Yield repository instance. init_db on first use."""
-    init_db()
+    """Yield repository instance. Schema/migrações rodam no startup (lifespan), não aqui."""
     session = SessionLocal()
     try:
         yield SqlAlchemyRepository(session)
@@ -5,6 +5,7 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from apps.backend.src.application.export_jobs import EXPORT_JOBS
 from apps.backend.src.infrastructure.database.setup import init_db
 
 from apps.backend.routes import employees, sectors, preferences, scale, shifts, exceptions, demand_profile, config, weekday_template, sunday_rotation
@@ -14,7 +15,8 @@ from apps.backend.routes import employees, sectors, preferences, scale, shifts,
 async def lifespan(app: FastAPI):
     init_db()
     yield
-    # cleanup if needed
+    # Exports em andamento terminam antes do processo sair.
+    EXPORT_JOBS.shutdown(wait=True)
 
 
 app = FastAPI(
@@ -30,6 +32,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Paginação de /scale/assignments e /scale/violations.
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(employees.router)
@@ -4,6 +4,8 @@ from pathlib import Path
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
+from apps.backend.src.application.schedule_cache import SCHEDULE_CACHE
+from apps.backend.src.domain.policy_loader import POLICY_CACHE
 from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
 from apps.backend.deps import get_repo
 from apps.backend.schemas import (
@@ -21,7 +23,8 @@ POLICY_PATH = ROOT / "schemas" / "compliance_policy.example.json"
 
 
 def _load_policy_data() -> dict:
-    return json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+    # Cópia própria: as rotas de configuração alteram o dict antes de salvar.
+    return POLICY_CACHE.load_data(POLICY_PATH, copy=True)
 
 
 def _save_policy_data(data: dict) -> None:
@@ -29,6 +32,7 @@ def _save_policy_data(data: dict) -> None:
         json.dumps(data, ensure_ascii=False, indent=2) + "\n",
         encoding="utf-8",
     )
+    POLICY_CACHE.invalidate(POLICY_PATH)
 
 
 def _pending_items_from_policy(data: dict) -> list[str]:
@@ -217,6 +221,18 @@ def update_runtime_mode(payload: RuntimeModeUpdate):
     return _save_runtime_mode(data, mode=mode, actor_role=actor_role)
 
 
+@router.get("/policy-cache")
+def get_policy_cache_stats():
+    """Contadores do cache de policy (hits/misses/entradas)."""
+    return POLICY_CACHE.stats()
+
+
+@router.get("/schedule-cache")
+def get_schedule_cache_stats():
+    """Contadores do cache de escalas calculadas (hits/misses/entradas em memória)."""
+    return SCHEDULE_CACHE.stats()
+
+
 @router.get("/governance/audit", response_model=list[GovernanceAuditEvent])
 def list_governance_audit_events(
     limit: int = 50,
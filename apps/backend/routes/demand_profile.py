@@ -17,15 +17,17 @@ def list_demand_slots(
     period_end: Optional[date] = Query(None),
     repo: SqlAlchemyRepository = Depends(get_repo),
 ):
-    slots = repo.load_demand_profile(sector_id=sector_id, period_start=period_start, period_end=period_end)
+    df = repo.load_demand_profile_df(sector_id=sector_id, period_start=period_start, period_end=period_end)
     return [
         DemandSlotResponse(
-            sector_id=s.sector_id,
-            work_date=s.work_date,
-            slot_start=s.slot_start,
-            min_required=s.min_required,
+            sector_id=sector,
+            work_date=work_date,
+            slot_start=slot_start,
+            min_required=int(min_required),
+        )
+        for sector, work_date, slot_start, min_required in zip(
+            df["sector_id"], df["work_date"], df["slot_start"], df["min_required"]
         )
-        for s in slots
     ]
 
 
@@ -49,6 +51,30 @@ def create_demand_slot(
     )
 
 
+@router.post("/bulk")
+def import_demand_slots(
+    data: list[DemandSlotCreate],
+    repo: SqlAlchemyRepository = Depends(get_repo),
+):
+    """
+    Importação em lote: substitui os slots das datas enviadas (por setor) num único INSERT.
+    Slot repetido no payload: vale o último.
+    """
+    if not data:
+        return {"ok": True, "count": 0}
+    slots = [
+        DemandSlot(
+            sector_id=item.sector_id,
+            work_date=item.work_date,
+            slot_start=item.slot_start,
+            min_required=item.min_required,
+        )
+        for item in data
+    ]
+    repo.save_demand_profile_bulk(slots)
+    return {"ok": True, "count": len({(s.sector_id, s.work_date, s.slot_start) for s in slots})}
+
+
 @router.patch("", response_model=DemandSlotResponse)
 def update_demand_slot(
     data: DemandSlotUpdate,
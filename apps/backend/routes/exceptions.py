@@ -1,10 +1,12 @@
 """Rotas de exceções (férias, atestado, trocas, bloqueios)"""
 from datetime import date
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from apps.backend.src.domain.models import ScheduleException, ExceptionType
 from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
-from apps.backend.schemas import ExceptionCreate, ExceptionResponse, ExceptionUpdate
+from apps.backend.schemas import BulkImportResponse, BulkRowResult, ExceptionCreate, ExceptionResponse, ExceptionUpdate
+from apps.backend.bulk import bulk_response, invalid_row, parse_rows, read_bulk_payload
 from apps.backend.deps import get_repo
 
 router = APIRouter(prefix="/exceptions", tags=["exceptions"])
@@ -17,16 +19,18 @@ def list_exceptions(
     period_end: Optional[date] = Query(None),
     repo: SqlAlchemyRepository = Depends(get_repo),
 ):
-    excs = repo.load_exceptions(sector_id=sector_id, period_start=period_start, period_end=period_end)
+    df = repo.load_exceptions_df(sector_id=sector_id, period_start=period_start, period_end=period_end)
     return [
         ExceptionResponse(
-            sector_id=e.sector_id,
-            employee_id=e.employee_id,
-            exception_date=e.exception_date,
-            exception_type=e.exception_type.value,
-            note=e.note or None,
+            sector_id=sector,
+            employee_id=employee_id,
+            exception_date=exception_date,
+            exception_type=exception_type,
+            note=note or None,
+        )
+        for sector, employee_id, exception_date, exception_type, note in zip(
+            df["sector_id"], df["employee_id"], df["exception_date"], df["exception_type"], df["note"]
         )
-        for e in excs
     ]
 
 
@@ -55,6 +59,51 @@ def create_exception(
     )
 
 
+@router.post("/bulk", response_model=BulkImportResponse)
+async def import_exceptions(
+    request: Request,
+    repo: SqlAlchemyRepository = Depends(get_repo),
+):
+    """
+    Importação em lote (array JSON ou NDJSON). Itens válidos vão num único
+    INSERT ... ON CONFLICT DO NOTHING e um commit; a resposta traz o status de cada item.
+    """
+    items = await read_bulk_payload(request)
+    return await run_in_threadpool(_import_exceptions, items, repo)
+
+
+def _import_exceptions(items: list, repo: SqlAlchemyRepository) -> BulkImportResponse:
+    rows, results = parse_rows(items, ExceptionCreate)
+    known_employees = repo.existing_employee_ids(data.employee_id for _, data in rows)
+    indexes: list[int] = []
+    excs: list[ScheduleException] = []
+    for index, data in rows:
+        try:
+            exception_type = ExceptionType(data.exception_type)
+        except ValueError:
+            results.append(invalid_row(index, f"exception_type inválido: {data.exception_type}"))
+            continue
+        if data.employee_id not in known_employees:
+            results.append(invalid_row(index, f"employee_id não encontrado: {data.employee_id}"))
+            continue
+        indexes.append(index)
+        excs.append(
+            ScheduleException(
+                sector_id=data.sector_id,
+                employee_id=data.employee_id,
+                exception_date=data.exception_date,
+                exception_type=exception_type,
+                note=data.note or "",
+            )
+        )
+    inserted = repo.add_exceptions_bulk(excs)
+    results.extend(
+        BulkRowResult(index=index, status="CREATED" if created else "DUPLICATE")
+        for index, created in zip(indexes, inserted)
+    )
+    return bulk_response(results)
+
+
 @router.patch("", response_model=ExceptionResponse)
 def update_exception(
     data: ExceptionUpdate,
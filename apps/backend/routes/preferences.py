@@ -1,8 +1,10 @@
 """Rotas de pedidos (preferências)"""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from apps.backend.src.domain.models import PreferenceRequest, RequestType, RequestDecision
 from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
-from apps.backend.schemas import PreferenceCreate, PreferenceDecision, PreferenceResponse
+from apps.backend.schemas import BulkImportResponse, BulkRowResult, PreferenceCreate, PreferenceDecision, PreferenceResponse
+from apps.backend.bulk import bulk_response, invalid_row, parse_rows, read_bulk_payload
 from apps.backend.deps import get_repo
 
 router = APIRouter(prefix="/preferences", tags=["preferences"])
@@ -55,6 +57,53 @@ def create_preference(
     )
 
 
+@router.post("/bulk", response_model=BulkImportResponse)
+async def import_preferences(
+    request: Request,
+    repo: SqlAlchemyRepository = Depends(get_repo),
+):
+    """
+    Importação em lote (array JSON ou NDJSON). request_id já existente (ou repetido no lote)
+    vira DUPLICATE; itens válidos são gravados num único INSERT e um commit.
+    """
+    items = await read_bulk_payload(request)
+    return await run_in_threadpool(_import_preferences, items, repo)
+
+
+def _import_preferences(items: list, repo: SqlAlchemyRepository) -> BulkImportResponse:
+    rows, results = parse_rows(items, PreferenceCreate)
+    known_employees = repo.existing_employee_ids(data.employee_id for _, data in rows)
+    indexes: list[int] = []
+    reqs: list[PreferenceRequest] = []
+    for index, data in rows:
+        try:
+            request_type = RequestType(data.request_type)
+        except ValueError:
+            results.append(invalid_row(index, f"request_type inválido: {data.request_type}"))
+            continue
+        if data.employee_id not in known_employees:
+            results.append(invalid_row(index, f"employee_id não encontrado: {data.employee_id}"))
+            continue
+        indexes.append(index)
+        reqs.append(
+            PreferenceRequest(
+                request_id=data.request_id,
+                employee_id=data.employee_id,
+                request_date=data.request_date,
+                request_type=request_type,
+                priority=data.priority,
+                target_shift_code=data.target_shift_code,
+                note=data.note or "",
+            )
+        )
+    inserted = repo.add_preferences_bulk(reqs)
+    results.extend(
+        BulkRowResult(index=index, status="CREATED" if created else "DUPLICATE")
+        for index, created in zip(indexes, inserted)
+    )
+    return bulk_response(results)
+
+
 @router.patch("/{request_id}/decision")
 def update_preference_decision(
     request_id: str,
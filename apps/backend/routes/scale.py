@@ -1,21 +1,34 @@
 """Rotas de escala (geração, assignments, violations, export)"""
+from dataclasses import asdict
 from pathlib import Path
-from datetime import date
-import json
+from datetime import date, timedelta
+from typing import Iterator, Optional
 import os
+import numpy as np
 import pandas as pd
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import HTMLResponse, PlainTextResponse, FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import HTMLResponse, PlainTextResponse, FileResponse, StreamingResponse
+from pydantic_core import to_json
 
+from apps.backend.bulk import NDJSON_MEDIA_TYPES
+
+from apps.backend.src.domain.aggregates import WEEK_START_OFFSETS, ScheduleAggregates, target_profile
 from apps.backend.src.domain.models import ProjectionContext
-from apps.backend.src.domain.policy_loader import PolicyLoader
-from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
+from apps.backend.src.domain.policy_loader import POLICY_CACHE, PolicyLoader
+from apps.backend.src.infrastructure.repositories_db import (
+    SCHEDULE_ASSIGNMENT_COLUMNS,
+    SCHEDULE_VIOLATION_COLUMNS,
+    SqlAlchemyRepository,
+)
+from apps.backend.src.application.export_jobs import EXPORT_JOBS
+from apps.backend.src.application.schedule_cache import SCHEDULE_CACHE
 from apps.backend.src.application.use_cases import ValidationOrchestrator
 
 from apps.backend.schemas import (
     ScaleGenerateRequest,
     ScaleGenerateResponse,
     ScaleSimulateResponse,
+    ExportJobResponse,
     PreflightResponse,
     PreflightIssue,
     WeeklyAnalysisRequest,
@@ -34,113 +47,266 @@ POLICY_PATH = ROOT / "schemas" / "compliance_policy.example.json"
 DATA_DIR = ROOT / "data" / "fixtures"
 
 
-def _get_assignments_df():
-    path = OUTPUT / "final_assignments.csv"
-    if not path.exists():
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+RULE_LABELS = {
+    "R1_MAX_CONSECUTIVE": "Dias consecutivos (máx. 6)",
+    "R2_MIN_INTERSHIFT_REST": "Intervalo entre jornadas (mín. 11h)",
+    "R4_WEEKLY_TARGET": "Meta semanal de horas",
+    "R5_DEMAND_COVERAGE": "Cobertura insuficiente",
+    "R6_MAX_DAILY_MINUTES": "Limite diário de jornada",
+    # Compat legado para arquivos antigos já gerados.
+    "R2_INTERSHIFT_REST": "Intervalo entre jornadas (mín. 11h)",
+    "R3_WEEKLY_HOURS": "Meta semanal de horas",
+    "R4_DEMAND_COVERAGE": "Cobertura insuficiente",
+}
+
+
+def _get_assignments_df(
+    repo: SqlAlchemyRepository,
+    sector_id: Optional[str] = None,
+    period_start: Optional[date] = None,
+    period_end: Optional[date] = None,
+    run_id: Optional[int] = None,
+    **filters,
+) -> pd.DataFrame:
+    """Escala oficial (última geração do setor, ou `run_id` do cursor) restrita ao período, lida do banco."""
+    run_id = run_id if run_id is not None else repo.latest_schedule_run_id(sector_id)
+    if run_id is None:
         return pd.DataFrame()
-    return pd.read_csv(path)
+    return repo.load_schedule_assignments_df(run_id, period_start, period_end, **filters)
 
 
-def _get_violations_df():
-    path = OUTPUT / "violations.csv"
-    if not path.exists():
+def _get_violations_df(
+    repo: SqlAlchemyRepository,
+    sector_id: Optional[str] = None,
+    period_start: Optional[date] = None,
+    period_end: Optional[date] = None,
+    run_id: Optional[int] = None,
+    **filters,
+) -> pd.DataFrame:
+    run_id = run_id if run_id is not None else repo.latest_schedule_run_id(sector_id)
+    if run_id is None:
         return pd.DataFrame()
-    return pd.read_csv(path)
+    return repo.load_schedule_violations_df(run_id, period_start, period_end, **filters)
+
+
+def _parse_cursor(
+    cursor: Optional[str], repo: SqlAlchemyRepository, sector_id: Optional[str]
+) -> tuple[Optional[int], Optional[int]]:
+    """
+    Cursor opaco "<run_id>.<último id>": as páginas seguintes leem a mesma geração.
+    A geração do cursor tem de existir e ser do `sector_id` pedido.
+    """
+    if not cursor:
+        return None, None
+    try:
+        run_id, after_id = (int(part) for part in cursor.split("."))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"cursor inválido: {cursor}")
+    run_sector = repo.schedule_run_sector(run_id)
+    if run_sector is None or (sector_id and run_sector != sector_id):
+        raise HTTPException(status_code=400, detail=f"cursor inválido: {cursor} (geração removida ou de outro setor)")
+    return run_id, after_id
+
+
+def _parse_fields(fields: Optional[str], model) -> Optional[list[str]]:
+    """Projeção `fields=a,b`: só campos do modelo de resposta; None = todos."""
+    if not fields:
+        return None
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in model.model_fields]
+    if unknown or not requested:
+        raise HTTPException(status_code=422, detail=f"fields inválidos: {', '.join(unknown) or fields}")
+    return requested
+
+
+def _storage_columns(fields: Optional[list[str]], stored: tuple, derived: dict) -> Optional[list[str]]:
+    """Colunas do banco necessárias para a projeção (campos derivados puxam a coluna de origem)."""
+    if fields is None:
+        return None
+    needed = {derived.get(f, f) for f in fields}
+    return [col for col in stored if col in needed]
+
+
+def _json_response(content, headers: Optional[dict] = None) -> Response:
+    """
+    Caminho rápido das listas grandes: registros já no formato do `response_model`
+    (montados coluna a coluna) vão direto para JSON, sem um modelo Pydantic por linha
+    nem a revalidação do FastAPI. O `response_model` da rota continua documentando o schema.
+    """
+    return Response(content=to_json(content), media_type="application/json", headers=headers)
+
+
+def _paged_response(rows: list, run_id: Optional[int], df: pd.DataFrame, limit: Optional[int]) -> Response:
+    """Lista (ou projeção) com `X-Next-Cursor` quando a página veio cheia."""
+    headers = {}
+    if limit is not None and run_id is not None and len(df) == limit:
+        headers[NEXT_CURSOR_HEADER] = f"{run_id}.{int(df['id'].iloc[-1])}"
+    return _json_response(rows, headers)
+
+
+def _assignment_columns(df: pd.DataFrame, emp_names: dict) -> dict:
+    """Campos de AssignmentResponse como listas (coluna a coluna, sem iterrows)."""
+    employee_ids = [str(v) for v in df["employee_id"]] if "employee_id" in df.columns else None
+    return {
+        "work_date": lambda: [str(v) for v in df["work_date"]],
+        "employee_id": lambda: employee_ids,
+        "employee_name": lambda: [emp_names.get(v) for v in employee_ids],
+        "status": lambda: [str(v) for v in df["status"]],
+        "shift_code": lambda: [str(v) if pd.notna(v) else None for v in df["shift_code"]],
+        "minutes": lambda: [int(v) if pd.notna(v) else 0 for v in df["minutes"]],
+        "source_rule": lambda: [str(v) for v in df["source_rule"]] if "source_rule" in df.columns else [""] * len(df),
+    }
+
+
+def _violation_columns(df: pd.DataFrame, emp_names: dict) -> dict:
+    employee_ids = [str(v) for v in df["employee_id"]] if "employee_id" in df.columns else None
+    rule_codes = [str(v).strip() for v in df["rule_code"]] if "rule_code" in df.columns else None
+    return {
+        "employee_id": lambda: employee_ids,
+        "employee_name": lambda: [emp_names.get(v) for v in employee_ids],
+        "rule_code": lambda: rule_codes,
+        "rule_label": lambda: [RULE_LABELS.get(v) for v in rule_codes],
+        "severity": lambda: [str(v) for v in df["severity"]],
+        "date_start": lambda: [str(v) for v in df["date_start"]],
+        "date_end": lambda: [str(v) for v in df["date_end"]],
+        "detail": lambda: [str(v) for v in df["detail"]],
+    }
+
+
+def _records(builders: dict, fields: list[str]) -> list[dict]:
+    columns = {name: builders[name]() for name in fields}
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+# Linhas por bloco do NDJSON de /simulate (um write por bloco, não por linha).
+STREAM_CHUNK_ROWS = 5000
+
+
+def _accepts_ndjson(request: Request) -> bool:
+    accept = request.headers.get("accept", "")
+    return any(part.split(";")[0].strip().lower() in NDJSON_MEDIA_TYPES for part in accept.split(","))
+
+
+def _ndjson_chunks(
+    summary: dict,
+    assignments_df: pd.DataFrame,
+    violations_df: pd.DataFrame,
+    emp_names: dict,
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """
+    Resultado da simulação em NDJSON: uma linha `summary`, depois `assignment` e
+    `violation` (mesmos campos da resposta JSON) em blocos de `chunk_rows`, lidos
+    direto dos frames do motor sem montar a lista inteira.
+    """
+    yield to_json({"type": "summary", **summary}) + b"\n"
+    sections = (
+        ("assignment", assignments_df, _assignment_columns, list(AssignmentResponse.model_fields)),
+        ("violation", violations_df, _violation_columns, list(ViolationResponse.model_fields)),
+    )
+    for kind, df, builders, fields in sections:
+        for start in range(0, len(df), chunk_rows):
+            rows = _records(builders(df.iloc[start:start + chunk_rows], emp_names), fields)
+            yield b"".join(to_json({"type": kind, **row}) + b"\n" for row in rows)
 
 
-def _assignments_to_response(df: pd.DataFrame, emp_names: dict) -> list:
+def _assignment_records(df: pd.DataFrame, emp_names: dict, fields: Optional[list[str]] = None) -> list[dict]:
+    """Registros de AssignmentResponse (ou da projeção `fields`) como dicts prontos para JSON."""
     if df.empty:
         return []
-    rows = []
-    for _, r in df.iterrows():
-        rows.append(
-            AssignmentResponse(
-                work_date=str(r["work_date"]),
-                employee_id=str(r["employee_id"]),
-                employee_name=emp_names.get(str(r["employee_id"])),
-                status=str(r["status"]),
-                shift_code=str(r["shift_code"]) if pd.notna(r.get("shift_code")) else None,
-                minutes=int(r["minutes"]) if pd.notna(r.get("minutes")) else 0,
-                source_rule=str(r["source_rule"]) if "source_rule" in r else "",
-            )
-        )
-    return rows
+    return _records(_assignment_columns(df, emp_names), fields or list(AssignmentResponse.model_fields))
 
 
-def _violations_to_response(df: pd.DataFrame, emp_names: dict) -> list:
+def _violation_records(df: pd.DataFrame, emp_names: dict, fields: Optional[list[str]] = None) -> list[dict]:
     if df.empty:
         return []
-    rule_labels = {
-        "R1_MAX_CONSECUTIVE": "Dias consecutivos (máx. 6)",
-        "R2_MIN_INTERSHIFT_REST": "Intervalo entre jornadas (mín. 11h)",
-        "R4_WEEKLY_TARGET": "Meta semanal de horas",
-        "R5_DEMAND_COVERAGE": "Cobertura insuficiente",
-        "R6_MAX_DAILY_MINUTES": "Limite diário de jornada",
-        # Compat legado para arquivos antigos já gerados.
-        "R2_INTERSHIFT_REST": "Intervalo entre jornadas (mín. 11h)",
-        "R3_WEEKLY_HOURS": "Meta semanal de horas",
-        "R4_DEMAND_COVERAGE": "Cobertura insuficiente",
+    return _records(_violation_columns(df, emp_names), fields or list(ViolationResponse.model_fields))
+
+
+def _assignments_to_response(df: pd.DataFrame, emp_names: dict) -> list[AssignmentResponse]:
+    return [AssignmentResponse(**r) for r in _assignment_records(df, emp_names)]
+
+
+def _violations_to_response(df: pd.DataFrame, emp_names: dict) -> list[ViolationResponse]:
+    return [ViolationResponse(**r) for r in _violation_records(df, emp_names)]
+
+
+DEFAULT_CONTRACT_PROFILE = {"contract_code": "UNKNOWN", "weekly_minutes": 2640}
+
+
+def _weekly_summary_columns(
+    weekly: pd.DataFrame,
+    contract_profiles: dict,
+    employee_names: dict,
+    tolerance: int,
+    week_definition: str,
+) -> dict:
+    """Campos de WeeklySummaryRow como listas, a partir dos totais semanais já agrupados."""
+    employee_ids = [str(v) for v in weekly["employee_id"]]
+    profiles = {e: target_profile(contract_profiles.get(e, DEFAULT_CONTRACT_PROFILE)) for e in set(employee_ids)}
+    week_start = weekly["week_start_ordinal"].to_numpy(dtype=np.int64)
+    actual = weekly["minutes"].to_numpy().astype(np.int64)
+    target = np.array([profiles[e][0] for e in employee_ids], dtype=np.int64)
+    delta = actual - target
+    return {
+        "window": lambda: [week_definition] * len(employee_ids),
+        "week_start": lambda: np.datetime_as_string(week_start.astype("datetime64[D]")).tolist(),
+        "week_end": lambda: np.datetime_as_string((week_start + 6).astype("datetime64[D]")).tolist(),
+        "employee_id": lambda: employee_ids,
+        "employee_name": lambda: [employee_names.get(e) for e in employee_ids],
+        "contract_code": lambda: [profiles[e][1] for e in employee_ids],
+        "actual_minutes": lambda: actual.tolist(),
+        "target_minutes": lambda: target.tolist(),
+        "delta_minutes": lambda: delta.tolist(),
+        "status": lambda: np.where(np.abs(delta) <= tolerance, "OK", "OUT").tolist(),
     }
-    rows = []
-    for _, r in df.iterrows():
-        rule_code = str(r["rule_code"]).strip()
-        rows.append(
-            ViolationResponse(
-                employee_id=str(r["employee_id"]),
-                employee_name=emp_names.get(str(r["employee_id"])),
-                rule_code=rule_code,
-                rule_label=rule_labels.get(rule_code),
-                severity=str(r["severity"]),
-                date_start=str(r["date_start"]),
-                date_end=str(r["date_end"]),
-                detail=str(r["detail"]),
-            )
-        )
-    return rows
 
 
-def _build_weekly_summary_rows(
+def _weekly_summary_records(
     assignments_df: pd.DataFrame,
     contract_profiles: dict,
     employee_names: dict,
     tolerance: int,
     week_definition: str,
-) -> list[WeeklySummaryRow]:
+    aggregates: ScheduleAggregates | None = None,
+) -> list[dict]:
     if assignments_df.empty:
         return []
-    df = assignments_df.copy()
-    df["work_date"] = pd.to_datetime(df["work_date"])
-    if week_definition == "SUN_SAT":
-        df["week_start"] = df["work_date"] - pd.to_timedelta((df["work_date"].dt.weekday + 1) % 7, unit="D")
-    else:
-        df["week_start"] = df["work_date"] - pd.to_timedelta(df["work_date"].dt.weekday, unit="D")
-    grouped = df.groupby(["employee_id", "week_start"], as_index=False)["minutes"].sum()
-    rows: list[WeeklySummaryRow] = []
-    for _, r in grouped.iterrows():
-        employee_id = str(r["employee_id"])
-        profile = contract_profiles.get(employee_id, {"contract_code": "UNKNOWN", "weekly_minutes": 2640})
-        target = int(profile.get("weekly_minutes", 2640))
-        contract_code = str(profile.get("contract_code", "UNKNOWN"))
-        actual = int(r["minutes"])
-        delta = actual - target
-        status = "OK" if abs(delta) <= tolerance else "OUT"
-        week_start = r["week_start"]
-        week_end = week_start + pd.Timedelta(days=6)
-        rows.append(
-            WeeklySummaryRow(
-                window=week_definition,
-                week_start=str(week_start.date()),
-                week_end=str(week_end.date()),
-                employee_id=employee_id,
-                employee_name=employee_names.get(employee_id),
-                contract_code=contract_code,
-                actual_minutes=actual,
-                target_minutes=target,
-                delta_minutes=delta,
-                status=status,
-            )
+    if aggregates is None:
+        aggregates = ScheduleAggregates.from_assignments(assignments_df)
+    weekly = aggregates.weekly_totals("SUN_SAT" if week_definition == "SUN_SAT" else "MON_SUN")
+    builders = _weekly_summary_columns(weekly, contract_profiles, employee_names, tolerance, week_definition)
+    return _records(builders, list(WeeklySummaryRow.model_fields))
+
+
+def _build_weekly_summary_rows(
+    assignments_df: pd.DataFrame,
+    contract_profiles: dict,
+    employee_names: dict,
+    tolerance: int,
+    week_definition: str,
+    aggregates: ScheduleAggregates | None = None,
+) -> list[WeeklySummaryRow]:
+    records = _weekly_summary_records(
+        assignments_df, contract_profiles, employee_names, tolerance, week_definition, aggregates
+    )
+    return [WeeklySummaryRow(**r) for r in records]
+
+
+def _parse_week_definitions(week_definitions: Optional[list[str]]) -> Optional[list[str]]:
+    """Cortes pedidos em `week_definitions` (sem repetição, na ordem pedida); None = formato anterior."""
+    if week_definitions is None:
+        return None
+    requested = list(dict.fromkeys(str(wd).strip().upper() for wd in week_definitions))
+    unknown = [wd for wd in requested if wd not in WEEK_START_OFFSETS]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=422,
+            detail=f"week_definitions inválidas: {', '.join(unknown) or '(vazio)'} (use {', '.join(WEEK_START_OFFSETS)})",
         )
-    return rows
+    return requested
 
 
 def _collect_external_dependencies(policy_data: dict) -> list[str]:
@@ -170,8 +336,8 @@ def _collect_external_dependencies(policy_data: dict) -> list[str]:
 
 
 def _load_policy_data() -> dict:
-    policy_data = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
-    return policy_data
+    """Dict da policy via cache de processo (somente leitura)."""
+    return POLICY_CACHE.load_data(POLICY_PATH)
 
 
 def _resolve_runtime_mode(policy_data: dict) -> str:
@@ -310,12 +476,14 @@ def generate_scale(
     repo: SqlAlchemyRepository = Depends(get_repo),
 ):
     _enforce_runtime_gate(req, operation="GENERATE", repo=repo)
-    policy_loader = PolicyLoader(schemas_path=ROOT / "schemas")
+    policy_loader = PolicyLoader(schemas_path=ROOT / "schemas", cache=POLICY_CACHE)
     orchestrator = ValidationOrchestrator(
         repo=repo,
         policy_loader=policy_loader,
         output_path=OUTPUT,
         data_dir=DATA_DIR,
+        export_jobs=EXPORT_JOBS,
+        schedule_cache=SCHEDULE_CACHE,
     )
     context = ProjectionContext(
         period_start=req.period_start,
@@ -331,6 +499,8 @@ def generate_scale(
             violations_count=result["violations_count"],
             preferences_processed=result["preferences_processed"],
             exceptions_applied=result.get("exceptions_applied", 0),
+            run_id=result.get("run_id"),
+            export_job_id=result.get("export_job_id"),
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -339,15 +509,21 @@ def generate_scale(
 @router.post("/simulate", response_model=ScaleSimulateResponse)
 def simulate_scale(
     req: ScaleGenerateRequest,
+    request: Request,
     repo: SqlAlchemyRepository = Depends(get_repo),
 ):
+    """
+    Simula sem persistir. Com `Accept: application/x-ndjson` a resposta é transmitida
+    em blocos (ver `_ndjson_chunks`) em vez de um único JSON.
+    """
     _enforce_runtime_gate(req, operation="SIMULATE", repo=repo)
-    policy_loader = PolicyLoader(schemas_path=ROOT / "schemas")
+    policy_loader = PolicyLoader(schemas_path=ROOT / "schemas", cache=POLICY_CACHE)
     orchestrator = ValidationOrchestrator(
         repo=repo,
         policy_loader=policy_loader,
         output_path=OUTPUT,
         data_dir=DATA_DIR,
+        schedule_cache=SCHEDULE_CACHE,
     )
     context = ProjectionContext(
         period_start=req.period_start,
@@ -365,15 +541,23 @@ def simulate_scale(
         assignments_df = pd.DataFrame(result.get("preview_assignments", []))
         violations_df = pd.DataFrame(result.get("preview_violations", []))
         emp_names = {e.employee_id: e.name for e in repo.load_employees().values()}
-        return ScaleSimulateResponse(
+        summary = dict(
             status=result["status"],
             assignments_count=result["assignments_count"],
             violations_count=result["violations_count"],
             preferences_processed=result["preferences_processed"],
             exceptions_applied=result.get("exceptions_applied", 0),
-            assignments=_assignments_to_response(assignments_df, emp_names),
-            violations=_violations_to_response(violations_df, emp_names),
         )
+        if _accepts_ndjson(request):
+            return StreamingResponse(
+                _ndjson_chunks(summary, assignments_df, violations_df, emp_names),
+                media_type="application/x-ndjson",
+            )
+        return _json_response({
+            **summary,
+            "assignments": _assignment_records(assignments_df, emp_names),
+            "violations": _violation_records(violations_df, emp_names),
+        })
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -383,9 +567,15 @@ def weekly_analysis(
     req: WeeklyAnalysisRequest,
     repo: SqlAlchemyRepository = Depends(get_repo),
 ):
-    policy_loader = PolicyLoader(schemas_path=ROOT / "schemas")
+    """
+    Resumo semanal (meta x realizado) por corte de semana. `summaries_mon_sun` e
+    `summaries_sun_sat` vêm sempre; com `week_definitions`, os cortes pedidos também
+    saem em `summaries`. Todos os cortes saem dos mesmos agregados.
+    """
+    week_definitions = _parse_week_definitions(req.week_definitions)
+    policy_loader = PolicyLoader(schemas_path=ROOT / "schemas", cache=POLICY_CACHE)
     policy = policy_loader.load_policy(POLICY_PATH)
-    policy_data = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+    policy_data = _load_policy_data()
     tolerance = int(policy.constraints.get("weekly_minutes_tolerance", 120))
     emp_names = {e.employee_id: e.name for e in repo.load_employees().values()}
     contract_profiles = repo.load_contract_profiles(req.sector_id)
@@ -396,6 +586,7 @@ def weekly_analysis(
             policy_loader=policy_loader,
             output_path=OUTPUT,
             data_dir=DATA_DIR,
+            schedule_cache=SCHEDULE_CACHE,
         )
         context = ProjectionContext(
             period_start=req.period_start,
@@ -409,91 +600,137 @@ def weekly_analysis(
             persist_results=False,
             include_preview=True,
         )
-        assignments_df = pd.DataFrame(result.get("preview_assignments", []))
+        # Frame e agregados do motor como estão (sem reconstruir a partir de registros).
+        assignments_df = result["preview_assignments"]
+        aggregates = result.get("aggregates")
     else:
-        assignments_df = _get_assignments_df()
-        if not assignments_df.empty:
-            work_date = pd.to_datetime(assignments_df["work_date"])
-            assignments_df = assignments_df[
-                (work_date >= pd.Timestamp(req.period_start))
-                & (work_date <= pd.Timestamp(req.period_end))
-            ]
-
-    mon_sun_rows = _build_weekly_summary_rows(
-        assignments_df,
-        contract_profiles,
-        emp_names,
-        tolerance=tolerance,
-        week_definition="MON_SUN",
-    )
-    sun_sat_rows = _build_weekly_summary_rows(
-        assignments_df,
-        contract_profiles,
-        emp_names,
-        tolerance=tolerance,
-        week_definition="SUN_SAT",
-    )
-    return WeeklyAnalysisResponse(
-        period_start=str(req.period_start),
-        period_end=str(req.period_end),
-        sector_id=req.sector_id,
-        policy_week_definition=getattr(policy.week_definition, "value", "MON_SUN"),
-        tolerance_minutes=tolerance,
-        summaries_mon_sun=mon_sun_rows,
-        summaries_sun_sat=sun_sat_rows,
-        external_dependencies_open=_collect_external_dependencies(policy_data),
+        assignments_df = _get_assignments_df(repo, req.sector_id, req.period_start, req.period_end)
+        aggregates = None
+    if aggregates is None:
+        aggregates = ScheduleAggregates.from_assignments(assignments_df)
+
+    summaries = {
+        wd: _weekly_summary_records(
+            assignments_df,
+            contract_profiles,
+            emp_names,
+            tolerance=tolerance,
+            week_definition=wd,
+            aggregates=aggregates,
+        )
+        for wd in dict.fromkeys(("MON_SUN", "SUN_SAT", *(week_definitions or ())))
+    }
+    content = {
+        "period_start": str(req.period_start),
+        "period_end": str(req.period_end),
+        "sector_id": req.sector_id,
+        "policy_week_definition": getattr(policy.week_definition, "value", "MON_SUN"),
+        "tolerance_minutes": tolerance,
+    }
+    content.update(
+        summaries_mon_sun=summaries["MON_SUN"],
+        summaries_sun_sat=summaries["SUN_SAT"],
+        summaries={wd: summaries[wd] for wd in week_definitions or ()},
     )
+    content["external_dependencies_open"] = _collect_external_dependencies(policy_data)
+    return _json_response(content)
 
 
 @router.get("/assignments", response_model=list[AssignmentResponse])
-def get_assignments(repo: SqlAlchemyRepository = Depends(get_repo)):
-    df = _get_assignments_df()
+def get_assignments(
+    sector_id: Optional[str] = Query(None),
+    period_start: Optional[date] = Query(None),
+    period_end: Optional[date] = Query(None),
+    employee_id: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=50000),
+    cursor: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description="Projeção, ex.: work_date,employee_id,status"),
+    repo: SqlAlchemyRepository = Depends(get_repo),
+):
+    """
+    Escala oficial vigente (última geração do setor; sem setor: a última geração).
+    Filtros aplicados no SQL. Com `limit`, página cheia devolve `X-Next-Cursor`
+    (repassar em `cursor`); sem `limit`, todas as linhas.
+    """
+    projection = _parse_fields(fields, AssignmentResponse)
+    run_id, after_id = _parse_cursor(cursor, repo, sector_id)
+    if run_id is None:
+        run_id = repo.latest_schedule_run_id(sector_id)
+    df = _get_assignments_df(
+        repo, sector_id, period_start, period_end, run_id=run_id,
+        employee_id=employee_id, status=status, after_id=after_id, limit=limit,
+        columns=_storage_columns(projection, SCHEDULE_ASSIGNMENT_COLUMNS, {"employee_name": "employee_id"}),
+    ) if run_id is not None else pd.DataFrame()
     emp_names = {e.employee_id: e.name for e in repo.load_employees().values()}
-    return _assignments_to_response(df, emp_names)
+    rows = _assignment_records(df, emp_names, projection)
+    return _paged_response(rows, run_id, df, limit)
 
 
 @router.get("/violations", response_model=list[ViolationResponse])
-def get_violations(repo: SqlAlchemyRepository = Depends(get_repo)):
-    df = _get_violations_df()
+def get_violations(
+    sector_id: Optional[str] = Query(None),
+    period_start: Optional[date] = Query(None),
+    period_end: Optional[date] = Query(None),
+    employee_id: Optional[str] = Query(None),
+    rule_code: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=50000),
+    cursor: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None, description="Projeção, ex.: employee_id,rule_code,date_start"),
+    repo: SqlAlchemyRepository = Depends(get_repo),
+):
+    projection = _parse_fields(fields, ViolationResponse)
+    run_id, after_id = _parse_cursor(cursor, repo, sector_id)
+    if run_id is None:
+        run_id = repo.latest_schedule_run_id(sector_id)
+    df = _get_violations_df(
+        repo, sector_id, period_start, period_end, run_id=run_id,
+        employee_id=employee_id, rule_code=rule_code, after_id=after_id, limit=limit,
+        columns=_storage_columns(
+            projection, SCHEDULE_VIOLATION_COLUMNS, {"employee_name": "employee_id", "rule_label": "rule_code"}
+        ),
+    ) if run_id is not None else pd.DataFrame()
     emp_names = {e.employee_id: e.name for e in repo.load_employees().values()}
-    return _violations_to_response(df, emp_names)
+    rows = _violation_records(df, emp_names, projection)
+    return _paged_response(rows, run_id, df, limit)
+
+
+@router.get("/export/jobs/{job_id}", response_model=ExportJobResponse)
+def get_export_job(job_id: str, sector_id: Optional[str] = Query(None)):
+    """Status do export disparado por POST /scale/generate (`export_job_id`); com `sector_id`, só jobs do setor."""
+    job = EXPORT_JOBS.get(job_id)
+    if job is None or (sector_id and job.sector_id != sector_id):
+        raise HTTPException(status_code=404, detail="Job de export não encontrado.")
+    return ExportJobResponse(**asdict(job))
+
+
+def _export_file_response(filename: str, media_type: str, download: bool = False) -> Response:
+    """
+    Último export completo servido do disco em blocos (FileResponse). O job grava em
+    .tmp + os.replace, então um export em andamento nunca é lido pela metade; o
+    status dele fica em GET /scale/export/jobs/{job_id}.
+    """
+    path = OUTPUT / filename
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Escala não gerada. Execute POST /scale/generate primeiro.")
+    return FileResponse(path, media_type=media_type, filename=filename if download else None)
 
 
 @router.get("/export/html", response_class=HTMLResponse)
 def export_html():
-    path = OUTPUT / "escala_calendario.html"
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="Escala não gerada. Execute POST /scale/generate primeiro.")
-    return HTMLResponse(content=path.read_text(encoding="utf-8"))
+    return _export_file_response("escala_calendario.html", "text/html")
 
 
 @router.get("/export/markdown", response_class=PlainTextResponse)
 def export_markdown():
-    path = OUTPUT / "escala_calendario.md"
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="Escala não gerada. Execute POST /scale/generate primeiro.")
-    return PlainTextResponse(content=path.read_text(encoding="utf-8"))
+    return _export_file_response("escala_calendario.md", "text/plain")
 
 
 @router.get("/export/html/download")
 def download_html():
-    path = OUTPUT / "escala_calendario.html"
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="Escala não gerada. Execute POST /scale/generate primeiro.")
-    return FileResponse(
-        path,
-        media_type="text/html",
-        filename="escala_calendario.html",
-    )
+    return _export_file_response("escala_calendario.html", "text/html", download=True)
 
 
 @router.get("/export/markdown/download")
 def download_markdown():
-    path = OUTPUT / "escala_calendario.md"
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="Escala não gerada. Execute POST /scale/generate primeiro.")
-    return FileResponse(
-        path,
-        media_type="text/markdown",
-        filename="escala_calendario.md",
-    )
+    return _export_file_response("escala_calendario.md", "text/markdown", download=True)
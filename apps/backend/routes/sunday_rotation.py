@@ -19,12 +19,14 @@ def list_sunday_rotation(
         return []
     return [
         {
-            "scale_index": int(row["scale_index"]),
-            "employee_id": str(row["employee_id"]),
-            "sunday_date": str(row["sunday_date"]),
-            "folga_date": str(row["folga_date"]) if pd.notna(row.get("folga_date")) else None,
+            "scale_index": int(scale_index),
+            "employee_id": str(employee_id),
+            "sunday_date": str(sunday_date),
+            "folga_date": str(folga_date) if pd.notna(folga_date) else None,
         }
-        for _, row in df.iterrows()
+        for scale_index, employee_id, sunday_date, folga_date in zip(
+            df["scale_index"], df["employee_id"], df["sunday_date"], df["folga_date"]
+        )
     ]
 
 
@@ -19,12 +19,14 @@ def list_weekday_template(
         return []
     return [
         {
-            "employee_id": str(row["employee_id"]),
-            "day_key": str(row["day_key"]),
-            "shift_code": str(row["shift_code"]),
-            "minutes": int(row["minutes"]) if pd.notna(row.get("minutes")) else 0,
+            "employee_id": str(employee_id),
+            "day_key": str(day_key),
+            "shift_code": str(shift_code),
+            "minutes": int(minutes) if pd.notna(minutes) else 0,
         }
-        for _, row in df.iterrows()
+        for employee_id, day_key, shift_code, minutes in zip(
+            df["employee_id"], df["day_key"], df["shift_code"], df["minutes"]
+        )
     ]
 
 
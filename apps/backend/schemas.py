@@ -1,6 +1,6 @@
 """Pydantic schemas para API REST."""
 from datetime import date
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel, Field
 
 
@@ -123,6 +123,19 @@ class ScaleGenerateResponse(BaseModel):
     violations_count: int
     preferences_processed: int
     exceptions_applied: int
+    run_id: Optional[int] = None  # geração gravada em schedule_runs
+    export_job_id: Optional[str] = None  # export HTML/Markdown em segundo plano (GET /scale/export/jobs/{id})
+
+
+class ExportJobResponse(BaseModel):
+    job_id: str
+    status: str  # PENDING | RUNNING | DONE | FAILED
+    created_at: str
+    sector_id: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    files: dict[str, str] = {}
 
 
 class ScaleSimulateResponse(BaseModel):
@@ -140,6 +153,8 @@ class WeeklyAnalysisRequest(BaseModel):
     period_end: date
     sector_id: str = "CAIXA"
     mode: str = "OFFICIAL"  # OFFICIAL | SIMULATION
+    # MON_SUN | SUN_SAT; quando enviado, a resposta traz um resumo por corte em `summaries`
+    week_definitions: Optional[List[str]] = None
 
 
 class WeeklySummaryRow(BaseModel):
@@ -161,8 +176,10 @@ class WeeklyAnalysisResponse(BaseModel):
     sector_id: str
     policy_week_definition: str
     tolerance_minutes: int
+    # Os dois cortes fixos vêm sempre preenchidos (contrato original da resposta).
     summaries_mon_sun: List[WeeklySummaryRow]
     summaries_sun_sat: List[WeeklySummaryRow]
+    summaries: Dict[str, List[WeeklySummaryRow]] = {}  # só com `week_definitions`: corte -> linhas, na ordem pedida
     external_dependencies_open: List[str]
 
 
@@ -214,6 +231,19 @@ class ExceptionUpdate(BaseModel):
     note: Optional[str] = None
 
 
+class BulkRowResult(BaseModel):
+    index: int  # posição no array JSON ou linha física (0-based, contando linhas vazias) do NDJSON
+    status: str  # CREATED | DUPLICATE | INVALID
+    error: Optional[str] = None
+
+
+class BulkImportResponse(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    results: List[BulkRowResult]
+
+
 # --- Demand Profile ---
 class DemandSlotCreate(BaseModel):
     sector_id: str = "CAIXA"
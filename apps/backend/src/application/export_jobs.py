@@ -0,0 +1,115 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+DONE = "DONE"
+FAILED = "FAILED"
+ACTIVE_STATUSES = (PENDING, RUNNING)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class ExportJob:
+    job_id: str
+    created_at: str
+    sector_id: Optional[str] = None
+    status: str = PENDING
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    files: Dict[str, str] = field(default_factory=dict)
+
+
+class ExportJobQueue:
+    """
+    Exports do calendário (HTML/Markdown) fora do caminho da requisição.
+
+    Um worker por padrão: todos os jobs gravam os mesmos arquivos em OUTPUT, então
+    rodam na ordem de submissão e o último a terminar é o da última geração. Erros
+    ficam no status do job (`FAILED` + `error`); cada job leva o setor da geração.
+    Estado por processo; guarda os últimos `max_jobs` jobs.
+    """
+
+    def __init__(self, max_workers: int = 1, max_jobs: int = 50):
+        self.max_workers = max_workers
+        self.max_jobs = max_jobs
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: "OrderedDict[str, ExportJob]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, render: Callable[[], Dict[str, Path]], sector_id: Optional[str] = None) -> str:
+        """Enfileira `render` (retorna {formato: caminho}) e devolve o id do job."""
+        job = ExportJob(job_id=uuid.uuid4().hex, created_at=_now(), sector_id=sector_id)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="export")
+            self._jobs[job.job_id] = job
+            self._futures[job.job_id] = self._executor.submit(self._run, job.job_id, render)
+            self._prune()
+        return job.job_id
+
+    def _prune(self) -> None:
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if self._jobs[job_id].status not in ACTIVE_STATUSES:
+                del self._jobs[job_id]
+                self._futures.pop(job_id, None)
+
+    def _update(self, job_id: str, **changes) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs[job_id] = replace(job, **changes)
+
+    def _run(self, job_id: str, render: Callable[[], Dict[str, Path]]) -> None:
+        self._update(job_id, status=RUNNING, started_at=_now())
+        try:
+            paths = render()
+        except Exception as exc:
+            self._update(job_id, status=FAILED, finished_at=_now(), error=f"{type(exc).__name__}: {exc}")
+        else:
+            self._update(job_id, status=DONE, finished_at=_now(), files={k: str(p) for k, p in paths.items()})
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job is not None else None
+
+    def latest(self, sector_id: Optional[str] = None) -> Optional[ExportJob]:
+        """Job mais recente (do setor, com `sector_id`)."""
+        with self._lock:
+            for job in reversed(self._jobs.values()):
+                if sector_id is None or job.sector_id == sector_id:
+                    return replace(job)
+            return None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[ExportJob]:
+        """Bloqueia até o job terminar (scripts/testes); None se o id não existe."""
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.result(timeout=timeout)
+        return self.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Encerra o worker (shutdown do app); um `submit` posterior cria outro."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Instância compartilhada pelas rotas (um processo = uma fila).
+EXPORT_JOBS = ExportJobQueue()
@@ -0,0 +1,140 @@
+import copy
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+# Versão do pipeline de geração (motores, overlays, validações, agregados). Entra na
+# chave e no nome do arquivo em disco: suba a cada mudança que altere o resultado
+# para que pickles de uma versão anterior deixem de ser servidos.
+PIPELINE_VERSION = 1
+
+
+def _feed(digest, value: Any) -> None:
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), [str(t) for t in value.dtypes], len(value))).encode())
+        if len(value):
+            digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b"\x00")
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Hash de conteúdo das entradas do pipeline (frames por `hash_pandas_object`, o
+    resto por `repr`). Mesmas entradas -> mesma chave; qualquer linha alterada muda a chave.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        _feed(digest, part)
+    return digest.hexdigest()
+
+
+class ScheduleCache:
+    """
+    LRU de resultados do pipeline de geração, chaveado por `fingerprint` das entradas
+    + `version` (PIPELINE_VERSION).
+
+    `put` guarda e `get` devolve cópias profundas: quem recebe o resultado (ex.: o job
+    de export em outra thread) pode alterá-lo sem afetar o cache nem outras requisições.
+    Com `directory`, cada resultado também vai para `<directory>/v<versão>-<chave>.pkl`
+    e sobrevive ao restart (o disco guarda as `max_entries` mais recentes; arquivos de
+    outras versões são apagados na próxima gravação). `hits`/`misses` contam consultas
+    atendidas vs recalculadas.
+    """
+
+    def __init__(self, max_entries: int = 32, directory: Optional[Path] = None, version: int = PIPELINE_VERSION):
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory else None
+        self.version = version
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: str) -> str:
+        return f"v{self.version}-{key}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{self._key(key)}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(self._key(key))
+            if value is not None:
+                self._entries.move_to_end(self._key(key))
+                self.hits += 1
+        if value is not None:
+            return copy.deepcopy(value)
+        value = self._load(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(self._key(key), value)
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(self._key(key), value)
+        if self.directory is not None:
+            self._store(key, value)
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Any]:
+        if self.directory is None:
+            return None
+        try:
+            with self._path(key).open("rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Arquivo ausente, truncado ou de uma versão antiga das classes: recalcula.
+            return None
+
+    def _store(self, key: str, value: Any) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._path(key).with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key))
+        for stale in self.directory.glob("*.pkl"):
+            if not stale.name.startswith(f"v{self.version}-"):
+                stale.unlink(missing_ok=True)
+        files = []
+        for path in self.directory.glob(f"v{self.version}-*.pkl"):
+            try:
+                files.append((path.stat().st_mtime_ns, path))
+            except FileNotFoundError:
+                continue
+        files.sort()
+        for _, stale in files[: max(0, len(files) - self.max_entries)]:
+            stale.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+# Instância compartilhada pelas rotas (um processo = um cache). Persistência em disco
+# opcional: ESCALAFLOW_SCHEDULE_CACHE_DIR=<pasta>.
+SCHEDULE_CACHE = ScheduleCache(directory=os.getenv("ESCALAFLOW_SCHEDULE_CACHE_DIR") or None)
@@ -1,11 +1,14 @@
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import json
 import pandas as pd
 from datetime import date
 
-from apps.backend.src.domain.models import ProjectionContext, Violation, ShiftDayScope, Shift
+from apps.backend.src.application.export_jobs import ExportJobQueue
+from apps.backend.src.application.schedule_cache import ScheduleCache, fingerprint
+from apps.backend.src.domain.models import Policy, ProjectionContext, Violation, ShiftDayScope, Shift
 from apps.backend.src.domain.policy_loader import PolicyLoader
+from apps.backend.src.domain.aggregates import ScheduleAggregates
 from apps.backend.src.domain.engines import CycleGenerator, PolicyEngine
 from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
 from apps.backend.src.infrastructure.parsers.legacy.csv_import import LegacyCSVImporter
@@ -17,9 +20,17 @@ class ValidationOrchestrator:
         repo: SqlAlchemyRepository,
         policy_loader: PolicyLoader,
         output_path: Path,
-        data_dir: Path = None
+        data_dir: Path = None,
+        export_jobs: Optional[ExportJobQueue] = None,
+        schedule_cache: Optional[ScheduleCache] = None,
     ):
         self.repo = repo
+        # Com cache: entradas iguais (policy, mosaico, rodízio, pedidos, exceções,
+        # contratos, demanda, período) reaproveitam escala + violações já calculadas.
+        self.schedule_cache = schedule_cache
+        # Com fila: export HTML/Markdown roda em segundo plano (result["export_job_id"]);
+        # sem fila: renderiza na hora e erros de export sobem para quem chamou.
+        self.export_jobs = export_jobs
         self.policy_loader = policy_loader
         self.output_path = output_path
         self.data_dir = data_dir or (Path(__file__).resolve().parents[4] / "data" / "fixtures")
@@ -52,6 +63,120 @@ class ValidationOrchestrator:
                 if not weekday_template_raw.empty:
                     weekday_template_raw = weekday_template_raw.drop_duplicates(["employee_id", "day_name"])
         
+        preferences = self.repo.load_preferences()
+        exceptions = self.repo.load_exceptions_df(
+            sector_id=context.sector_id,
+            period_start=context.period_start,
+            period_end=context.period_end,
+        )
+        contract_targets = self.repo.load_contract_profiles(context.sector_id)
+        demand_slots = self.repo.load_demand_profile_df(
+            context.sector_id, context.period_start, context.period_end
+        )
+
+        # 3-6. Escala + violações, reaproveitadas do cache quando as entradas não mudaram
+        cache_key = None
+        computed = None
+        if self.schedule_cache is not None:
+            cache_key = fingerprint(
+                policy,
+                context.sector_id,
+                context.period_start,
+                context.period_end,
+                context.anchor_scale_id,
+                sunday_rotation,
+                weekday_template_raw,
+                preferences,
+                exceptions,
+                contract_targets,
+                demand_slots,
+            )
+            computed = self.schedule_cache.get(cache_key)
+        if computed is None:
+            computed = self._build_schedule(
+                context,
+                policy,
+                sunday_rotation,
+                weekday_template_raw,
+                preferences,
+                exceptions,
+                contract_targets,
+                demand_slots,
+            )
+            if cache_key is not None:
+                self.schedule_cache.put(cache_key, computed)
+        final_assignments, processed_requests, exceptions_applied, aggregates, violations = computed
+
+        # 7. Persist Results (apenas geração oficial) — escala e violações no banco
+        run_id = None
+        if persist_results:
+            run_id = self._persist_results(final_assignments, processed_requests, violations, context)
+
+        # 8. Export HTML/Markdown calendário + resumo semanal (PRD)
+        export_paths = {}
+        export_job_id = None
+        if persist_results:
+            # Tudo que o export lê é resolvido aqui: o job não usa a sessão da requisição.
+            emp_names = {e.employee_id: e.name for e in self.repo.load_employees().values()}
+            week_def = getattr(policy.week_definition, "value", "MON_SUN") if hasattr(policy, "week_definition") else "MON_SUN"
+
+            def render() -> Dict[str, Path]:
+                return export_calendar_files(
+                    self.output_path,
+                    final_assignments,
+                    violations,
+                    contract_targets,
+                    context.period_start,
+                    context.period_end,
+                    employee_names=emp_names,
+                    week_definition=week_def,
+                    aggregates=aggregates,
+                )
+
+            if self.export_jobs is not None:
+                export_job_id = self.export_jobs.submit(render, sector_id=context.sector_id)
+            else:
+                export_paths = render()
+
+        result = {
+            "status": "SUCCESS",
+            "violations_count": len(violations),
+            "assignments_count": len(final_assignments),
+            "preferences_processed": len(processed_requests),
+            "exceptions_applied": exceptions_applied,
+            "export_paths": export_paths,
+            "export_job_id": export_job_id,
+            "run_id": run_id,
+        }
+        if include_preview:
+            result["aggregates"] = aggregates
+            # Frame do motor como está: a rota serializa (JSON ou NDJSON em blocos) sem cópia em records.
+            result["preview_assignments"] = final_assignments
+            result["preview_violations"] = [
+                {
+                    "employee_id": v.employee_id,
+                    "rule_code": v.rule_code,
+                    "severity": v.severity.value,
+                    "date_start": v.date_start,
+                    "date_end": v.date_end,
+                    "detail": v.detail,
+                }
+                for v in violations
+            ]
+        return result
+
+    def _build_schedule(
+        self,
+        context: ProjectionContext,
+        policy: Policy,
+        sunday_rotation: pd.DataFrame,
+        weekday_template_raw: pd.DataFrame,
+        preferences: list,
+        exceptions: pd.DataFrame,
+        contract_targets: Dict[str, Any],
+        demand_slots: pd.DataFrame,
+    ) -> tuple:
+        """Passos 3-6 do pipeline sobre entradas já carregadas (sem acesso ao repositório)."""
         # Build Shift Objects from Policy (or DB if available)
         shifts = policy.shifts
         sunday_shift = policy.shifts.get("DOM_08_12_30")
@@ -95,134 +220,56 @@ class ValidationOrchestrator:
         )
         final_assignments = self.generator.project_cycle_to_period(scale_cycle, context_proj)
         
-        # 5. Preferences: aplicar pedidos aprovados
-        processed_requests = []
-        preferences = self.repo.load_preferences()
-        approved = [p for p in preferences if p.decision.value == "APPROVED"]
-        for pref in approved:
-            mask = (final_assignments["employee_id"] == pref.employee_id) & \
-                   (pd.to_datetime(final_assignments["work_date"]) == pd.Timestamp(pref.request_date))
-            if not mask.any():
-                continue
-            if pref.request_type.value == "FOLGA_ON_DATE":
-                final_assignments.loc[mask, ["status", "shift_code", "minutes", "source_rule"]] = ["FOLGA", "", 0, "PREFERENCE_APPLIED"]
-                processed_requests.append({"request_id": pref.request_id, "applied": True})
-            elif pref.request_type.value == "AVOID_SUNDAY_DATE":
-                final_assignments.loc[mask, ["status", "shift_code", "minutes", "source_rule"]] = ["FOLGA", "", 0, "PREFERENCE_APPLIED"]
-                processed_requests.append({"request_id": pref.request_id, "applied": True})
-            elif pref.request_type.value == "SHIFT_CHANGE_ON_DATE" and pref.target_shift_code:
-                target_shift = policy.shifts.get(pref.target_shift_code)
-                new_mins = int(target_shift.minutes) if target_shift else 480
-                final_assignments.loc[mask, ["shift_code", "minutes", "source_rule"]] = [pref.target_shift_code, new_mins, "PREFERENCE_APPLIED"]
-                processed_requests.append({"request_id": pref.request_id, "applied": True})
+        # 5. Preferences: aplicar pedidos aprovados (um patch chaveado por employee_id/work_date)
+        final_assignments, processed_requests = self.generator.apply_preferences(
+            final_assignments, preferences, policy.shifts
+        )
 
         # 5b. Exceptions: aplicar férias, atestado, trocas, bloqueios (convertem WORK -> ABSENCE)
-        exceptions = self.repo.load_exceptions(
-            sector_id=context.sector_id,
-            period_start=context.period_start,
-            period_end=context.period_end,
-        )
-        exceptions_applied = 0
-        for exc in exceptions:
-            mask = (final_assignments["employee_id"] == exc.employee_id) & \
-                   (pd.to_datetime(final_assignments["work_date"]) == pd.Timestamp(exc.exception_date))
-            if mask.any():
-                # Converte WORK em ABSENCE (ou FOLGA se já era folga — mantém)
-                work_mask = mask & (final_assignments["status"] == "WORK")
-                if work_mask.any():
-                    final_assignments.loc[work_mask, ["status", "shift_code", "minutes", "source_rule"]] = [
-                        "ABSENCE", "", 0, f"EXCEPTION_{exc.exception_type.value}"
-                    ]
-                    exceptions_applied += 1
+        final_assignments, exceptions_applied = self.generator.apply_exceptions(final_assignments, exceptions)
 
         # 6. Violations — contract_targets do DB (employee -> meta semanal)
-        contract_targets = self.repo.load_contract_profiles(context.sector_id)
+        # Totais diários/semanais agrupados uma única vez para R4, R6, export e resumo semanal
+        aggregates = ScheduleAggregates.from_assignments(final_assignments)
         violations_cons = self.policy_engine.validate_consecutive_days(final_assignments)
-        violations_hours = self.policy_engine.validate_weekly_hours(final_assignments, contract_targets)
+        violations_hours = self.policy_engine.validate_weekly_hours(
+            final_assignments, contract_targets, aggregates=aggregates
+        )
         violations_intershift = self.policy_engine.validate_intershift_rest(
-            final_assignments, policy.shifts, policy.constraints
+            final_assignments, policy.shift_catalog, policy.constraints
         )
         violations_daily = self.policy_engine.validate_daily_minutes(
-            final_assignments, policy.constraints
+            final_assignments, policy.constraints, aggregates=aggregates
         )
         violations_sunday = self.policy_engine.validate_sunday_rotation(
             final_assignments, contract_targets
         )
-        demand_slots = self.repo.load_demand_profile(
-            context.sector_id, context.period_start, context.period_end
-        )
         violations_demand = self.policy_engine.validate_demand_coverage(
-            final_assignments, demand_slots, policy.shifts
+            final_assignments, demand_slots, policy.shift_catalog
         )
 
         violations = violations_cons + violations_hours + violations_intershift + violations_daily + violations_demand + violations_sunday
-        
-        # 7. Persist Results (apenas geração oficial)
-        if persist_results:
-            self._export_results_df(final_assignments, processed_requests, violations, context)
-
-        # 8. Export HTML/Markdown calendário + resumo semanal (PRD)
-        emp_names = {e.employee_id: e.name for e in self.repo.load_employees().values()}
-        week_def = getattr(policy.week_definition, "value", "MON_SUN") if hasattr(policy, "week_definition") else "MON_SUN"
-        export_paths = {}
-        if persist_results:
-            try:
-                export_paths = export_calendar_files(
-                    self.output_path,
-                    final_assignments,
-                    violations,
-                    contract_targets,
-                    context.period_start,
-                    context.period_end,
-                    employee_names=emp_names,
-                    week_definition=week_def,
-                )
-            except Exception:
-                pass
+        return final_assignments, processed_requests, exceptions_applied, aggregates, violations
 
-        result = {
-            "status": "SUCCESS",
-            "violations_count": len(violations),
-            "assignments_count": len(final_assignments),
-            "preferences_processed": len(processed_requests),
-            "exceptions_applied": exceptions_applied,
-            "export_paths": export_paths,
-        }
-        if include_preview:
-            result["preview_assignments"] = final_assignments.to_dict("records")
-            result["preview_violations"] = [
-                {
-                    "employee_id": v.employee_id,
-                    "rule_code": v.rule_code,
-                    "severity": v.severity.value,
-                    "date_start": v.date_start,
-                    "date_end": v.date_end,
-                    "detail": v.detail,
-                }
-                for v in violations
-            ]
-        return result
-
-    def _export_results_df(self, assignments_df, requests, violations, context):
+    def _persist_results(self, assignments_df, requests, violations, context) -> int:
         self.output_path.mkdir(parents=True, exist_ok=True)
-        
-        # Assignments
-        assignments_df.to_csv(self.output_path / "final_assignments.csv", index=False)
-        
+
         # Preferences (Empty for now)
         pd.DataFrame(requests).to_csv(self.output_path / "preference_decisions.csv", index=False)
-        
-        # Violations
-        v_data = [{
+
+        # Assignments + Violations: uma geração em schedule_runs (a mais recente do setor é a oficial)
+        v_data = pd.DataFrame([{
             "employee_id": v.employee_id, 
             "rule_code": v.rule_code, 
             "severity": v.severity.value, 
             "date_start": v.date_start, 
             "date_end": v.date_end,
             "detail": v.detail
-        } for v in violations]
-        pd.DataFrame(v_data).to_csv(self.output_path / "violations.csv", index=False)
-
-
-
-
+        } for v in violations])
+        return self.repo.save_schedule_run(
+            context.sector_id,
+            context.period_start,
+            context.period_end,
+            assignments_df,
+            v_data,
+        )
@@ -0,0 +1,129 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Dias a recuar a partir da segunda-feira para chegar ao início da semana.
+WEEK_START_OFFSETS: Dict[str, int] = {"MON_SUN": 0, "SUN_SAT": 1}
+
+
+def date_ordinals(values: pd.Series) -> np.ndarray:
+    """Datas (date/str/Timestamp) -> dias desde 1970-01-01 como int64."""
+    return pd.to_datetime(values).to_numpy(dtype="datetime64[D]").astype(np.int64)
+
+
+def ordinals_to_dates(ordinals: np.ndarray) -> np.ndarray:
+    """Dias desde 1970-01-01 -> array de `datetime.date`."""
+    return np.asarray(ordinals, dtype=np.int64).astype("datetime64[D]").astype(object)
+
+
+def week_start_ordinals(day_ordinals: np.ndarray, week_definition: str) -> np.ndarray:
+    """Ordinal do primeiro dia da semana (MON_SUN ou SUN_SAT) de cada dia."""
+    weekday = (day_ordinals + 3) % 7  # 1970-01-01 foi quinta-feira; segunda = 0
+    return day_ordinals - (weekday + WEEK_START_OFFSETS[week_definition]) % 7
+
+
+def target_profile(profile: Any) -> tuple:
+    """Meta semanal e contrato a partir de perfil (dict) ou minutos (int)."""
+    if isinstance(profile, dict):
+        return int(profile.get("weekly_minutes", 2640)), str(profile.get("contract_code", "UNKNOWN"))
+    return int(profile), "UNKNOWN"
+
+
+@dataclass(frozen=True)
+class ScheduleAggregates:
+    """
+    Totais de minutos da escala calculados uma vez por execução.
+
+    `daily`: employee_id, work_date, day_ordinal, minutes (um registro por colaborador/dia).
+    `weekly[<MON_SUN|SUN_SAT>]`: employee_id, week_start, week_start_ordinal, minutes.
+    Regras R4/R6, resumo semanal da API e export leem daqui em vez de reagrupar.
+    """
+    daily: pd.DataFrame
+    weekly: Dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    @classmethod
+    def from_assignments(cls, day_assignments: pd.DataFrame) -> "ScheduleAggregates":
+        if day_assignments.empty:
+            daily = pd.DataFrame(
+                {
+                    "employee_id": pd.Series(dtype=object),
+                    "work_date": pd.Series(dtype=object),
+                    "day_ordinal": pd.Series(dtype=np.int64),
+                    "minutes": pd.Series(dtype=np.int64),
+                }
+            )
+            return cls(daily=daily, weekly=cls._weekly_from_daily(daily))
+
+        codes, employee_ids = pd.factorize(day_assignments["employee_id"], sort=True)
+        grouped = (
+            pd.DataFrame(
+                {
+                    "code": codes,
+                    "day_ordinal": date_ordinals(day_assignments["work_date"]),
+                    "minutes": day_assignments["minutes"].to_numpy(),
+                }
+            )
+            .groupby(["code", "day_ordinal"], sort=True, as_index=False)["minutes"]
+            .sum()
+        )
+        daily = pd.DataFrame(
+            {
+                "employee_id": np.asarray(employee_ids, dtype=object)[grouped["code"].to_numpy()],
+                "work_date": ordinals_to_dates(grouped["day_ordinal"].to_numpy()),
+                "day_ordinal": grouped["day_ordinal"].to_numpy(),
+                "minutes": grouped["minutes"].to_numpy(),
+            }
+        )
+        return cls(daily=daily, weekly=cls._weekly_from_daily(daily))
+
+    @staticmethod
+    def _weekly_from_daily(daily: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Totais semanais de todos os cortes (WEEK_START_OFFSETS) sobre ordinais inteiros.
+
+        `daily` vem ordenado por colaborador/dia, então cada (colaborador, semana) é um
+        trecho contíguo: uma chave int64 por linha e `np.add.reduceat` nas fronteiras,
+        sem groupby (nem reordenação, salvo se a ordem não vier garantida).
+        """
+        codes, employee_ids = pd.factorize(daily["employee_id"], sort=True)
+        ids = np.asarray(employee_ids, dtype=object)
+        day_ordinals = daily["day_ordinal"].to_numpy(dtype=np.int64)
+        minutes = daily["minutes"].to_numpy()
+        if len(daily):
+            base = int(day_ordinals.min()) - 6  # início da semana mais antiga possível
+            span = int(day_ordinals.max()) - base + 1
+        weekly = {}
+        for wd in WEEK_START_OFFSETS:
+            week_start = week_start_ordinals(day_ordinals, wd)
+            if len(daily):
+                key = codes.astype(np.int64) * span + (week_start - base)
+                values = minutes
+                if (key[1:] < key[:-1]).any():
+                    order = np.argsort(key, kind="stable")
+                    key, values = key[order], minutes[order]
+                starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+                group_codes, group_weeks = np.divmod(key[starts], span)
+                group_weeks = group_weeks + base
+                totals = np.add.reduceat(values, starts)
+            else:
+                group_codes = group_weeks = np.array([], dtype=np.int64)
+                totals = minutes[:0]
+            weekly[wd] = pd.DataFrame(
+                {
+                    "employee_id": pd.Series(ids[group_codes], dtype=daily["employee_id"].dtype),
+                    "week_start": ordinals_to_dates(group_weeks),
+                    "week_start_ordinal": group_weeks,
+                    "minutes": totals,
+                }
+            )
+        return weekly
+
+    def weekly_totals(self, week_definition: str = "MON_SUN") -> pd.DataFrame:
+        if week_definition not in self.weekly:
+            raise ValueError(f"week_definition inválida: {week_definition}")
+        return self.weekly[week_definition]
@@ -1,8 +1,84 @@
 import pandas as pd
+import numpy as np
 from datetime import date, timedelta, datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, NamedTuple, Tuple, Union
 from dataclasses import dataclass
-from apps.backend.src.domain.models import Shift, ProjectionContext, Violation, ViolationSeverity, DemandSlot
+from apps.backend.src.domain.models import (
+    Shift, ProjectionContext, Violation, ViolationSeverity, DemandSlot, PreferenceRequest, ScheduleException,
+)
+from apps.backend.src.domain.aggregates import ScheduleAggregates, date_ordinals, target_profile
+from apps.backend.src.domain.shift_catalog import CompiledShiftCatalog, MINUTES_PER_DAY, compile_shifts, hhmm_to_minutes
+
+
+class StreakOverruns(NamedTuple):
+    """Posições (no array de entrada) das linhas que estouram o limite de sequência."""
+    row: np.ndarray     # linha que excedeu o limite
+    start: np.ndarray   # primeira linha da sequência corrente
+    length: np.ndarray  # tamanho da sequência até a linha
+
+
+def find_streak_overruns(
+    group_codes: np.ndarray,
+    ordinals: np.ndarray,
+    is_work: np.ndarray,
+    max_allowed,
+) -> StreakOverruns:
+    """
+    Kernel run-length para regras "no máximo N seguidos" (R1, R3, ...).
+
+    Ordena por (grupo, ordinal de data), identifica as sequências de linhas com
+    is_work=True dentro de cada grupo e devolve toda linha cuja sequência já passou
+    de `max_allowed` (escalar ou array por linha). Uma linha não-trabalhada ou a
+    troca de grupo encerra a sequência. Tudo vetorizado; as posições retornadas
+    referem-se aos arrays de entrada, em ordem de (grupo, data).
+    """
+    n = len(group_codes)
+    if n == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return StreakOverruns(empty, empty, empty)
+
+    order = np.lexsort((ordinals, group_codes))
+    codes = np.asarray(group_codes)[order]
+    work = np.asarray(is_work, dtype=bool)[order]
+
+    new_group = np.ones(n, dtype=bool)
+    new_group[1:] = codes[1:] != codes[:-1]
+    prev_work = np.zeros(n, dtype=bool)
+    prev_work[1:] = work[:-1]
+    run_start = work & (new_group | ~prev_work)
+
+    idx = np.arange(n, dtype=np.int64)
+    start_idx = np.maximum.accumulate(np.where(run_start, idx, 0))
+    length = idx - start_idx + 1
+
+    limit = np.asarray(max_allowed)
+    if limit.ndim:
+        limit = limit[order]
+    over = work & (length > limit)
+    return StreakOverruns(order[over], order[start_idx[over]], length[over])
+
+
+def exceptions_frame(exceptions: Union[List[ScheduleException], pd.DataFrame]) -> pd.DataFrame:
+    """Exceções como colunas (employee_id, exception_date, exception_type): frame do loader colunar ou lista."""
+    if isinstance(exceptions, pd.DataFrame):
+        return exceptions
+    return pd.DataFrame({
+        "employee_id": pd.Series([e.employee_id for e in exceptions], dtype=object),
+        "exception_date": pd.Series([e.exception_date for e in exceptions], dtype=object),
+        "exception_type": [e.exception_type.value for e in exceptions],
+    })
+
+
+def demand_frame(demand_slots: Union[List[DemandSlot], pd.DataFrame]) -> pd.DataFrame:
+    """Slots de demanda como colunas (work_date, slot_start, min_required): frame do loader colunar ou lista."""
+    if isinstance(demand_slots, pd.DataFrame):
+        return demand_slots
+    return pd.DataFrame({
+        "work_date": pd.Series([slot.work_date for slot in demand_slots], dtype=object),
+        "slot_start": [slot.slot_start for slot in demand_slots],
+        "min_required": [slot.min_required for slot in demand_slots],
+    })
+
 
 @dataclass
 class CycleGenerator:
@@ -58,75 +134,117 @@ class CycleGenerator:
                           sunday_minutes: int = 300) -> pd.DataFrame:
         """
         Combines Weekday Template + Sunday Rotation to create the Full Cycle Definition.
+
+        O ciclo base é montado direto como arrays chaveados por (scale_id, employee_id,
+        cycle_day); domingos do rodízio e folgas compensatórias entram numa única
+        atualização por chave, sem máscaras sobre o frame inteiro.
         """
         if sunday_rotation_df.empty:
             return pd.DataFrame()
 
-        scale_count = int(sunday_rotation_df['scale_index'].max()) if 'scale_index' in sunday_rotation_df.columns else 1
-        
-        template_map = {}
-        for _, row in weekday_template.iterrows():
-            template_map[(row['employee_id'], row['day_key'])] = (row['shift_code'], row['minutes'])
-
+        has_scale = 'scale_index' in sunday_rotation_df.columns
+        scale_count = int(sunday_rotation_df['scale_index'].max()) if has_scale else 1
         employees = weekday_template['employee_id'].unique()
-        cycle_week_order = ["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"]
-        
-        rows = []
-        
-        for scale_id in range(1, scale_count + 1):
-            for emp_id in employees:
-                for day_idx, day_key in enumerate(cycle_week_order):
-                    cycle_day = (scale_id - 1) * 7 + day_idx + 1
-                    
-                    if day_key == "SUN":
-                        status = "FOLGA"
-                        shift = ""
-                        mins = 0
-                    else:
-                        res = template_map.get((emp_id, day_key))
-                        if res:
-                            status = "WORK"
-                            shift, mins = res
-                        else:
-                            status = "FOLGA"
-                            shift, mins = "", 0
-                    
-                    rows.append({
-                        "scale_id": scale_id,
-                        "cycle_day": cycle_day,
-                        "employee_id": emp_id,
-                        "day_key": day_key,
-                        "status": status,
-                        "shift_code": shift,
-                        "minutes": mins,
-                        "source": "TEMPLATE_BASE"
-                    })
-
-        df = pd.DataFrame(rows)
-        
-        for _, rot in sunday_rotation_df.iterrows():
-            if 'scale_index' not in rot: continue
-            
-            scale = int(rot['scale_index'])
-            emp = rot['employee_id']
-            sunday_cycle_day = (scale - 1) * 7 + 1 
-            
-            mask_sun = (df['scale_id'] == scale) & (df['employee_id'] == emp) & (df['cycle_day'] == sunday_cycle_day)
-            df.loc[mask_sun, ['status', 'shift_code', 'minutes', 'source']] = \
-                ['WORK', sunday_shift_code, sunday_minutes, 'ROTATION_SUNDAY']
-            
-            if 'folga_date' in rot and pd.notna(rot['folga_date']):
-                f_date = pd.to_datetime(rot['folga_date'])
-                s_date = pd.to_datetime(rot['sunday_date'])
-                delta = (f_date - s_date).days
-                
-                if 0 <= delta <= 6:
-                    comp_cycle_day = sunday_cycle_day + delta
-                    mask_folga = (df['scale_id'] == scale) & (df['employee_id'] == emp) & (df['cycle_day'] == comp_cycle_day)
-                    df.loc[mask_folga, ['status', 'shift_code', 'minutes', 'source']] = \
-                        ['FOLGA', '', 0, 'ROTATION_COMPENSATION']
-
-        return df
+        if len(employees) == 0 or scale_count < 1:
+            return pd.DataFrame()
+
+        cycle_week_order = np.array(["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"], dtype=object)
+        n_emp = len(employees)
+        week_len = n_emp * 7
+
+        # Semana base (colaborador x dia) resolvida uma vez contra o mosaico; a última
+        # linha de um par (employee_id, day_key) prevalece, como no dicionário original.
+        template = weekday_template.drop_duplicates(['employee_id', 'day_key'], keep='last')
+        template_index = pd.MultiIndex.from_arrays([template['employee_id'], template['day_key']])
+        week_emp = np.repeat(employees, 7)
+        week_day_idx = np.tile(np.arange(7), n_emp)
+        lookup = template_index.get_indexer(pd.MultiIndex.from_arrays([week_emp, cycle_week_order[week_day_idx]]))
+        matched = (lookup >= 0) & (week_day_idx != 0)
+        safe_lookup = np.where(matched, lookup, 0)
+        week_shift = np.where(matched, template['shift_code'].to_numpy(dtype=object)[safe_lookup], "")
+        week_minutes = np.where(matched, template['minutes'].to_numpy()[safe_lookup], 0)
+        week_status = np.where(matched, "WORK", "FOLGA").astype(object)
+
+        scale_ids = np.repeat(np.arange(1, scale_count + 1, dtype=np.int64), week_len)
+        day_idx = np.tile(week_day_idx, scale_count)
+        cycle_days = (scale_ids - 1) * 7 + day_idx + 1
+        emp_ids = np.tile(week_emp, scale_count)
+        status = np.tile(week_status, scale_count)
+        shift = np.tile(week_shift, scale_count)
+        minutes = np.tile(week_minutes, scale_count)
+        source = np.full(len(scale_ids), "TEMPLATE_BASE", dtype=object)
+
+        if has_scale:
+            overrides = self._rotation_overrides(sunday_rotation_df, sunday_shift_code, sunday_minutes)
+            cycle_index = pd.MultiIndex.from_arrays([scale_ids, emp_ids, cycle_days])
+            pos = cycle_index.get_indexer(
+                pd.MultiIndex.from_arrays([overrides['scale_id'], overrides['employee_id'], overrides['cycle_day']])
+            )
+            hit = pos >= 0
+            pos = pos[hit]
+            status[pos] = overrides['status'].to_numpy(dtype=object)[hit]
+            shift[pos] = overrides['shift_code'].to_numpy(dtype=object)[hit]
+            minutes[pos] = overrides['minutes'].to_numpy()[hit]
+            source[pos] = overrides['source'].to_numpy(dtype=object)[hit]
+
+        return pd.DataFrame({
+            "scale_id": scale_ids,
+            "cycle_day": cycle_days,
+            "employee_id": emp_ids,
+            "day_key": cycle_week_order[day_idx],
+            "status": status,
+            "shift_code": shift,
+            "minutes": minutes,
+            "source": source,
+        })
+
+    def _rotation_overrides(self,
+                            sunday_rotation_df: pd.DataFrame,
+                            sunday_shift_code: str,
+                            sunday_minutes: int) -> pd.DataFrame:
+        """
+        Sobrescritas do rodízio chaveadas por (scale_id, employee_id, cycle_day):
+        domingo trabalhado + folga compensatória (0..6 dias após o domingo).
+        Em chaves repetidas vale a última escrita, na ordem das linhas do rodízio.
+        """
+        rot = sunday_rotation_df.reset_index(drop=True)
+        scale = rot['scale_index'].astype(np.int64).to_numpy()
+        sunday_cycle_day = (scale - 1) * 7 + 1
+        seq = np.arange(len(rot), dtype=np.int64) * 2
+
+        parts = [pd.DataFrame({
+            "seq": seq,
+            "scale_id": scale,
+            "employee_id": rot['employee_id'].to_numpy(),
+            "cycle_day": sunday_cycle_day,
+            "status": "WORK",
+            "shift_code": sunday_shift_code,
+            "minutes": sunday_minutes,
+            "source": "ROTATION_SUNDAY",
+        })]
+
+        if 'folga_date' in rot.columns:
+            # Domingo ausente (NaT) não tem folga compensatória, como no laço original.
+            has_folga = (rot['folga_date'].notna() & rot['sunday_date'].notna()).to_numpy()
+            if has_folga.any():
+                delta = np.full(len(rot), -1, dtype=np.int64)
+                f_date = pd.to_datetime(rot.loc[has_folga, 'folga_date'])
+                s_date = pd.to_datetime(rot.loc[has_folga, 'sunday_date'])
+                delta[has_folga] = (f_date - s_date).dt.days.to_numpy(dtype=np.int64)
+                comp = (delta >= 0) & (delta <= 6)
+                parts.append(pd.DataFrame({
+                    "seq": seq[comp] + 1,
+                    "scale_id": scale[comp],
+                    "employee_id": rot['employee_id'].to_numpy()[comp],
+                    "cycle_day": sunday_cycle_day[comp] + delta[comp],
+                    "status": "FOLGA",
+                    "shift_code": "",
+                    "minutes": 0,
+                    "source": "ROTATION_COMPENSATION",
+                }))
+
+        overrides = pd.concat(parts, ignore_index=True).sort_values("seq", kind="stable")
+        return overrides.drop_duplicates(["scale_id", "employee_id", "cycle_day"], keep="last")
 
     def project_cycle_to_period(self, 
                                 cycle_template: pd.DataFrame, 
@@ -134,32 +252,146 @@ class CycleGenerator:
         """
         Projects the abstract cycle onto a concrete calendar period.
         anchor_date: domingo de referência do ciclo. Se None, assume period_start = dia 1.
+
+        Vetorizado: calcula o cycle_day de todo o período de uma vez (aritmética
+        modular sobre ordinais de data) e monta o resultado com um único `take`
+        nas linhas do template, ordenadas por cycle_day.
         """
         if cycle_template.empty: return pd.DataFrame()
 
         cycle_len = int(cycle_template['cycle_day'].max())
         anchor = context.anchor_date if context.anchor_date else context.period_start
-        rows = []
-        cursor = context.period_start
-        
-        while cursor <= context.period_end:
-            offset = (cursor - anchor).days
-            cycle_day = (offset % cycle_len) + 1
-            day_defs = cycle_template[cycle_template['cycle_day'] == cycle_day]
-            
-            for _, d in day_defs.iterrows():
-                rows.append({
-                    "work_date": cursor,
-                    "employee_id": d['employee_id'],
-                    "status": d['status'],
-                    "shift_code": d['shift_code'],
-                    "minutes": d['minutes'],
-                    "source_rule": d['source']
-                })
-            
-            cursor += timedelta(days=1)
-            
-        return pd.DataFrame(rows)
+        n_days = (context.period_end - context.period_start).days + 1
+        if n_days <= 0:
+            return pd.DataFrame()
+
+        start_offset = (context.period_start - anchor).days
+        offsets = np.arange(start_offset, start_offset + n_days, dtype=np.int64)
+        cycle_days = (offsets % cycle_len) + 1
+
+        # Linhas do template agrupadas por cycle_day (ordem estável dentro do dia).
+        template_days = cycle_template['cycle_day'].to_numpy(dtype=np.int64)
+        order = np.argsort(template_days, kind='stable')
+        sorted_days = template_days[order]
+        lo = np.searchsorted(sorted_days, cycle_days, side='left')
+        hi = np.searchsorted(sorted_days, cycle_days, side='right')
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            return pd.DataFrame()
+
+        date_idx = np.repeat(np.arange(n_days), counts)
+        group_begin = np.repeat(np.cumsum(counts) - counts, counts)
+        template_pos = order[np.repeat(lo, counts) + (np.arange(total) - group_begin)]
+
+        calendar = np.empty(n_days, dtype=object)
+        calendar[:] = [context.period_start + timedelta(days=i) for i in range(n_days)]
+
+        picked = cycle_template.iloc[template_pos]
+        return pd.DataFrame({
+            "work_date": calendar[date_idx],
+            "employee_id": picked['employee_id'].to_numpy(),
+            "status": picked['status'].to_numpy(),
+            "shift_code": picked['shift_code'].to_numpy(),
+            "minutes": picked['minutes'].to_numpy(),
+            "source_rule": picked['source'].to_numpy(),
+        })
+
+    def apply_preferences(
+        self,
+        day_assignments: pd.DataFrame,
+        preferences: List[PreferenceRequest],
+        shifts: Dict[str, Shift],
+    ) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+        """
+        Aplica os pedidos aprovados sobre a escala projetada.
+
+        Os pedidos viram um frame chaveado por (employee_id, work_date), reduzido a um
+        patch por chave na ordem dos pedidos: folga zera turno/minutos e marca FOLGA;
+        troca de turno só altera shift_code/minutes (o último pedido da chave prevalece).
+        O patch entra numa única atualização por chave. Retorna (escala, pedidos aplicados).
+        """
+        applicable = [
+            p for p in preferences
+            if p.decision.value == "APPROVED"
+            and (p.request_type.value != "SHIFT_CHANGE_ON_DATE" or p.target_shift_code)
+        ]
+        if not applicable or day_assignments.empty:
+            return day_assignments, []
+
+        folga = np.array([p.request_type.value != "SHIFT_CHANGE_ON_DATE" for p in applicable])
+        requests = pd.DataFrame({
+            "employee_id": pd.Series([p.employee_id for p in applicable], dtype=object),
+            "day": date_ordinals(pd.Series([p.request_date for p in applicable], dtype=object)),
+            "folga": folga,
+            "shift_code": ["" if f else p.target_shift_code for f, p in zip(folga, applicable)],
+            "minutes": [
+                0 if f else (int(shifts[p.target_shift_code].minutes) if p.target_shift_code in shifts else 480)
+                for f, p in zip(folga, applicable)
+            ],
+        })
+        keys = pd.MultiIndex.from_arrays(
+            [day_assignments["employee_id"].to_numpy(), date_ordinals(day_assignments["work_date"])]
+        )
+        matched = pd.MultiIndex.from_arrays([requests["employee_id"], requests["day"]]).isin(keys)
+        processed = [
+            {"request_id": p.request_id, "applied": True}
+            for p, hit in zip(applicable, matched) if hit
+        ]
+        if not processed:
+            return day_assignments, processed
+
+        requests = requests[matched]
+        patch = requests.drop_duplicates(["employee_id", "day"], keep="last").set_index(["employee_id", "day"])
+        any_folga = requests.groupby(["employee_id", "day"], sort=False)["folga"].any()
+        positions = patch.index.get_indexer(keys)
+        rows = np.flatnonzero(positions >= 0)
+        picked = positions[rows]
+
+        df = day_assignments.copy()
+        df.iloc[rows, df.columns.get_loc("shift_code")] = patch["shift_code"].to_numpy()[picked]
+        df.iloc[rows, df.columns.get_loc("minutes")] = patch["minutes"].to_numpy()[picked]
+        df.iloc[rows, df.columns.get_loc("source_rule")] = "PREFERENCE_APPLIED"
+        to_folga = rows[any_folga.reindex(patch.index).to_numpy()[picked]]
+        df.iloc[to_folga, df.columns.get_loc("status")] = "FOLGA"
+        return df, processed
+
+    def apply_exceptions(
+        self,
+        day_assignments: pd.DataFrame,
+        exceptions: Union[List[ScheduleException], pd.DataFrame],
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        Converte WORK em ABSENCE nas datas com exceção (férias, atestado, trocas, bloqueios).
+
+        `exceptions`: lista de ScheduleException ou frame de `load_exceptions_df`.
+        Exceções repetidas na mesma chave (employee_id, work_date): vale a primeira.
+        Retorna (escala, quantidade de exceções que converteram algum dia trabalhado).
+        """
+        if len(exceptions) == 0 or day_assignments.empty:
+            return day_assignments, 0
+
+        frame = exceptions_frame(exceptions)
+        overlay = pd.DataFrame({
+            "employee_id": frame["employee_id"].to_numpy(dtype=object),
+            "day": date_ordinals(frame["exception_date"]),
+            "source_rule": ("EXCEPTION_" + frame["exception_type"].astype(str)).to_numpy(dtype=object),
+        }).drop_duplicates(["employee_id", "day"], keep="first")
+        index = pd.MultiIndex.from_arrays([overlay["employee_id"], overlay["day"]])
+        positions = index.get_indexer(pd.MultiIndex.from_arrays(
+            [day_assignments["employee_id"].to_numpy(), date_ordinals(day_assignments["work_date"])]
+        ))
+        hit = (positions >= 0) & (day_assignments["status"].to_numpy() == "WORK")
+        if not hit.any():
+            return day_assignments, 0
+
+        rows = np.flatnonzero(hit)
+        df = day_assignments.copy()
+        df.iloc[rows, df.columns.get_loc("status")] = "ABSENCE"
+        df.iloc[rows, df.columns.get_loc("shift_code")] = ""
+        df.iloc[rows, df.columns.get_loc("minutes")] = 0
+        df.iloc[rows, df.columns.get_loc("source_rule")] = overlay["source_rule"].to_numpy()[positions[rows]]
+        return df, int(np.unique(positions[rows]).size)
 
 @dataclass
 class PolicyEngine:
@@ -171,32 +403,26 @@ class PolicyEngine:
         violations = []
         if day_assignments.empty: return violations
 
-        df = day_assignments.sort_values(['employee_id', 'work_date'])
-        
-        for employee_id, group in df.groupby('employee_id'):
-            streak = 0
-            streak_start = None
-            
-            for _, row in group.iterrows():
-                if row['status'] == 'WORK':
-                    streak += 1
-                    if streak == 1:
-                        streak_start = row['work_date']
-                    
-                    if streak > max_days:
-                        violations.append(Violation(
-                            employee_id=employee_id,
-                            rule_code="R1_MAX_CONSECUTIVE",
-                            severity=ViolationSeverity.CRITICAL,
-                            date_start=streak_start,
-                            date_end=row['work_date'],
-                            detail=f"Trabalhou {streak} dias seguidos (Max: {max_days})",
-                            evidence={"streak": streak}
-                        ))
-                else:
-                    streak = 0
-                    streak_start = None
-        
+        employee_ids = day_assignments['employee_id'].to_numpy()
+        work_dates = day_assignments['work_date'].to_numpy()
+        codes, _ = pd.factorize(employee_ids, sort=True)
+        overruns = find_streak_overruns(
+            codes,
+            date_ordinals(day_assignments['work_date']),
+            (day_assignments['status'] == 'WORK').to_numpy(),
+            max_days,
+        )
+        for row, start, streak in zip(overruns.row, overruns.start, overruns.length.tolist()):
+            violations.append(Violation(
+                employee_id=employee_ids[row],
+                rule_code="R1_MAX_CONSECUTIVE",
+                severity=ViolationSeverity.CRITICAL,
+                date_start=work_dates[start],
+                date_end=work_dates[row],
+                detail=f"Trabalhou {streak} dias seguidos (Max: {max_days})",
+                evidence={"streak": streak}
+            ))
+
         return violations
 
     def validate_weekly_hours(
@@ -204,40 +430,41 @@ class PolicyEngine:
         day_assignments: pd.DataFrame,
         contract_targets: Dict[str, Any],
         tolerance: int = 120,
+        aggregates: Optional[ScheduleAggregates] = None,
     ) -> List[Violation]:
         violations = []
         if day_assignments.empty: return violations
 
-        df = day_assignments.copy()
-        df['work_date'] = pd.to_datetime(df['work_date'])
-        df['week_start'] = df['work_date'] - pd.to_timedelta(df['work_date'].dt.weekday, unit='D')
-        
-        grouped = df.groupby(['employee_id', 'week_start'])['minutes'].sum().reset_index()
-        
-        for _, row in grouped.iterrows():
-            emp_id = row['employee_id']
-            actual = row['minutes']
-            profile = contract_targets.get(emp_id, {"weekly_minutes": 2640, "contract_code": "UNKNOWN"})
-            if isinstance(profile, dict):
-                target = int(profile.get("weekly_minutes", 2640))
-                contract_code = str(profile.get("contract_code", "UNKNOWN"))
-            else:
-                target = int(profile)
-                contract_code = "UNKNOWN"
-            
-            delta = actual - target
-            
-            if abs(delta) > tolerance:
-                severity = ViolationSeverity.HIGH if abs(delta) > 600 else ViolationSeverity.MEDIUM
-                violations.append(Violation(
-                    employee_id=emp_id,
-                    rule_code="R4_WEEKLY_TARGET",
-                    severity=severity,
-                    date_start=row['week_start'].date(),
-                    date_end=(row['week_start'] + timedelta(days=6)).date(),
-                    detail=f"[{contract_code}] Desvio de {delta} min (Meta: {target}, Real: {actual})",
-                    evidence={"delta": delta, "actual": actual, "target": target, "contract_code": contract_code}
-                ))
+        if aggregates is None:
+            aggregates = ScheduleAggregates.from_assignments(day_assignments)
+        weekly = aggregates.weekly_totals("MON_SUN")
+
+        default_profile = {"weekly_minutes": 2640, "contract_code": "UNKNOWN"}
+        profiles = {
+            emp_id: target_profile(contract_targets.get(emp_id, default_profile))
+            for emp_id in weekly["employee_id"].unique()
+        }
+        targets = weekly["employee_id"].map(lambda emp_id: profiles[emp_id][0]).to_numpy(dtype=np.int64)
+        deltas = weekly["minutes"].to_numpy(dtype=np.int64) - targets
+        hits = np.flatnonzero(np.abs(deltas) > tolerance)
+
+        employee_ids = weekly["employee_id"].to_numpy()
+        week_starts = weekly["week_start"].to_numpy()
+        actuals = weekly["minutes"].to_numpy(dtype=np.int64)
+        for i in hits:
+            emp_id = employee_ids[i]
+            target, contract_code = profiles[emp_id]
+            actual, delta = int(actuals[i]), int(deltas[i])
+            severity = ViolationSeverity.HIGH if abs(delta) > 600 else ViolationSeverity.MEDIUM
+            violations.append(Violation(
+                employee_id=emp_id,
+                rule_code="R4_WEEKLY_TARGET",
+                severity=severity,
+                date_start=week_starts[i],
+                date_end=week_starts[i] + timedelta(days=6),
+                detail=f"[{contract_code}] Desvio de {delta} min (Meta: {target}, Real: {actual})",
+                evidence={"delta": delta, "actual": actual, "target": target, "contract_code": contract_code}
+            ))
 
         return violations
 
@@ -245,6 +472,7 @@ class PolicyEngine:
         self,
         day_assignments: pd.DataFrame,
         constraints: Dict[str, Any],
+        aggregates: Optional[ScheduleAggregates] = None,
     ) -> List[Violation]:
         """
         R6: valida limite diário operacional de minutos por colaborador.
@@ -256,21 +484,22 @@ class PolicyEngine:
         op_limit = int(constraints.get("max_daily_minutes_operational", 585))  # ~9h45
         hard_limit = int(constraints.get("max_daily_minutes_hard", 600))  # 10h
 
-        grouped = (
-            day_assignments.groupby(["employee_id", "work_date"], as_index=False)["minutes"].sum()
-        )
-        for _, row in grouped.iterrows():
-            minutes = int(row["minutes"])
-            if minutes <= op_limit:
-                continue
+        if aggregates is None:
+            aggregates = ScheduleAggregates.from_assignments(day_assignments)
+        daily = aggregates.daily
+        minutes_arr = daily["minutes"].to_numpy(dtype=np.int64)
+        employee_ids = daily["employee_id"].to_numpy()
+        work_dates = daily["work_date"].to_numpy()
+        for i in np.flatnonzero(minutes_arr > op_limit):
+            minutes = int(minutes_arr[i])
             severity = ViolationSeverity.CRITICAL if minutes > hard_limit else ViolationSeverity.HIGH
             violations.append(
                 Violation(
-                    employee_id=str(row["employee_id"]),
+                    employee_id=str(employee_ids[i]),
                     rule_code="R6_MAX_DAILY_MINUTES",
                     severity=severity,
-                    date_start=row["work_date"],
-                    date_end=row["work_date"],
+                    date_start=work_dates[i],
+                    date_end=work_dates[i],
                     detail=(
                         f"Carga diária {minutes} min excede limite operacional "
                         f"({op_limit} min; teto duro {hard_limit} min)"
@@ -299,67 +528,53 @@ class PolicyEngine:
         if day_assignments.empty:
             return violations
 
-        df = day_assignments.copy()
-        df["work_date"] = pd.to_datetime(df["work_date"])
-        sundays = df[df["work_date"].dt.weekday == 6].sort_values(["employee_id", "work_date"])
-
-        for employee_id, group in sundays.groupby("employee_id"):
-            # Pega regra do contrato do colaborador
-            profile = contract_rules.get(employee_id, {})
-            max_consecutive = int(profile.get("max_consecutive_sundays", 2))
-            contract_code = str(profile.get("contract_code", "UNKNOWN"))
-
-            consecutive_count = 0
-            for _, row in group.iterrows():
-                if row["status"] == "WORK":
-                    consecutive_count += 1
-                    if consecutive_count > max_consecutive:
-                        violations.append(
-                            Violation(
-                                employee_id=employee_id,
-                                rule_code="R3_SUNDAY_ROTATION",
-                                severity=ViolationSeverity.CRITICAL,
-                                date_start=row["work_date"].date(),
-                                date_end=row["work_date"].date(),
-                                detail=(
-                                    f"[{contract_code}] Domingo trabalhado consecutivo #{consecutive_count} "
-                                    f"(Máximo permitido pela lei: {max_consecutive})"
-                                ),
-                                evidence={
-                                    "consecutive_count": consecutive_count,
-                                    "max_allowed": max_consecutive,
-                                    "contract_code": contract_code,
-                                },
-                            )
-                        )
-                else:
-                    consecutive_count = 0
+        ordinals = date_ordinals(day_assignments["work_date"])
+        # 1970-01-01 (ordinal 0) foi quinta-feira: domingo <=> ordinal % 7 == 3.
+        sunday_mask = (ordinals % 7) == 3
+        if not sunday_mask.any():
+            return violations
+        ordinals = ordinals[sunday_mask]
+        employee_ids = day_assignments["employee_id"].to_numpy()[sunday_mask]
+        codes, uniques = pd.factorize(employee_ids, sort=True)
+
+        # Regra do contrato de cada colaborador (limite por linha via código do colaborador).
+        profiles = [contract_rules.get(employee_id, {}) for employee_id in uniques]
+        max_by_code = np.array([int(p.get("max_consecutive_sundays", 2)) for p in profiles], dtype=np.int64)
+        overruns = find_streak_overruns(
+            codes,
+            ordinals,
+            (day_assignments["status"].to_numpy()[sunday_mask] == "WORK"),
+            max_by_code[codes],
+        )
+        sunday_dates = ordinals.astype("datetime64[D]").astype(object)
+        for row, consecutive_count in zip(overruns.row, overruns.length.tolist()):
+            code = codes[row]
+            max_consecutive = int(max_by_code[code])
+            contract_code = str(profiles[code].get("contract_code", "UNKNOWN"))
+            violations.append(
+                Violation(
+                    employee_id=employee_ids[row],
+                    rule_code="R3_SUNDAY_ROTATION",
+                    severity=ViolationSeverity.CRITICAL,
+                    date_start=sunday_dates[row],
+                    date_end=sunday_dates[row],
+                    detail=(
+                        f"[{contract_code}] Domingo trabalhado consecutivo #{consecutive_count} "
+                        f"(Máximo permitido pela lei: {max_consecutive})"
+                    ),
+                    evidence={
+                        "consecutive_count": consecutive_count,
+                        "max_allowed": max_consecutive,
+                        "contract_code": contract_code,
+                    },
+                )
+            )
         return violations
 
-    def _shift_to_datetime_range(self, shift: Shift, work_date: date) -> tuple:
-        """Retorna (start_dt, end_dt) para o turno na data."""
-        default_start = "08:00"
-        if shift.start_time and shift.end_time:
-            start_str, end_str = shift.start_time, shift.end_time
-        else:
-            h, m = divmod(shift.minutes, 60)
-            start_str = default_start
-            end_h = 8 + h
-            end_m = m
-            if end_m >= 60:
-                end_h += 1
-                end_m -= 60
-            end_str = f"{end_h:02d}:{end_m:02d}"
-        start_dt = datetime.combine(work_date, datetime.strptime(start_str, "%H:%M").time())
-        end_dt = datetime.combine(work_date, datetime.strptime(end_str, "%H:%M").time())
-        if end_dt <= start_dt:
-            end_dt += timedelta(days=1)
-        return start_dt, end_dt
-
     def validate_intershift_rest(
         self,
         day_assignments: pd.DataFrame,
-        shifts: Dict[str, Shift],
+        shifts: Union[Dict[str, Shift], CompiledShiftCatalog],
         constraints: Dict[str, Any],
     ) -> List[Violation]:
         """
@@ -368,85 +583,101 @@ class PolicyEngine:
         """
         violations = []
         min_rest = int(constraints.get("min_intershift_rest_minutes", 660))
-        if day_assignments.empty or not shifts:
+        catalog = compile_shifts(shifts)
+        if day_assignments.empty or not catalog:
             return violations
 
-        df = day_assignments[day_assignments["status"] == "WORK"].copy()
-        df["work_date"] = pd.to_datetime(df["work_date"])
-        df = df.sort_values(["employee_id", "work_date"])
-
-        for employee_id, group in df.groupby("employee_id"):
-            rows = list(group.itertuples())
-            for i in range(len(rows) - 1):
-                curr, nxt = rows[i], rows[i + 1]
-                curr_date = curr.work_date.date() if hasattr(curr.work_date, "date") else curr.work_date
-                nxt_date = nxt.work_date.date() if hasattr(nxt.work_date, "date") else nxt.work_date
-                delta_days = (nxt_date - curr_date).days
-                if delta_days > 1:
-                    continue
-                shift_curr = shifts.get(curr.shift_code) if curr.shift_code else None
-                shift_nxt = shifts.get(nxt.shift_code) if nxt.shift_code else None
-                if not shift_curr or not shift_nxt:
-                    continue
-                _, end_curr = self._shift_to_datetime_range(shift_curr, curr_date)
-                start_nxt, _ = self._shift_to_datetime_range(shift_nxt, nxt_date)
-                if delta_days == 1:
-                    rest_minutes = (start_nxt - end_curr).total_seconds() / 60
-                else:
-                    rest_minutes = (start_nxt - end_curr).total_seconds() / 60
-                if rest_minutes < min_rest:
-                    violations.append(Violation(
-                        employee_id=employee_id,
-                        rule_code="R2_MIN_INTERSHIFT_REST",
-                        severity=ViolationSeverity.CRITICAL,
-                        date_start=curr_date,
-                        date_end=nxt_date,
-                        detail=f"Intervalo entre jornadas {int(rest_minutes)} min (mínimo: {min_rest})",
-                        evidence={"rest_minutes": rest_minutes, "min_required": min_rest},
-                    ))
-        return violations
+        # Ordena uma vez por (colaborador, data) e compara cada jornada com a seguinte
+        # via arrays deslocados, só dentro do mesmo colaborador.
+        work = day_assignments[day_assignments["status"] == "WORK"]
+        employee_ids = work["employee_id"].to_numpy()
+        codes, _ = pd.factorize(employee_ids, sort=True)
+        ordinals = date_ordinals(work["work_date"])
+        order = np.lexsort((ordinals, codes))
+        codes = codes[order]
+        ordinals = ordinals[order]
+        shift_idx = catalog.lookup(work["shift_code"])[order]
+
+        curr_idx, next_idx = shift_idx[:-1], shift_idx[1:]
+        delta_days = ordinals[1:] - ordinals[:-1]
+        comparable = (codes[1:] == codes[:-1]) & (delta_days <= 1) & (curr_idx >= 0) & (next_idx >= 0)
+        rest = (
+            delta_days * MINUTES_PER_DAY
+            + catalog.start_minutes[np.where(comparable, next_idx, 0)]
+            - catalog.end_minutes[np.where(comparable, curr_idx, 0)]
+        )
+        hits = np.flatnonzero(comparable & (rest < min_rest))
+        if len(hits) == 0:
+            return violations
 
-    def _shift_overlaps_slot(self, shift: Shift, work_date: date, slot_start: str) -> bool:
-        """Verifica se o turno cobre o slot (ex.: 08:00 = 08:00-08:30)."""
-        start_dt, end_dt = self._shift_to_datetime_range(shift, work_date)
-        slot_parts = slot_start.split(":")
-        slot_h, slot_m = int(slot_parts[0]), int(slot_parts[1]) if len(slot_parts) > 1 else 0
-        slot_begin = datetime.combine(work_date, datetime.strptime(slot_start, "%H:%M").time())
-        slot_end = slot_begin + timedelta(minutes=30)
-        return start_dt < slot_end and end_dt > slot_begin
+        dates = ordinals.astype("datetime64[D]").astype(object)
+        for i, rest_minutes in zip(hits, rest[hits].astype(float).tolist()):
+            violations.append(Violation(
+                employee_id=employee_ids[order[i]],
+                rule_code="R2_MIN_INTERSHIFT_REST",
+                severity=ViolationSeverity.CRITICAL,
+                date_start=dates[i],
+                date_end=dates[i + 1],
+                detail=f"Intervalo entre jornadas {int(rest_minutes)} min (mínimo: {min_rest})",
+                evidence={"rest_minutes": rest_minutes, "min_required": min_rest},
+            ))
+        return violations
 
     def validate_demand_coverage(
         self,
         day_assignments: pd.DataFrame,
-        demand_slots: list,
-        shifts: Dict[str, Shift],
+        demand_slots: Union[List[DemandSlot], pd.DataFrame],
+        shifts: Union[Dict[str, Shift], CompiledShiftCatalog],
     ) -> List[Violation]:
         """
         Valida cobertura mínima por faixa horária.
-        Se demand_slots vazio, retorna lista vazia.
+        `demand_slots`: lista de DemandSlot ou frame de `load_demand_profile_df`; vazio -> sem violações.
+
+        Cada alocação WORK vira um intervalo [início, fim) em minutos uma única vez;
+        a lotação de cada slot [s, s+30) sai de uma varredura sobre os extremos
+        ordenados (chave dia*span + minuto): #(início < s+30) - #(fim <= s) no dia.
         """
         violations = []
-        if not demand_slots or day_assignments.empty or not shifts:
+        catalog = compile_shifts(shifts)
+        if len(demand_slots) == 0 or day_assignments.empty or not catalog:
             return violations
 
-        df = day_assignments[day_assignments["status"] == "WORK"].copy()
-        df["work_date"] = pd.to_datetime(df["work_date"])
-
-        for slot in demand_slots:
-            day_assigns = df[df["work_date"] == pd.Timestamp(slot.work_date)]
-            count = 0
-            for _, row in day_assigns.iterrows():
-                shift = shifts.get(row["shift_code"]) if row["shift_code"] else None
-                if shift and self._shift_overlaps_slot(shift, slot.work_date, slot.slot_start):
-                    count += 1
-            if count < slot.min_required:
-                violations.append(Violation(
-                    employee_id="COBERTURA",  # Violação de setor, não de pessoa
-                    rule_code="R5_DEMAND_COVERAGE",
-                    severity=ViolationSeverity.MEDIUM,
-                    date_start=slot.work_date,
-                    date_end=slot.work_date,
-                    detail=f"Cobertura insuficiente em {slot.work_date} às {slot.slot_start}: {count} pessoas (mínimo: {slot.min_required})",
-                    evidence={"slot": slot.slot_start, "actual": count, "min_required": slot.min_required},
-                ))
+        work = day_assignments[day_assignments["status"] == "WORK"]
+        shift_idx = catalog.lookup(work["shift_code"])
+        known = shift_idx >= 0
+        starts = catalog.start_minutes[shift_idx[known]]
+        ends = catalog.end_minutes[shift_idx[known]]
+        days = date_ordinals(work["work_date"])[known]
+
+        span = 4 * 24 * 60  # maior que qualquer fim de turno (<= 48h) ou fim de slot
+        start_keys = np.sort(days * span + starts)
+        end_keys = np.sort(days * span + ends)
+
+        slots = demand_frame(demand_slots)
+        slot_dates = slots["work_date"].to_numpy(dtype=object)
+        slot_starts = slots["slot_start"].to_numpy(dtype=object)
+        slot_days = date_ordinals(slots["work_date"])
+        slot_begin = np.array([hhmm_to_minutes(start) for start in slot_starts], dtype=np.int64)
+        day_base = slot_days * span
+        started = np.searchsorted(start_keys, day_base + slot_begin + 30, side="left") - np.searchsorted(
+            start_keys, day_base, side="left"
+        )
+        finished = np.searchsorted(end_keys, day_base + slot_begin, side="right") - np.searchsorted(
+            end_keys, day_base, side="left"
+        )
+        counts = started - finished
+        min_required = slots["min_required"].to_numpy(dtype=np.int64)
+
+        for i in np.flatnonzero(counts < min_required).tolist():
+            work_date, slot_start, required = slot_dates[i], slot_starts[i], int(min_required[i])
+            count = int(counts[i])
+            violations.append(Violation(
+                employee_id="COBERTURA",  # Violação de setor, não de pessoa
+                rule_code="R5_DEMAND_COVERAGE",
+                severity=ViolationSeverity.MEDIUM,
+                date_start=work_date,
+                date_end=work_date,
+                detail=f"Cobertura insuficiente em {work_date} às {slot_start}: {count} pessoas (mínimo: {required})",
+                evidence={"slot": slot_start, "actual": count, "min_required": required},
+            ))
         return violations
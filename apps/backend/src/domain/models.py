@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import List, Optional, Dict, Any, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Union
+
+if TYPE_CHECKING:
+    from .shift_catalog import CompiledShiftCatalog
 
 # Enums
 class WeekDefinition(str, Enum):
@@ -89,6 +93,12 @@ class Policy:
     sunday_rules: Dict[str, Any]
     preference_rules: Dict[str, Any]
 
+    @cached_property
+    def shift_catalog(self) -> "CompiledShiftCatalog":
+        """Turnos compilados em offsets inteiros de minutos (uma vez por Policy)."""
+        from .shift_catalog import CompiledShiftCatalog
+        return CompiledShiftCatalog.from_shifts(self.shifts)
+
 @dataclass(frozen=True)
 class Assignment:
     assignment_id: str
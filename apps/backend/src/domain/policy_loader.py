@@ -1,19 +1,92 @@
 import json
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from .models import (
     Policy, Contract, Shift, ShiftDayScope,
     PickingRules, PickingStrategy, WeekDefinition
 )
 
+@dataclass
+class _CacheEntry:
+    key: Tuple[int, int]
+    text: str
+    data: Dict[str, Any]
+    policy: Optional[Policy] = None
+
+
+class PolicyCache:
+    """
+    Cache de processo da policy JSON, chaveado por caminho + (mtime_ns, tamanho).
+
+    Guarda o texto, o dict e o `Policy` já montado; qualquer alteração no arquivo
+    muda a chave e força releitura. Quem grava a policy chama `invalidate`.
+    `hits`/`misses` contam consultas atendidas da memória vs releituras do disco.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, policy_path: Path) -> _CacheEntry:
+        path = Path(policy_path).resolve()
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.key == key:
+                self.hits += 1
+                return entry
+            self.misses += 1
+        text = path.read_text(encoding="utf-8")
+        entry = _CacheEntry(key=key, text=text, data=json.loads(text))
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+    def load_data(self, policy_path: Path, copy: bool = False) -> Dict[str, Any]:
+        """Dict cru da policy. Compartilhado (somente leitura) salvo `copy=True`."""
+        entry = self._entry(policy_path)
+        return json.loads(entry.text) if copy else entry.data
+
+    def load_policy(self, policy_path: Path, parse: Callable[[Dict[str, Any]], Policy]) -> Policy:
+        entry = self._entry(policy_path)
+        if entry.policy is None:
+            entry.policy = parse(entry.data)
+        return entry.policy
+
+    def invalidate(self, policy_path: Optional[Path] = None) -> None:
+        with self._lock:
+            if policy_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(policy_path).resolve(), None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+# Instância compartilhada pelas rotas (um processo = um cache).
+POLICY_CACHE = PolicyCache()
+
+
 class PolicyLoader:
-    def __init__(self, schemas_path: Path):
+    def __init__(self, schemas_path: Path, cache: Optional[PolicyCache] = None):
         self.schemas_path = schemas_path
+        self.cache = cache
 
     def load_policy(self, policy_path: Path) -> Policy:
-        """Loads and parses the policy JSON into a Domain Entity."""
-        data = json.loads(policy_path.read_text(encoding="utf-8"))
-        
+        """Loads and parses the policy JSON into a Domain Entity (reusing the cache when set)."""
+        if self.cache is not None:
+            return self.cache.load_policy(policy_path, self.parse_policy)
+        return self.parse_policy(json.loads(policy_path.read_text(encoding="utf-8")))
+
+    def parse_policy(self, data: Dict[str, Any]) -> Policy:
+        """Builds the Policy entity from the raw policy dict."""
         # 1. Parse Picking Rules
         picking_data = data.get("picking_rules", {})
         picking_rules = PickingRules(
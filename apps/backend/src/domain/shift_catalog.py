@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .models import Shift
+
+DEFAULT_START_MINUTES = 8 * 60  # turno sem horário cadastrado começa 08:00
+MINUTES_PER_DAY = 24 * 60
+
+
+def hhmm_to_minutes(value: str) -> int:
+    """"HH:MM" -> minutos desde 00:00."""
+    h, m = str(value).strip().split(":")[:2]
+    return int(h) * 60 + int(m)
+
+
+@dataclass(frozen=True)
+class CompiledShiftCatalog:
+    """
+    Catálogo de turnos pré-compilado para as regras do PolicyEngine.
+
+    Cada turno vira offsets inteiros em minutos a partir das 00:00 do dia trabalhado,
+    com o default 08:00 (turno sem horário) e a virada de dia já resolvidos
+    (`end_minutes > start_minutes` sempre). Arrays indexados pela posição do código.
+    """
+    codes: Tuple[str, ...]
+    start_minutes: np.ndarray
+    end_minutes: np.ndarray
+    overnight: np.ndarray
+    index: Dict[str, int] = field(repr=False)
+
+    @classmethod
+    def from_shifts(cls, shifts: Dict[str, Shift]) -> "CompiledShiftCatalog":
+        codes = tuple(shifts)
+        starts = np.empty(len(codes), dtype=np.int64)
+        ends = np.empty(len(codes), dtype=np.int64)
+        for i, code in enumerate(codes):
+            shift = shifts[code]
+            if shift.start_time and shift.end_time:
+                starts[i] = hhmm_to_minutes(shift.start_time)
+                ends[i] = hhmm_to_minutes(shift.end_time)
+            else:
+                starts[i] = DEFAULT_START_MINUTES
+                ends[i] = DEFAULT_START_MINUTES + int(shift.minutes)
+        overnight = ends <= starts
+        ends[overnight] += MINUTES_PER_DAY
+        return cls(
+            codes=codes,
+            start_minutes=starts,
+            end_minutes=ends,
+            overnight=overnight,
+            index={code: i for i, code in enumerate(codes)},
+        )
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self.index
+
+    def lookup(self, shift_codes: Iterable) -> np.ndarray:
+        """Posição de cada código no catálogo; -1 para vazio/desconhecido."""
+        positions = pd.Series(shift_codes, dtype=object).map(self.index)
+        return positions.fillna(-1).to_numpy(dtype=np.int64)
+
+    def bounds(self, code: str) -> Tuple[int, int]:
+        i = self.index[code]
+        return int(self.start_minutes[i]), int(self.end_minutes[i])
+
+
+def compile_shifts(shifts: Union[Dict[str, Shift], CompiledShiftCatalog]) -> CompiledShiftCatalog:
+    """Aceita o dicionário de turnos da Policy ou um catálogo já compilado."""
+    if isinstance(shifts, CompiledShiftCatalog):
+        return shifts
+    return CompiledShiftCatalog.from_shifts(shifts or {})
@@ -1,5 +1,7 @@
 
-from sqlalchemy import Column, String, Integer, Date, Boolean, ForeignKey
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, String, Integer, Date, Boolean, ForeignKey, Index
 from apps.backend.src.infrastructure.database.orm_models import Base
 
 class ShiftORM(Base):
@@ -24,6 +26,11 @@ class CycleTemplateORM(Base):
     status = Column(String, default="WORK") # WORK, FOLGA
     source = Column(String, default="MANUAL")
 
+    __table_args__ = (
+        # load_weekday_template_data filtra por source (TEMPLATE_BASE:<SECTOR_ID>)
+        Index("ix_cycle_templates_source", "source"),
+    )
+
 class SundayRotationORM(Base):
     __tablename__ = "sunday_rotations"
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -32,6 +39,10 @@ class SundayRotationORM(Base):
     sunday_date = Column(Date, nullable=False)
     folga_date = Column(Date, nullable=True)
 
+    __table_args__ = (
+        Index("ix_sunday_rotations_employee_id", "employee_id"),
+    )
+
 
 class ExceptionORM(Base):
     """Exceções: férias, atestado, trocas, bloqueios — removem colaborador da escala na data."""
@@ -43,6 +54,17 @@ class ExceptionORM(Base):
     exception_type = Column(String, nullable=False)  # VACATION, MEDICAL_LEAVE, SWAP, BLOCK
     note = Column(String, nullable=True)
 
+    __table_args__ = (
+        # Chave natural usada por add_exception/remove_exception.
+        Index(
+            "uq_exceptions_sector_employee_date_type",
+            "sector_id", "employee_id", "exception_date", "exception_type",
+            unique=True,
+        ),
+        # load_exceptions: setor + intervalo de datas.
+        Index("ix_exceptions_sector_date", "sector_id", "exception_date"),
+    )
+
 
 class DemandProfileORM(Base):
     """Cobertura mínima por faixa horária (sector_id + date + slot_start)."""
@@ -52,3 +74,71 @@ class DemandProfileORM(Base):
     work_date = Column(Date, nullable=False)
     slot_start = Column(String, nullable=False)  # "08:00", "08:30", ...
     min_required = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Chave natural (um mínimo por slot) e intervalo de datas de load_demand_profile.
+        Index("uq_demand_profile_sector_date_slot", "sector_id", "work_date", "slot_start", unique=True),
+    )
+
+
+class ScheduleRunORM(Base):
+    """Uma geração oficial da escala; a mais recente do setor é a escala oficial."""
+    __tablename__ = "schedule_runs"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    sector_id = Column(String, nullable=False)
+    period_start = Column(Date, nullable=False)
+    period_end = Column(Date, nullable=False)
+    created_at = Column(
+        String,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    )
+    assignments_count = Column(Integer, nullable=False, default=0)
+    violations_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Última geração do setor: WHERE sector_id = ? ORDER BY id DESC LIMIT 1.
+        Index("ix_schedule_runs_sector_id", "sector_id", "id"),
+    )
+
+
+class ScheduleAssignmentORM(Base):
+    """Alocação colaborador x dia de uma geração (antes: final_assignments.csv)."""
+    __tablename__ = "schedule_assignments"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(Integer, ForeignKey("schedule_runs.id"), nullable=False)
+    sector_id = Column(String, nullable=False)
+    work_date = Column(Date, nullable=False)
+    employee_id = Column(String, nullable=False)
+    status = Column(String, nullable=False)  # WORK, FOLGA, ABSENCE
+    shift_code = Column(String, nullable=True)
+    minutes = Column(Integer, nullable=False, default=0)
+    source_rule = Column(String, nullable=True)
+
+    __table_args__ = (
+        # Leitura da escala oficial por intervalo de datas.
+        Index("ix_schedule_assignments_run_date", "run_id", "work_date"),
+        # Paginação keyset (run_id = ? AND id > ? ORDER BY id) e filtro por colaborador.
+        Index("ix_schedule_assignments_run_id", "run_id"),
+        Index("ix_schedule_assignments_run_employee", "run_id", "employee_id"),
+    )
+
+
+class ScheduleViolationORM(Base):
+    """Violação de regra de uma geração (antes: violations.csv)."""
+    __tablename__ = "schedule_violations"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(Integer, ForeignKey("schedule_runs.id"), nullable=False)
+    sector_id = Column(String, nullable=False)
+    employee_id = Column(String, nullable=False)
+    rule_code = Column(String, nullable=False)
+    severity = Column(String, nullable=False)
+    date_start = Column(Date, nullable=False)
+    date_end = Column(Date, nullable=False)
+    detail = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index("ix_schedule_violations_run_date", "run_id", "date_start"),
+        Index("ix_schedule_violations_run_id", "run_id"),
+        Index("ix_schedule_violations_run_rule", "run_id", "rule_code"),
+    )
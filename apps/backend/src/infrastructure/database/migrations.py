@@ -0,0 +1,254 @@
+"""
+Migrações de schema versionadas (SQLite).
+
+Cada migração roda uma única vez e fica registrada em `schema_migrations`.
+Executadas no startup da API (lifespan) e pelo seed — nunca por requisição.
+Toda migração grava DDL explícito (congelado): nada é derivado de Base.metadata,
+que muda junto com o ORM. Mudou o schema? Nova migração no fim da lista.
+"""
+from datetime import datetime, timezone
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select, text
+from sqlalchemy.engine import Connection, Engine
+
+_version_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _version_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+# v1: tabelas do baseline, sem os índices e tabelas acrescentados depois.
+_INITIAL_SCHEMA_DDL = (
+    """CREATE TABLE IF NOT EXISTS sectors (
+	sector_id VARCHAR NOT NULL,
+	name VARCHAR NOT NULL,
+	active BOOLEAN,
+	PRIMARY KEY (sector_id)
+)""",
+    """CREATE TABLE IF NOT EXISTS governance_audit_events (
+	id INTEGER NOT NULL,
+	created_at VARCHAR NOT NULL,
+	operation VARCHAR NOT NULL,
+	mode VARCHAR NOT NULL,
+	actor_role VARCHAR NOT NULL,
+	actor_name VARCHAR,
+	reason VARCHAR,
+	warnings_json JSON NOT NULL,
+	sector_id VARCHAR,
+	period_start VARCHAR,
+	period_end VARCHAR,
+	PRIMARY KEY (id)
+)""",
+    """CREATE TABLE IF NOT EXISTS shifts (
+	shift_code VARCHAR NOT NULL,
+	sector_id VARCHAR NOT NULL,
+	minutes INTEGER NOT NULL,
+	day_scope VARCHAR,
+	start_time VARCHAR,
+	end_time VARCHAR,
+	PRIMARY KEY (shift_code)
+)""",
+    """CREATE TABLE IF NOT EXISTS demand_profile (
+	id INTEGER NOT NULL,
+	sector_id VARCHAR NOT NULL,
+	work_date DATE NOT NULL,
+	slot_start VARCHAR NOT NULL,
+	min_required INTEGER NOT NULL,
+	PRIMARY KEY (id)
+)""",
+    """CREATE TABLE IF NOT EXISTS contracts (
+	contract_code VARCHAR NOT NULL,
+	sector_id VARCHAR NOT NULL,
+	weekly_minutes INTEGER NOT NULL,
+	sunday_mode VARCHAR,
+	max_consecutive_sundays INTEGER,
+	allowed_shifts_json JSON,
+	PRIMARY KEY (contract_code),
+	FOREIGN KEY(sector_id) REFERENCES sectors (sector_id)
+)""",
+    """CREATE TABLE IF NOT EXISTS employees (
+	employee_id VARCHAR NOT NULL,
+	name VARCHAR NOT NULL,
+	contract_code VARCHAR NOT NULL,
+	sector_id VARCHAR NOT NULL,
+	rank INTEGER,
+	active BOOLEAN,
+	PRIMARY KEY (employee_id),
+	FOREIGN KEY(contract_code) REFERENCES contracts (contract_code),
+	FOREIGN KEY(sector_id) REFERENCES sectors (sector_id)
+)""",
+    """CREATE TABLE IF NOT EXISTS preferences (
+	request_id VARCHAR NOT NULL,
+	employee_id VARCHAR NOT NULL,
+	request_date DATE NOT NULL,
+	request_type VARCHAR NOT NULL,
+	priority VARCHAR,
+	target_shift_code VARCHAR,
+	note VARCHAR,
+	decision VARCHAR,
+	decision_reason VARCHAR,
+	PRIMARY KEY (request_id),
+	FOREIGN KEY(employee_id) REFERENCES employees (employee_id)
+)""",
+    """CREATE TABLE IF NOT EXISTS cycle_templates (
+	id INTEGER NOT NULL,
+	scale_id INTEGER NOT NULL,
+	cycle_day INTEGER NOT NULL,
+	employee_id VARCHAR NOT NULL,
+	day_key VARCHAR NOT NULL,
+	shift_code VARCHAR,
+	minutes INTEGER,
+	status VARCHAR,
+	source VARCHAR,
+	PRIMARY KEY (id),
+	FOREIGN KEY(employee_id) REFERENCES employees (employee_id)
+)""",
+    """CREATE TABLE IF NOT EXISTS sunday_rotations (
+	id INTEGER NOT NULL,
+	scale_index INTEGER NOT NULL,
+	employee_id VARCHAR NOT NULL,
+	sunday_date DATE NOT NULL,
+	folga_date DATE,
+	PRIMARY KEY (id),
+	FOREIGN KEY(employee_id) REFERENCES employees (employee_id)
+)""",
+    """CREATE TABLE IF NOT EXISTS exceptions (
+	id INTEGER NOT NULL,
+	sector_id VARCHAR NOT NULL,
+	employee_id VARCHAR NOT NULL,
+	exception_date DATE NOT NULL,
+	exception_type VARCHAR NOT NULL,
+	note VARCHAR,
+	PRIMARY KEY (id),
+	FOREIGN KEY(employee_id) REFERENCES employees (employee_id)
+)""",
+)
+
+
+def _execute_all(conn: Connection, statements) -> None:
+    for ddl in statements:
+        conn.execute(text(ddl))
+
+
+def _initial_schema(conn: Connection) -> None:
+    # Bancos criados antes do controle de versão já têm parte das tabelas: IF NOT EXISTS.
+    _execute_all(conn, _INITIAL_SCHEMA_DDL)
+
+
+def _hot_path_indexes(conn: Connection) -> None:
+    # Antes dos índices únicos, remove duplicatas herdadas: exceção repetida mantém a
+    # primeira (add_exception ignora repetições); slot de demanda mantém o último gravado.
+    conn.execute(text(
+        "DELETE FROM exceptions WHERE id NOT IN ("
+        " SELECT MIN(id) FROM exceptions GROUP BY sector_id, employee_id, exception_date, exception_type)"
+    ))
+    conn.execute(text(
+        "DELETE FROM demand_profile WHERE id NOT IN ("
+        " SELECT MAX(id) FROM demand_profile GROUP BY sector_id, work_date, slot_start)"
+    ))
+    _execute_all(conn, (
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_exceptions_sector_employee_date_type"
+        " ON exceptions (sector_id, employee_id, exception_date, exception_type)",
+        "CREATE INDEX IF NOT EXISTS ix_exceptions_sector_date ON exceptions (sector_id, exception_date)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_demand_profile_sector_date_slot"
+        " ON demand_profile (sector_id, work_date, slot_start)",
+        "CREATE INDEX IF NOT EXISTS ix_cycle_templates_source ON cycle_templates (source)",
+        "CREATE INDEX IF NOT EXISTS ix_sunday_rotations_employee_id ON sunday_rotations (employee_id)",
+    ))
+
+
+def _employee_sector_index(conn: Connection) -> None:
+    _execute_all(conn, ("CREATE INDEX IF NOT EXISTS ix_employees_sector_id ON employees (sector_id)",))
+
+
+def _schedule_runs(conn: Connection) -> None:
+    # Escala oficial no banco (substitui final_assignments.csv / violations.csv).
+    _execute_all(conn, (
+        """CREATE TABLE IF NOT EXISTS schedule_runs (
+	id INTEGER NOT NULL,
+	sector_id VARCHAR NOT NULL,
+	period_start DATE NOT NULL,
+	period_end DATE NOT NULL,
+	created_at VARCHAR NOT NULL,
+	assignments_count INTEGER NOT NULL,
+	violations_count INTEGER NOT NULL,
+	PRIMARY KEY (id)
+)""",
+        "CREATE INDEX IF NOT EXISTS ix_schedule_runs_sector_id ON schedule_runs (sector_id, id)",
+        """CREATE TABLE IF NOT EXISTS schedule_assignments (
+	id INTEGER NOT NULL,
+	run_id INTEGER NOT NULL,
+	sector_id VARCHAR NOT NULL,
+	work_date DATE NOT NULL,
+	employee_id VARCHAR NOT NULL,
+	status VARCHAR NOT NULL,
+	shift_code VARCHAR,
+	minutes INTEGER NOT NULL,
+	source_rule VARCHAR,
+	PRIMARY KEY (id),
+	FOREIGN KEY(run_id) REFERENCES schedule_runs (id)
+)""",
+        "CREATE INDEX IF NOT EXISTS ix_schedule_assignments_run_date ON schedule_assignments (run_id, work_date)",
+        """CREATE TABLE IF NOT EXISTS schedule_violations (
+	id INTEGER NOT NULL,
+	run_id INTEGER NOT NULL,
+	sector_id VARCHAR NOT NULL,
+	employee_id VARCHAR NOT NULL,
+	rule_code VARCHAR NOT NULL,
+	severity VARCHAR NOT NULL,
+	date_start DATE NOT NULL,
+	date_end DATE NOT NULL,
+	detail VARCHAR,
+	PRIMARY KEY (id),
+	FOREIGN KEY(run_id) REFERENCES schedule_runs (id)
+)""",
+        "CREATE INDEX IF NOT EXISTS ix_schedule_violations_run_date ON schedule_violations (run_id, date_start)",
+    ))
+
+
+def _schedule_read_indexes(conn: Connection) -> None:
+    _execute_all(conn, (
+        "CREATE INDEX IF NOT EXISTS ix_schedule_assignments_run_id ON schedule_assignments (run_id)",
+        "CREATE INDEX IF NOT EXISTS ix_schedule_assignments_run_employee ON schedule_assignments (run_id, employee_id)",
+        "CREATE INDEX IF NOT EXISTS ix_schedule_violations_run_id ON schedule_violations (run_id)",
+        "CREATE INDEX IF NOT EXISTS ix_schedule_violations_run_rule ON schedule_violations (run_id, rule_code)",
+    ))
+
+
+# (versão, nome, função). Acrescente no fim; nunca reordene nem altere migrações já publicadas.
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "initial_schema", _initial_schema),
+    (2, "hot_path_indexes", _hot_path_indexes),
+    (3, "employee_sector_index", _employee_sector_index),
+    (4, "schedule_runs", _schedule_runs),
+    (5, "schedule_read_indexes", _schedule_read_indexes),
+]
+
+
+def current_version(conn: Connection) -> int:
+    _version_metadata.create_all(bind=conn, checkfirst=True)
+    version = conn.execute(select(schema_migrations.c.version).order_by(schema_migrations.c.version.desc())).first()
+    return int(version[0]) if version else 0
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """Aplica as migrações pendentes numa transação. Retorna as versões aplicadas."""
+    applied: List[int] = []
+    with engine.begin() as conn:
+        version = current_version(conn)
+        for number, name, migrate in MIGRATIONS:
+            if number <= version:
+                continue
+            migrate(conn)
+            conn.execute(
+                schema_migrations.insert().values(
+                    version=number, name=name, applied_at=datetime.now(timezone.utc)
+                )
+            )
+            applied.append(number)
+    return applied
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, Date, ForeignKey, Index, JSON
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -28,6 +28,11 @@ class EmployeeORM(Base):
     contract = relationship("ContractORM", back_populates="employees")
     preferences = relationship("PreferenceORM", back_populates="employee")
 
+    __table_args__ = (
+        # Escopo por setor (rodízio, metas de contrato) faz join por employees.sector_id.
+        Index("ix_employees_sector_id", "sector_id"),
+    )
+
 class ContractORM(Base):
     __tablename__ = "contracts"
     
@@ -1,20 +1,83 @@
-from sqlalchemy import create_engine
+import os
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from pathlib import Path
 from .orm_models import Base
 from .extended_orm import ShiftORM, CycleTemplateORM, SundayRotationORM, ExceptionORM, DemandProfileORM
+from .migrations import run_migrations
 
 # DB Path
 DB_Path = Path(__file__).resolve().parents[5] / "data" / "compliance_engine.db"
 DB_URL = f"sqlite:///{DB_Path}"
 
-engine = create_engine(DB_URL, echo=False)
+
+def _env(name: str, default: Any) -> str:
+    return os.getenv(f"ESCALAFLOW_SQLITE_{name}", str(default)).strip()
+
+
+def sqlite_pragmas() -> Dict[str, str]:
+    """
+    PRAGMAs aplicados em cada conexão nova (sobrescrevíveis via ESCALAFLOW_SQLITE_<NOME>).
+
+    WAL deixa leituras concorrentes com uma escrita; synchronous=NORMAL é seguro em WAL
+    (só perde a última transação em queda de energia); busy_timeout espera o lock de
+    escrita em vez de falhar com "database is locked".
+    """
+    return {
+        "journal_mode": _env("JOURNAL_MODE", "WAL"),
+        "synchronous": _env("SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": _env("BUSY_TIMEOUT_MS", 5000),
+        "cache_size": _env("CACHE_SIZE", -64000),  # negativo = KiB (64 MiB)
+        "mmap_size": _env("MMAP_SIZE", 256 * 1024 * 1024),
+        "temp_store": _env("TEMP_STORE", "MEMORY"),
+    }
+
+
+def _pool_options(url: str) -> Dict[str, Any]:
+    # Banco em memória usa SingletonThreadPool/StaticPool: sem parâmetros de fila.
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        return {}
+    return {
+        "pool_size": int(_env("POOL_SIZE", 10)),
+        "max_overflow": int(_env("MAX_OVERFLOW", 20)),
+        "pool_timeout": float(_env("POOL_TIMEOUT_S", 30)),
+    }
+
+
+def create_sqlite_engine(url: str = DB_URL, pragmas: Optional[Dict[str, str]] = None, **kwargs: Any) -> Engine:
+    """Engine SQLite com o perfil de desempenho (PRAGMAs por conexão + pool para workers com threads)."""
+    pragmas = sqlite_pragmas() if pragmas is None else pragmas
+    connect_args = {
+        # Rotas síncronas do FastAPI rodam num threadpool; a conexão volta ao pool entre threads.
+        "check_same_thread": False,
+        "timeout": int(pragmas.get("busy_timeout", 5000)) / 1000,
+    }
+    connect_args.update(kwargs.pop("connect_args", {}))
+    options = {**_pool_options(url), **kwargs}
+    sqlite_engine = create_engine(url, echo=False, connect_args=connect_args, **options)
+
+    @event.listens_for(sqlite_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return sqlite_engine
+
+
+engine = create_sqlite_engine(DB_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
-    # Create tables
+    """Prepara o banco uma vez por processo (startup/seed): diretório + migrações pendentes."""
     DB_Path.parent.mkdir(parents=True, exist_ok=True)
-    Base.metadata.create_all(bind=engine)
+    return run_migrations(engine)
 
 def get_db():
     db = SessionLocal()
@@ -3,11 +3,16 @@ Export de escala em formato calendário (HTML/Markdown) e resumo semanal.
 Conforme PRD: fácil de compartilhar, imprimir e colar na parede.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import date, timedelta
-from typing import Dict, List, Any
+from typing import Dict, Iterable, Iterator, List, Any, Optional
+import os
+import numpy as np
 import pandas as pd
 
+from apps.backend.src.domain.aggregates import ScheduleAggregates, target_profile
+
 
 # Labels curtos para calendário (economia de espaço)
 SHIFT_SHORT: Dict[str, str] = {
@@ -22,6 +27,43 @@ SHIFT_SHORT: Dict[str, str] = {
 }
 
 
+# Cabeçalho do HTML (até a grade); str.format com period_start, period_end e week_definition.
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>EscalaFlow — {period_start} a {period_end}</title>
+<style>
+* {{ box-sizing: border-box; }}
+body {{ font-family: system-ui, sans-serif; margin: 20px; color: #333; }}
+h1 {{ font-size: 1.5rem; margin-bottom: 0.5rem; }}
+.meta {{ color: #666; font-size: 0.9rem; margin-bottom: 1.5rem; }}
+.calendar-grid {{ border-collapse: collapse; width: 100%; font-size: 0.85rem; margin-bottom: 2rem; }}
+.calendar-grid th, .calendar-grid td {{ border: 1px solid #ccc; padding: 6px 8px; text-align: center; }}
+.calendar-grid th {{ background: #f5f5f5; font-weight: 600; }}
+.calendar-grid .col-date {{ min-width: 50px; }}
+.cell-work {{ background: #e8f5e9; }}
+.cell-folga {{ background: #fff3e0; }}
+.cell-dom {{ background: #e3f2fd; }}
+.cell-absence {{ background: #ffebee; }}
+.cell-empty {{ background: #fafafa; color: #999; }}
+.weekly-block {{ margin-bottom: 1.5rem; }}
+.weekly-table {{ border-collapse: collapse; font-size: 0.9rem; }}
+.weekly-table th, .weekly-table td {{ border: 1px solid #ccc; padding: 6px 10px; text-align: left; }}
+.weekly-table .ok {{ color: #2e7d32; }}
+.weekly-table .warn {{ color: #c62828; }}
+.violations {{ margin-top: 1.5rem; padding: 1rem; background: #fff8e1; border-radius: 8px; }}
+.violations ul {{ margin: 0; padding-left: 1.2rem; }}
+@media print {{ body {{ margin: 0; }} .calendar-grid {{ page-break-inside: avoid; }} }}
+</style>
+</head>
+<body>
+<h1>EscalaFlow</h1>
+<p class="meta">Período: {period_start} a {period_end} | Corte: {week_definition}</p>
+"""
+
+
 def _cell_value(row: dict) -> str:
     """Retorna valor da célula para calendário: turno ou FOL."""
     status = row.get("status", "")
@@ -30,36 +72,107 @@ def _cell_value(row: dict) -> str:
         return "FOL"
     if status == "ABSENCE":
         return "AUS"
-    if shift:
+    if isinstance(shift, str) and shift:
         return SHIFT_SHORT.get(shift, shift[:6] if len(shift) > 6 else shift)
     return "—"
 
 
+def _cell_css(status: str, shift: Any) -> str:
+    if status == "FOLGA":
+        return "cell-folga"
+    if status == "ABSENCE":
+        return "cell-absence"
+    if "DOM" in str(shift):
+        return "cell-dom"
+    return "cell-work"
+
+
+@dataclass(frozen=True)
+class CalendarGrid:
+    """
+    Grade do calendário (data x colaborador) montada uma vez e lida pelo HTML e pelo Markdown.
+
+    `cells[i, j]`: índice em `labels`/`classes` da célula de `dates[i]` e `employees[j]`
+    (primeira alocação do par; sem alocação: "—" / cell-empty). Como há poucas combinações
+    status/turno, o texto só é materializado linha a linha em `rows()`.
+    Colaboradores ordenados pelo nome.
+    """
+    dates: List[pd.Timestamp]
+    employees: List[str]
+    cells: np.ndarray
+    labels: np.ndarray
+    classes: np.ndarray
+
+    @classmethod
+    def from_assignments(cls, assignments_df: pd.DataFrame, employee_names: Optional[Dict[str, str]] = None) -> "CalendarGrid":
+        emp_names = employee_names or {}
+        work_dates = pd.to_datetime(assignments_df["work_date"])
+        employee_ids = assignments_df["employee_id"]
+        dates = sorted(work_dates.drop_duplicates().tolist())
+        employees = sorted(employee_ids.unique().tolist(), key=lambda x: emp_names.get(x, x))
+
+        date_pos = pd.Index(dates).get_indexer(work_dates)
+        emp_pos = pd.Index(employees).get_indexer(employee_ids)
+        # Primeira linha de cada (data, colaborador).
+        _, first = np.unique(date_pos.astype(np.int64) * max(len(employees), 1) + emp_pos, return_index=True)
+
+        keys = pd.DataFrame({
+            "status": assignments_df["status"].to_numpy()[first] if "status" in assignments_df.columns else [""] * len(first),
+            "shift_code": assignments_df["shift_code"].to_numpy()[first] if "shift_code" in assignments_df.columns else [""] * len(first),
+        })
+        combo = keys.groupby(["status", "shift_code"], sort=False, dropna=False).ngroup().to_numpy()
+        combos = keys.drop_duplicates().itertuples(index=False)
+        labels, classes = ["—"], ["cell-empty"]
+        for status, shift in combos:
+            labels.append(_cell_value({"status": status, "shift_code": shift}))
+            classes.append(_cell_css(status, shift))
+
+        cells = np.zeros((len(dates), len(employees)), dtype=np.int32)
+        cells[date_pos[first], emp_pos[first]] = combo + 1
+        return cls(
+            dates=dates,
+            employees=employees,
+            cells=cells,
+            labels=np.array(labels, dtype=object),
+            classes=np.array(classes, dtype=object),
+        )
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.labels[self.cells]
+
+    @property
+    def css(self) -> np.ndarray:
+        return self.classes[self.cells]
+
+    def rows(self) -> Iterator[tuple]:
+        """(data, textos, classes) por dia, materializando uma linha por vez."""
+        for d, codes in zip(self.dates, self.cells):
+            yield d, self.labels[codes], self.classes[codes]
+
+
 def _build_weekly_summary(
     df: pd.DataFrame,
-    contract_targets: Dict[str, int],
+    contract_targets: Dict[str, Any],
     week_definition: str = "MON_SUN",
+    aggregates: Optional[ScheduleAggregates] = None,
 ) -> List[Dict[str, Any]]:
-    """Resumo por semana: horas de cada colaborador vs contrato."""
+    """Resumo por semana: horas de cada colaborador vs contrato (meta em minutos ou perfil de contrato)."""
     if df.empty:
         return []
-    df = df.copy()
-    df["work_date"] = pd.to_datetime(df["work_date"])
-    if week_definition == "MON_SUN":
-        df["week_start"] = df["work_date"] - pd.to_timedelta(df["work_date"].dt.weekday, unit="D")
-    else:
-        df["week_start"] = df["work_date"] - pd.to_timedelta((df["work_date"].dt.weekday + 1) % 7, unit="D")
-    grouped = df.groupby(["employee_id", "week_start"])["minutes"].sum().reset_index()
+    if aggregates is None:
+        aggregates = ScheduleAggregates.from_assignments(df)
+    weekly = aggregates.weekly_totals("MON_SUN" if week_definition == "MON_SUN" else "SUN_SAT")
     rows = []
-    for _, r in grouped.iterrows():
-        target = contract_targets.get(r["employee_id"], 2640)
-        actual = int(r["minutes"])
+    for employee_id, week_start, minutes in zip(weekly["employee_id"], weekly["week_start"], weekly["minutes"]):
+        target, _ = target_profile(contract_targets.get(employee_id, 2640))
+        actual = int(minutes)
         delta = actual - target
         ok = abs(delta) <= 120
         rows.append({
-            "employee_id": r["employee_id"],
-            "week_start": r["week_start"].date(),
-            "week_end": (r["week_start"] + timedelta(days=6)).date(),
+            "employee_id": employee_id,
+            "week_start": week_start,
+            "week_end": week_start + timedelta(days=6),
             "actual_minutes": actual,
             "target_minutes": target,
             "delta": delta,
@@ -68,18 +181,32 @@ def _build_weekly_summary(
     return rows
 
 
-def export_markdown(
+def _weeks(weekly: List[Dict[str, Any]]) -> List[tuple]:
+    """(week_start, week_end, linhas) por semana, em ordem, preservando a ordem das linhas."""
+    by_week: Dict[tuple, List[Dict[str, Any]]] = {}
+    for r in weekly:
+        by_week.setdefault((r["week_start"], r["week_end"]), []).append(r)
+    return [(ws, we, by_week[(ws, we)]) for ws, we in sorted(by_week)]
+
+
+def _joined(lines: Iterable[str], sep: str = "\n") -> Iterator[str]:
+    """Equivalente incremental de `sep.join(lines)`."""
+    for i, line in enumerate(lines):
+        yield line if i == 0 else sep + line
+
+
+def _markdown_lines(
     assignments_df: pd.DataFrame,
     violations: List,
-    contract_targets: Dict[str, int],
+    contract_targets: Dict[str, Any],
     period_start: date,
     period_end: date,
-    employee_names: Dict[str, str] = None,
-    week_definition: str = "MON_SUN",
-) -> str:
-    """Gera Markdown com calendário dia a dia e resumo por semana."""
-    emp_names = employee_names or {}
-    lines = [
+    emp_names: Dict[str, str],
+    week_definition: str,
+    aggregates: Optional[ScheduleAggregates],
+    grid: CalendarGrid,
+) -> Iterator[str]:
+    yield from [
         "# EscalaFlow",
         "",
         f"**Período:** {period_start} a {period_end}",
@@ -90,182 +217,168 @@ def export_markdown(
         "## Calendário (dia a dia)",
         "",
     ]
-    # Agrupar por data
-    df = assignments_df.copy()
-    df["work_date"] = pd.to_datetime(df["work_date"])
-    dates = sorted(df["work_date"].drop_duplicates().tolist())
-    employees = sorted(df["employee_id"].unique().tolist(), key=lambda x: emp_names.get(x, x))
     # Cabeçalho
-    header = "| Data | " + " | ".join(emp_names.get(e, e) for e in employees) + " |"
-    sep = "|" + "---|" * (len(employees) + 1)
-    lines.append(header)
-    lines.append(sep)
-    for d in dates:
-        row_vals = [d.strftime("%d/%m") if hasattr(d, "strftime") else str(d)]
-        for emp in employees:
-            r = df[(df["work_date"] == d) & (df["employee_id"] == emp)]
-            val = _cell_value(r.iloc[0].to_dict()) if len(r) > 0 else "—"
-            row_vals.append(val)
-        lines.append("| " + " | ".join(row_vals) + " |")
-    lines.extend(["", "**Legenda:** CAI1–CAI6 = turnos, DOM = domingo 4h30, FOL = folga, AUS = ausência", ""])
+    yield "| Data | " + " | ".join(emp_names.get(e, e) for e in grid.employees) + " |"
+    yield "|" + "---|" * (len(grid.employees) + 1)
+    for d, values, _ in grid.rows():
+        yield "| " + " | ".join([d.strftime("%d/%m"), *values]) + " |"
+    yield from ["", "**Legenda:** CAI1–CAI6 = turnos, DOM = domingo 4h30, FOL = folga, AUS = ausência", ""]
 
     # Resumo semanal
-    weekly = _build_weekly_summary(assignments_df, contract_targets, week_definition)
+    weekly = _build_weekly_summary(assignments_df, contract_targets, week_definition, aggregates)
     if weekly:
-        lines.extend(["---", "", "## Resumo por semana", ""])
-        weeks = sorted(set((w["week_start"], w["week_end"]) for w in weekly))
-        for ws, we in weeks:
-            week_rows = [r for r in weekly if r["week_start"] == ws]
-            lines.append(f"### Semana {ws} a {we}")
-            lines.append("")
-            lines.append("| Colaborador | Real | Meta | Δ | Status |")
-            lines.append("|-------------|------|------|---|--------|")
+        yield from ["---", "", "## Resumo por semana", ""]
+        for ws, we, week_rows in _weeks(weekly):
+            yield f"### Semana {ws} a {we}"
+            yield ""
+            yield "| Colaborador | Real | Meta | Δ | Status |"
+            yield "|-------------|------|------|---|--------|"
             for r in week_rows:
                 nome = emp_names.get(r["employee_id"], r["employee_id"])
                 status = "✓" if r["ok"] else f"⚠ {r['delta']:+}"
-                lines.append(f"| {nome} | {r['actual_minutes']} min | {r['target_minutes']} min | {r['delta']:+} | {status} |")
-            lines.append("")
+                yield f"| {nome} | {r['actual_minutes']} min | {r['target_minutes']} min | {r['delta']:+} | {status} |"
+            yield ""
 
     # Violações
     if violations:
-        lines.extend(["---", "", "## Violações de conformidade", ""])
+        yield from ["---", "", "## Violações de conformidade", ""]
         for v in violations:
             emp = getattr(v, "employee_id", "?")
             detail = getattr(v, "detail", "")
-            lines.append(f"- **{emp_names.get(emp, emp)}:** {detail}")
-        lines.append("")
+            yield f"- **{emp_names.get(emp, emp)}:** {detail}"
+        yield ""
 
-    return "\n".join(lines)
+
+def iter_markdown(
+    assignments_df: pd.DataFrame,
+    violations: List,
+    contract_targets: Dict[str, Any],
+    period_start: date,
+    period_end: date,
+    employee_names: Dict[str, str] = None,
+    week_definition: str = "MON_SUN",
+    aggregates: Optional[ScheduleAggregates] = None,
+    grid: Optional[CalendarGrid] = None,
+) -> Iterator[str]:
+    """Markdown do calendário em pedaços (linha a linha), para gravar/transmitir sem montar o documento."""
+    emp_names = employee_names or {}
+    if grid is None:
+        grid = CalendarGrid.from_assignments(assignments_df, emp_names)
+    lines = _markdown_lines(
+        assignments_df, violations, contract_targets, period_start, period_end, emp_names, week_definition, aggregates, grid
+    )
+    return _joined(lines)
 
 
-def export_html(
+def export_markdown(
     assignments_df: pd.DataFrame,
     violations: List,
-    contract_targets: Dict[str, int],
+    contract_targets: Dict[str, Any],
     period_start: date,
     period_end: date,
     employee_names: Dict[str, str] = None,
     week_definition: str = "MON_SUN",
+    aggregates: Optional[ScheduleAggregates] = None,
+    grid: Optional[CalendarGrid] = None,
 ) -> str:
-    """Gera HTML com calendário estilo grade para impressão/cola na parede."""
+    """Gera Markdown com calendário dia a dia e resumo por semana."""
+    return "".join(iter_markdown(
+        assignments_df, violations, contract_targets, period_start, period_end, employee_names, week_definition, aggregates, grid
+    ))
+
+
+def iter_html(
+    assignments_df: pd.DataFrame,
+    violations: List,
+    contract_targets: Dict[str, Any],
+    period_start: date,
+    period_end: date,
+    employee_names: Dict[str, str] = None,
+    week_definition: str = "MON_SUN",
+    aggregates: Optional[ScheduleAggregates] = None,
+    grid: Optional[CalendarGrid] = None,
+) -> Iterator[str]:
+    """HTML do calendário em pedaços (cabeçalho, uma linha da grade por dia, uma semana por bloco)."""
     emp_names = employee_names or {}
-    df = assignments_df.copy()
-    df["work_date"] = pd.to_datetime(df["work_date"])
-    dates = sorted(df["work_date"].drop_duplicates().tolist())
-    employees = sorted(df["employee_id"].unique().tolist(), key=lambda x: emp_names.get(x, x))
-
-    # Build grid
-    rows_html = []
-    for d in dates:
-        cells = []
-        for emp in employees:
-            r = df[(df["work_date"] == d) & (df["employee_id"] == emp)]
-            if len(r) == 0:
-                val, css = "—", "cell-empty"
-            else:
-                row_dict = r.iloc[0].to_dict()
-                val = _cell_value(row_dict)
-                status = row_dict.get("status", "")
-                if status == "FOLGA":
-                    css = "cell-folga"
-                elif status == "ABSENCE":
-                    css = "cell-absence"
-                elif "DOM" in str(row_dict.get("shift_code", "")):
-                    css = "cell-dom"
-                else:
-                    css = "cell-work"
-            cells.append(f'<td class="{css}">{val}</td>')
-        day_str = d.strftime("%d/%m") if hasattr(d, "strftime") else str(d)
-        weekday = d.strftime("%a") if hasattr(d, "strftime") else ""
-        rows_html.append(f'<tr><th class="col-date">{day_str}<br><small>{weekday}</small></th>' + "".join(cells) + "</tr>")
-
-    header_cells = "".join(f'<th>{emp_names.get(e, e)}</th>' for e in employees)
-    grid = f'<table class="calendar-grid"><thead><tr><th>Data</th>{header_cells}</tr></thead><tbody>' + "".join(rows_html) + "</tbody></table>"
+    if grid is None:
+        grid = CalendarGrid.from_assignments(assignments_df, emp_names)
+
+    yield _HTML_HEAD.format(period_start=period_start, period_end=period_end, week_definition=week_definition)
+
+    header_cells = "".join(f'<th>{emp_names.get(e, e)}</th>' for e in grid.employees)
+    yield f'<table class="calendar-grid"><thead><tr><th>Data</th>{header_cells}</tr></thead><tbody>'
+    for d, values, classes in grid.rows():
+        cells = "".join(f'<td class="{css}">{val}</td>' for val, css in zip(values, classes))
+        yield f'<tr><th class="col-date">{d.strftime("%d/%m")}<br><small>{d.strftime("%a")}</small></th>' + cells + "</tr>"
+    yield "</tbody></table>\n"
 
     # Semanal
-    weekly = _build_weekly_summary(assignments_df, contract_targets, week_definition)
-    weekly_html = ""
-    if weekly:
-        weeks = sorted(set((w["week_start"], w["week_end"]) for w in weekly))
-        for ws, we in weeks:
-            week_rows = [r for r in weekly if r["week_start"] == ws]
-            rows_ww = []
-            for r in week_rows:
-                nome = emp_names.get(r["employee_id"], r["employee_id"])
-                status_class = "ok" if r["ok"] else "warn"
-                rows_ww.append(f'<tr><td>{nome}</td><td>{r["actual_minutes"]} min</td><td>{r["target_minutes"]} min</td><td>{r["delta"]:+}</td><td class="{status_class}">{"✓" if r["ok"] else "⚠"}</td></tr>')
-            weekly_html += f'<div class="weekly-block"><h3>Semana {ws} a {we}</h3><table class="weekly-table"><thead><tr><th>Colaborador</th><th>Real</th><th>Meta</th><th>Δ</th><th>Status</th></tr></thead><tbody>' + "".join(rows_ww) + "</tbody></table></div>"
+    yield '<div class="weekly-summary">\n<h2>Resumo por semana</h2>\n'
+    weekly = _build_weekly_summary(assignments_df, contract_targets, week_definition, aggregates)
+    for ws, we, week_rows in _weeks(weekly):
+        rows_ww = []
+        for r in week_rows:
+            nome = emp_names.get(r["employee_id"], r["employee_id"])
+            status_class = "ok" if r["ok"] else "warn"
+            rows_ww.append(f'<tr><td>{nome}</td><td>{r["actual_minutes"]} min</td><td>{r["target_minutes"]} min</td><td>{r["delta"]:+}</td><td class="{status_class}">{"✓" if r["ok"] else "⚠"}</td></tr>')
+        yield f'<div class="weekly-block"><h3>Semana {ws} a {we}</h3><table class="weekly-table"><thead><tr><th>Colaborador</th><th>Real</th><th>Meta</th><th>Δ</th><th>Status</th></tr></thead><tbody>' + "".join(rows_ww) + "</tbody></table></div>"
+    yield "\n</div>\n"
 
-    viol_html = ""
     if violations:
         viol_items = []
         for v in violations:
             emp = getattr(v, "employee_id", "?")
             detail = getattr(v, "detail", "")
             viol_items.append(f"<li><strong>{emp_names.get(emp, emp)}:</strong> {detail}</li>")
-        viol_html = f'<div class="violations"><h3>Violações</h3><ul>{"".join(viol_items)}</ul></div>'
+        yield f'<div class="violations"><h3>Violações</h3><ul>{"".join(viol_items)}</ul></div>'
+    yield "\n</body>\n</html>"
 
-    html = f"""<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>EscalaFlow — {period_start} a {period_end}</title>
-<style>
-* {{ box-sizing: border-box; }}
-body {{ font-family: system-ui, sans-serif; margin: 20px; color: #333; }}
-h1 {{ font-size: 1.5rem; margin-bottom: 0.5rem; }}
-.meta {{ color: #666; font-size: 0.9rem; margin-bottom: 1.5rem; }}
-.calendar-grid {{ border-collapse: collapse; width: 100%; font-size: 0.85rem; margin-bottom: 2rem; }}
-.calendar-grid th, .calendar-grid td {{ border: 1px solid #ccc; padding: 6px 8px; text-align: center; }}
-.calendar-grid th {{ background: #f5f5f5; font-weight: 600; }}
-.calendar-grid .col-date {{ min-width: 50px; }}
-.cell-work {{ background: #e8f5e9; }}
-.cell-folga {{ background: #fff3e0; }}
-.cell-dom {{ background: #e3f2fd; }}
-.cell-absence {{ background: #ffebee; }}
-.cell-empty {{ background: #fafafa; color: #999; }}
-.weekly-block {{ margin-bottom: 1.5rem; }}
-.weekly-table {{ border-collapse: collapse; font-size: 0.9rem; }}
-.weekly-table th, .weekly-table td {{ border: 1px solid #ccc; padding: 6px 10px; text-align: left; }}
-.weekly-table .ok {{ color: #2e7d32; }}
-.weekly-table .warn {{ color: #c62828; }}
-.violations {{ margin-top: 1.5rem; padding: 1rem; background: #fff8e1; border-radius: 8px; }}
-.violations ul {{ margin: 0; padding-left: 1.2rem; }}
-@media print {{ body {{ margin: 0; }} .calendar-grid {{ page-break-inside: avoid; }} }}
-</style>
-</head>
-<body>
-<h1>EscalaFlow</h1>
-<p class="meta">Período: {period_start} a {period_end} | Corte: {week_definition}</p>
-{grid}
-<div class="weekly-summary">
-<h2>Resumo por semana</h2>
-{weekly_html}
-</div>
-{viol_html}
-</body>
-</html>"""
-    return html
+
+def export_html(
+    assignments_df: pd.DataFrame,
+    violations: List,
+    contract_targets: Dict[str, Any],
+    period_start: date,
+    period_end: date,
+    employee_names: Dict[str, str] = None,
+    week_definition: str = "MON_SUN",
+    aggregates: Optional[ScheduleAggregates] = None,
+    grid: Optional[CalendarGrid] = None,
+) -> str:
+    """Gera HTML com calendário estilo grade para impressão/cola na parede."""
+    return "".join(iter_html(
+        assignments_df, violations, contract_targets, period_start, period_end, employee_names, week_definition, aggregates, grid
+    ))
+
+
+def _write_chunks(path: Path, chunks: Iterable[str]) -> None:
+    """Grava em `<arquivo>.tmp` e troca no fim: quem baixa o export nunca lê um arquivo pela metade."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        fh.writelines(chunks)
+    os.replace(tmp_path, path)
 
 
 def export_calendar_files(
     output_path: Path,
     assignments_df: pd.DataFrame,
     violations: List,
-    contract_targets: Dict[str, int],
+    contract_targets: Dict[str, Any],
     period_start: date,
     period_end: date,
     employee_names: Dict[str, str] = None,
     week_definition: str = "MON_SUN",
+    aggregates: Optional[ScheduleAggregates] = None,
 ) -> Dict[str, Path]:
-    """Exporta HTML e Markdown para o output_path. Retorna paths dos arquivos gerados."""
+    """Exporta HTML e Markdown para o output_path (gravados em pedaços). Retorna paths dos arquivos gerados."""
     output_path.mkdir(parents=True, exist_ok=True)
     emp_names = employee_names or {}
-    md = export_markdown(assignments_df, violations, contract_targets, period_start, period_end, emp_names, week_definition)
-    html = export_html(assignments_df, violations, contract_targets, period_start, period_end, emp_names, week_definition)
+    if aggregates is None:
+        aggregates = ScheduleAggregates.from_assignments(assignments_df)
+    grid = CalendarGrid.from_assignments(assignments_df, emp_names)
+    args = (assignments_df, violations, contract_targets, period_start, period_end, emp_names, week_definition, aggregates, grid)
     md_path = output_path / "escala_calendario.md"
     html_path = output_path / "escala_calendario.html"
-    md_path.write_text(md, encoding="utf-8")
-    html_path.write_text(html, encoding="utf-8")
+    _write_chunks(md_path, iter_markdown(*args))
+    _write_chunks(html_path, iter_html(*args))
     return {"markdown": md_path, "html": html_path}
@@ -1,5 +1,7 @@
-from typing import List, Dict, Optional
+from typing import Any, Iterable, List, Dict, Optional, Sequence
 from datetime import date
+from sqlalchemy import Select, Table, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 import pandas as pd
 from apps.backend.src.domain.models import Employee, PreferenceRequest, RequestType, RequestDecision, Shift, ShiftDayScope, ScheduleException, ExceptionType, DemandSlot
@@ -10,12 +12,102 @@ from apps.backend.src.infrastructure.database.orm_models import (
     ContractORM,
     GovernanceAuditEventORM,
 )
-from apps.backend.src.infrastructure.database.extended_orm import ShiftORM, CycleTemplateORM, SundayRotationORM, ExceptionORM, DemandProfileORM
+from apps.backend.src.infrastructure.database.extended_orm import (
+    ShiftORM,
+    CycleTemplateORM,
+    SundayRotationORM,
+    ExceptionORM,
+    DemandProfileORM,
+    ScheduleRunORM,
+    ScheduleAssignmentORM,
+    ScheduleViolationORM,
+)
+
+EXCEPTION_KEY = ("sector_id", "employee_id", "exception_date", "exception_type")
+DEMAND_SLOT_KEY = ("sector_id", "work_date", "slot_start")
+
+# Valores por `IN (...)`: abaixo do limite de variáveis do SQLite (999 em versões antigas).
+IN_CHUNK_SIZE = 500
+
+# Gerações oficiais mantidas por setor (a mais recente é a oficial; as anteriores ficam para auditoria).
+SCHEDULE_RUNS_KEPT = 10
+
+# Colunas legíveis de schedule_assignments / schedule_violations (projeção em load_schedule_*_df).
+SCHEDULE_ASSIGNMENT_COLUMNS = ("work_date", "employee_id", "status", "shift_code", "minutes", "source_rule")
+SCHEDULE_VIOLATION_COLUMNS = ("employee_id", "rule_code", "severity", "date_start", "date_end", "detail")
+
+
+def _python_dates(values: pd.Series) -> list:
+    """Coluna de datas (str/date/Timestamp, com nulos) -> `datetime.date` ou None (exigência do SQLite)."""
+    parsed = pd.to_datetime(values)
+    return [d.date() if pd.notna(d) else None for d in parsed]
+
+
+def _optional_strings(values: pd.Series) -> list:
+    """Coluna de texto com vazios/NaN -> str ou None."""
+    return [str(v) if pd.notna(v) and str(v) != "" else None for v in values]
+
 
 class SqlAlchemyRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    # Bulk write layer: um INSERT por lote (executemany), sem objetos ORM por linha.
+    def _bulk_insert(
+        self,
+        table: Table,
+        rows: List[Dict[str, Any]],
+        conflict_key: Optional[Sequence[str]] = None,
+        update_columns: Iterable[str] = (),
+        returning: Sequence[str] = (),
+    ) -> List[tuple]:
+        """
+        Insere `rows` em lote. Com `conflict_key` (índice único): ON CONFLICT DO NOTHING,
+        ou DO UPDATE das `update_columns` (a última linha repetida do lote prevalece).
+        Com `returning`, devolve essas colunas das linhas efetivamente gravadas.
+        Não faz commit.
+        """
+        if not rows:
+            return []
+        stmt = sqlite_insert(table)
+        if conflict_key:
+            update_columns = list(update_columns)
+            if update_columns:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(conflict_key),
+                    set_={col: stmt.excluded[col] for col in update_columns},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_key))
+        if returning:
+            stmt = stmt.returning(*(table.c[col] for col in returning))
+            return [tuple(row) for row in self.session.execute(stmt, rows)]
+        self.session.execute(stmt, rows)
+        return []
+
+    @staticmethod
+    def _inserted_flags(keys: List[tuple], inserted: Iterable[tuple]) -> List[bool]:
+        """True para a primeira ocorrência de cada chave gravada; repetições e já existentes -> False."""
+        pending = set(inserted)
+        flags = []
+        for key in keys:
+            flags.append(key in pending)
+            pending.discard(key)
+        return flags
+
+    def existing_employee_ids(self, employee_ids: Iterable[str]) -> set:
+        """Subconjunto de `employee_ids` cadastrado (uma consulta por lote de `IN_CHUNK_SIZE` IDs)."""
+        ids = sorted(set(employee_ids))
+        found: set = set()
+        for start in range(0, len(ids), IN_CHUNK_SIZE):
+            chunk = ids[start:start + IN_CHUNK_SIZE]
+            found.update(self.session.scalars(select(EmployeeORM.employee_id).where(EmployeeORM.employee_id.in_(chunk))))
+        return found
+
+    def _read_frame(self, stmt: Select) -> pd.DataFrame:
+        """Executa um select() de colunas direto para DataFrame, sem instâncias ORM nem dicts por linha."""
+        return pd.read_sql(stmt, self.session.connection())
+
     def load_employees(self) -> Dict[str, Employee]:
         # Fetch active or all? Let's fetch all active.
         orm_employees = self.session.query(EmployeeORM).filter(EmployeeORM.active == True).all()
@@ -52,35 +144,38 @@ class SqlAlchemyRepository:
     
     def load_contract_targets(self, sector_id: str = "CAIXA") -> Dict[str, int]:
         """Retorna mapeamento employee_id -> weekly_minutes para validação de meta semanal."""
-        orm_emps = self.session.query(EmployeeORM).filter(
-            EmployeeORM.active == True,
-            EmployeeORM.sector_id == sector_id
+        rows = self.session.execute(
+            select(EmployeeORM.employee_id, ContractORM.weekly_minutes)
+            .outerjoin(ContractORM, ContractORM.contract_code == EmployeeORM.contract_code)
+            .where(EmployeeORM.active == True, EmployeeORM.sector_id == sector_id)
         ).all()
-        orm_contracts = {c.contract_code: c.weekly_minutes for c in self.session.query(ContractORM).all()}
-        return {e.employee_id: orm_contracts.get(e.contract_code, 2640) for e in orm_emps}
+        return {employee_id: weekly_minutes if weekly_minutes is not None else 2640 for employee_id, weekly_minutes in rows}
 
     def load_contract_profiles(self, sector_id: str = "CAIXA") -> Dict[str, Dict[str, int | str]]:
         """Retorna mapeamento employee_id -> {contract_code, weekly_minutes, max_consecutive_sundays}."""
-        orm_emps = self.session.query(EmployeeORM).filter(
-            EmployeeORM.active == True,
-            EmployeeORM.sector_id == sector_id
+        # Um join só com os contratos usados pelo setor (sem carregar o catálogo inteiro).
+        rows = self.session.execute(
+            select(
+                EmployeeORM.employee_id,
+                EmployeeORM.contract_code,
+                ContractORM.contract_code.label("known_contract"),
+                ContractORM.weekly_minutes,
+                ContractORM.max_consecutive_sundays,
+            )
+            .outerjoin(ContractORM, ContractORM.contract_code == EmployeeORM.contract_code)
+            .where(EmployeeORM.active == True, EmployeeORM.sector_id == sector_id)
         ).all()
-        orm_contracts = {
-            c.contract_code: {
-                "contract_code": c.contract_code, 
-                "weekly_minutes": c.weekly_minutes,
-                "max_consecutive_sundays": c.max_consecutive_sundays or 2
-            }
-            for c in self.session.query(ContractORM).all()
-        }
         result: Dict[str, Dict[str, int | str]] = {}
-        for e in orm_emps:
-            profile = orm_contracts.get(e.contract_code, {
-                "contract_code": e.contract_code, 
-                "weekly_minutes": 2640,
-                "max_consecutive_sundays": 2
-            })
-            result[e.employee_id] = profile
+        for employee_id, contract_code, known_contract, weekly_minutes, max_consecutive_sundays in rows:
+            if known_contract is None:
+                profile = {"contract_code": contract_code, "weekly_minutes": 2640, "max_consecutive_sundays": 2}
+            else:
+                profile = {
+                    "contract_code": known_contract,
+                    "weekly_minutes": weekly_minutes,
+                    "max_consecutive_sundays": max_consecutive_sundays or 2,
+                }
+            result[employee_id] = profile
         return result
 
     def add_governance_audit_event(
@@ -191,6 +286,29 @@ class SqlAlchemyRepository:
                 note=req.note
             ))
             self.session.commit()
+
+    def add_preferences_bulk(self, requests: List[PreferenceRequest]) -> List[bool]:
+        """Insere pedidos em lote (um INSERT, um commit). Retorna, por item, se foi gravado (request_id novo)."""
+        inserted = self._bulk_insert(
+            PreferenceORM.__table__,
+            [
+                {
+                    "request_id": req.request_id,
+                    "employee_id": req.employee_id,
+                    "request_date": req.request_date,
+                    "request_type": req.request_type.value,
+                    "priority": req.priority,
+                    "target_shift_code": req.target_shift_code,
+                    "note": req.note,
+                    "decision": RequestDecision.PENDING.value,
+                }
+                for req in requests
+            ],
+            conflict_key=("request_id",),
+            returning=("request_id",),
+        )
+        self.session.commit()
+        return self._inserted_flags([(req.request_id,) for req in requests], inserted)
     
     def update_preference_decision(self, request_id: str, decision: RequestDecision, reason: str):
          pref = self.session.get(PreferenceORM, request_id)
@@ -200,44 +318,66 @@ class SqlAlchemyRepository:
              self.session.commit()
 
     # Exceptions (férias, atestado, trocas, bloqueios)
-    def load_exceptions(self, sector_id: str = None, period_start=None, period_end=None) -> list:
-        """Carrega exceções, opcionalmente filtradas por setor e período."""
-        q = self.session.query(ExceptionORM)
+    def load_exceptions_df(self, sector_id: str = None, period_start=None, period_end=None) -> pd.DataFrame:
+        """Exceções em colunas (sector_id, employee_id, exception_date, exception_type, note), filtradas por setor e período."""
+        stmt = select(
+            ExceptionORM.sector_id,
+            ExceptionORM.employee_id,
+            ExceptionORM.exception_date,
+            ExceptionORM.exception_type,
+            ExceptionORM.note,
+        )
         if sector_id:
-            q = q.filter(ExceptionORM.sector_id == sector_id)
+            stmt = stmt.where(ExceptionORM.sector_id == sector_id)
         if period_start:
-            q = q.filter(ExceptionORM.exception_date >= period_start)
+            stmt = stmt.where(ExceptionORM.exception_date >= period_start)
         if period_end:
-            q = q.filter(ExceptionORM.exception_date <= period_end)
-        rows = q.all()
+            stmt = stmt.where(ExceptionORM.exception_date <= period_end)
+        return self._read_frame(stmt)
+
+    def load_exceptions(self, sector_id: str = None, period_start=None, period_end=None) -> list:
+        """Carrega exceções, opcionalmente filtradas por setor e período."""
+        df = self.load_exceptions_df(sector_id, period_start, period_end)
         return [
             ScheduleException(
-                sector_id=r.sector_id,
-                employee_id=r.employee_id,
-                exception_date=r.exception_date,
-                exception_type=ExceptionType(r.exception_type),
-                note=r.note or ""
+                sector_id=sector,
+                employee_id=employee_id,
+                exception_date=exception_date,
+                exception_type=ExceptionType(exception_type),
+                note=note or ""
+            )
+            for sector, employee_id, exception_date, exception_type, note in zip(
+                df["sector_id"], df["employee_id"], df["exception_date"], df["exception_type"], df["note"]
             )
-            for r in rows
         ]
 
     def add_exception(self, exc: ScheduleException):
         """Adiciona exceção (evita duplicata por sector+employee+date+type)."""
-        existing = self.session.query(ExceptionORM).filter(
-            ExceptionORM.sector_id == exc.sector_id,
-            ExceptionORM.employee_id == exc.employee_id,
-            ExceptionORM.exception_date == exc.exception_date,
-            ExceptionORM.exception_type == exc.exception_type.value,
-        ).first()
-        if not existing:
-            self.session.add(ExceptionORM(
-                sector_id=exc.sector_id,
-                employee_id=exc.employee_id,
-                exception_date=exc.exception_date,
-                exception_type=exc.exception_type.value,
-                note=exc.note
-            ))
-            self.session.commit()
+        self.add_exceptions_bulk([exc])
+
+    def add_exceptions_bulk(self, exceptions: List[ScheduleException]) -> List[bool]:
+        """
+        Insere exceções em lote; repetições da chave natural são ignoradas (vale a existente).
+        Retorna, por item, se foi gravado.
+        """
+        inserted = self._bulk_insert(
+            ExceptionORM.__table__,
+            [
+                {
+                    "sector_id": exc.sector_id,
+                    "employee_id": exc.employee_id,
+                    "exception_date": exc.exception_date,
+                    "exception_type": exc.exception_type.value,
+                    "note": exc.note,
+                }
+                for exc in exceptions
+            ],
+            conflict_key=EXCEPTION_KEY,
+            returning=EXCEPTION_KEY,
+        )
+        self.session.commit()
+        keys = [(e.sector_id, e.employee_id, e.exception_date, e.exception_type.value) for e in exceptions]
+        return self._inserted_flags(keys, inserted)
 
     def remove_exception(self, sector_id: str, employee_id: str, exception_date, exception_type: str) -> bool:
         """Remove exceção específica."""
@@ -251,39 +391,48 @@ class SqlAlchemyRepository:
         return deleted > 0
 
     # Demand profile (cobertura por faixa horária)
-    def load_demand_profile(self, sector_id: str, period_start=None, period_end=None) -> list:
-        """Carrega demand_profile para validação de cobertura."""
-        q = self.session.query(DemandProfileORM).filter(DemandProfileORM.sector_id == sector_id)
+    def load_demand_profile_df(self, sector_id: str, period_start=None, period_end=None) -> pd.DataFrame:
+        """demand_profile em colunas (sector_id, work_date, slot_start, min_required) para validação de cobertura."""
+        stmt = select(
+            DemandProfileORM.sector_id,
+            DemandProfileORM.work_date,
+            DemandProfileORM.slot_start,
+            DemandProfileORM.min_required,
+        ).where(DemandProfileORM.sector_id == sector_id)
         if period_start:
-            q = q.filter(DemandProfileORM.work_date >= period_start)
+            stmt = stmt.where(DemandProfileORM.work_date >= period_start)
         if period_end:
-            q = q.filter(DemandProfileORM.work_date <= period_end)
-        rows = q.all()
+            stmt = stmt.where(DemandProfileORM.work_date <= period_end)
+        return self._read_frame(stmt)
+
+    def load_demand_profile(self, sector_id: str, period_start=None, period_end=None) -> list:
+        """Carrega demand_profile como lista de DemandSlot."""
+        df = self.load_demand_profile_df(sector_id, period_start, period_end)
         return [
             DemandSlot(
-                sector_id=r.sector_id,
-                work_date=r.work_date,
-                slot_start=r.slot_start,
-                min_required=r.min_required,
+                sector_id=sector,
+                work_date=work_date,
+                slot_start=slot_start,
+                min_required=int(min_required),
+            )
+            for sector, work_date, slot_start, min_required in zip(
+                df["sector_id"], df["work_date"], df["slot_start"], df["min_required"]
             )
-            for r in rows
         ]
 
     def add_demand_slot(self, slot: DemandSlot):
         """Adiciona slot de demanda (evita duplicata)."""
-        existing = self.session.query(DemandProfileORM).filter(
-            DemandProfileORM.sector_id == slot.sector_id,
-            DemandProfileORM.work_date == slot.work_date,
-            DemandProfileORM.slot_start == slot.slot_start,
-        ).first()
-        if not existing:
-            self.session.add(DemandProfileORM(
-                sector_id=slot.sector_id,
-                work_date=slot.work_date,
-                slot_start=slot.slot_start,
-                min_required=slot.min_required,
-            ))
-            self.session.commit()
+        self._bulk_insert(DemandProfileORM.__table__, [self._demand_row(slot)], conflict_key=DEMAND_SLOT_KEY)
+        self.session.commit()
+
+    @staticmethod
+    def _demand_row(slot: DemandSlot) -> Dict[str, Any]:
+        return {
+            "sector_id": slot.sector_id,
+            "work_date": slot.work_date,
+            "slot_start": slot.slot_start,
+            "min_required": slot.min_required,
+        }
 
     def remove_demand_slot(self, sector_id: str, work_date, slot_start: str) -> bool:
         """Remove slot de demanda específico."""
@@ -296,22 +445,26 @@ class SqlAlchemyRepository:
         return deleted > 0
 
     def save_demand_profile_bulk(self, items: list):
-        """Substitui demand_profile do setor/período por nova lista."""
+        """Substitui demand_profile das datas presentes na lista (por setor) pela nova lista."""
         if not items:
             return
-        sector_id = items[0].sector_id
-        dates = {i.work_date for i in items}
-        self.session.query(DemandProfileORM).filter(
-            DemandProfileORM.sector_id == sector_id,
-            DemandProfileORM.work_date.in_(dates),
-        ).delete(synchronize_session=False)
+        dates_by_sector: Dict[str, set] = {}
         for slot in items:
-            self.session.add(DemandProfileORM(
-                sector_id=slot.sector_id,
-                work_date=slot.work_date,
-                slot_start=slot.slot_start,
-                min_required=slot.min_required,
-            ))
+            dates_by_sector.setdefault(slot.sector_id, set()).add(slot.work_date)
+        for sector_id, dates in dates_by_sector.items():
+            dates = sorted(dates)
+            for start in range(0, len(dates), IN_CHUNK_SIZE):
+                self.session.query(DemandProfileORM).filter(
+                    DemandProfileORM.sector_id == sector_id,
+                    DemandProfileORM.work_date.in_(dates[start:start + IN_CHUNK_SIZE]),
+                ).delete(synchronize_session=False)
+        # Um mínimo por (setor, data, slot): repetições no payload -> vale a última.
+        self._bulk_insert(
+            DemandProfileORM.__table__,
+            [self._demand_row(slot) for slot in items],
+            conflict_key=DEMAND_SLOT_KEY,
+            update_columns=("min_required",),
+        )
         self.session.commit()
 
     # Helpers for existing pipeline (Sunday Rotation / Template)
@@ -322,76 +475,61 @@ class SqlAlchemyRepository:
     # So we need to support registration.
     
 
-    def load_sunday_rotation(self, sector_id: str = "CAIXA"):
-        # Scope por setor via colaboradores vinculados ao setor.
-        sector_employee_ids = [
-            row[0]
-            for row in self.session.query(EmployeeORM.employee_id).filter(EmployeeORM.sector_id == sector_id).all()
-        ]
-        if not sector_employee_ids:
-            return pd.DataFrame()
+    @staticmethod
+    def _sector_employees(sector_id: str) -> Select:
+        """Subconsulta dos colaboradores do setor (ix_employees_sector_id), sem lista de IDs em parâmetros."""
+        return select(EmployeeORM.employee_id).where(EmployeeORM.sector_id == sector_id)
 
-        rotations = self.session.query(SundayRotationORM).filter(
-            SundayRotationORM.employee_id.in_(sector_employee_ids)
-        ).all()
-        if not rotations:
-            return pd.DataFrame() # Empty
-            
-        data = []
-        for r in rotations:
-            data.append({
-                "scale_index": r.scale_index,
-                "employee_id": r.employee_id,
-                "sunday_date": r.sunday_date,
-                "folga_date": r.folga_date
-            })
-        return pd.DataFrame(data)
+    def load_sunday_rotation(self, sector_id: str = "CAIXA"):
+        # Scope por setor via join com os colaboradores vinculados ao setor.
+        return self._read_frame(
+            select(
+                SundayRotationORM.scale_index,
+                SundayRotationORM.employee_id,
+                SundayRotationORM.sunday_date,
+                SundayRotationORM.folga_date,
+            )
+            .join(EmployeeORM, EmployeeORM.employee_id == SundayRotationORM.employee_id)
+            .where(EmployeeORM.sector_id == sector_id)
+            # Ordem de inserção: quem consome indexa por (colaborador, domingo) e a última linha vale.
+            .order_by(SundayRotationORM.id)
+        )
 
     def load_weekday_template_data(self, sector_id: str = "CAIXA"):
          # Escopo por setor usando source namespaced: TEMPLATE_BASE:<SECTOR_ID>.
          source_key = f"TEMPLATE_BASE:{sector_id}"
-         temps = self.session.query(CycleTemplateORM).filter(CycleTemplateORM.source == source_key).all()
+         columns = select(
+             CycleTemplateORM.employee_id,
+             CycleTemplateORM.day_key,  # MON, TUE
+             CycleTemplateORM.shift_code,
+             CycleTemplateORM.minutes,
+         )
+         df = self._read_frame(columns.where(CycleTemplateORM.source == source_key))
          # Fallback para legado sem namespace (piloto CAIXA já existente).
-         if not temps and sector_id == "CAIXA":
-             temps = self.session.query(CycleTemplateORM).filter(CycleTemplateORM.source == "TEMPLATE_BASE").all()
-         if not temps:
-             return pd.DataFrame()
-             
-         data = []
-         for t in temps:
-             data.append({
-                 "employee_id": t.employee_id,
-                 "day_key": t.day_key, # MON, TUE
-                 "shift_code": t.shift_code,
-                 "minutes": t.minutes
-             })
-         # Pivot back to user friendly? Or just return raw
-         return pd.DataFrame(data)
+         if df.empty and sector_id == "CAIXA":
+             df = self._read_frame(columns.where(CycleTemplateORM.source == "TEMPLATE_BASE"))
+         return df
 
     def save_sunday_rotation(self, df_rot, sector_id: str = "CAIXA"):
         # Replace scoped por setor (via employee_id vinculado ao setor).
-        sector_employee_ids = [
-            row[0]
-            for row in self.session.query(EmployeeORM.employee_id).filter(EmployeeORM.sector_id == sector_id).all()
-        ]
+        sector_employee_ids = self.session.scalars(self._sector_employees(sector_id)).all()
+        outside = ~df_rot['employee_id'].isin(sector_employee_ids)
+        if outside.any():
+            employee_id = df_rot['employee_id'][outside].iloc[0]
+            raise ValueError(f"employee_id '{employee_id}' não pertence ao setor '{sector_id}'")
+
         self.session.query(SundayRotationORM).filter(
-            SundayRotationORM.employee_id.in_(sector_employee_ids)
+            SundayRotationORM.employee_id.in_(self._sector_employees(sector_id))
         ).delete(synchronize_session=False)
 
-        for _, row in df_rot.iterrows():
+        rows = pd.DataFrame({
+            "scale_index": df_rot['scale_index'].astype(int).tolist(),
+            "employee_id": df_rot['employee_id'].tolist(),
             # Convert to Python date objects (SQLite requirement)
-            s_date = pd.to_datetime(row['sunday_date']).date()
-            f_date = pd.to_datetime(row['folga_date']).date() if pd.notna(row['folga_date']) else None
-            employee_id = row['employee_id']
-            if employee_id not in sector_employee_ids:
-                raise ValueError(f"employee_id '{employee_id}' não pertence ao setor '{sector_id}'")
-            
-            self.session.add(SundayRotationORM(
-                scale_index=int(row['scale_index']),
-                employee_id=employee_id,
-                sunday_date=s_date,
-                folga_date=f_date
-            ))
+            "sunday_date": _python_dates(df_rot['sunday_date']),
+            "folga_date": _python_dates(df_rot['folga_date']),
+        }, dtype=object)
+        self._bulk_insert(SundayRotationORM.__table__, rows.to_dict("records"))
         self.session.commit()
 
 
@@ -443,13 +581,17 @@ class SqlAlchemyRepository:
         self.session.query(ShiftORM).filter(ShiftORM.sector_id == sector_id).delete(synchronize_session=False)
         # Ensure we don't have duplicates in the DF itself
         df_clean = df_shifts.drop_duplicates('shift_code')
-        for _, row in df_clean.iterrows():
-            self.session.add(ShiftORM(
-                shift_code=row['shift_code'],
-                sector_id=sector_id,
-                minutes=int(row.get('minutes_median', row.get('minutes', 480))),
-                day_scope=row.get('day_scope', 'WEEKDAY')
-            ))
+        if 'minutes_median' in df_clean.columns:
+            minutes = df_clean['minutes_median']
+        elif 'minutes' in df_clean.columns:
+            minutes = df_clean['minutes']
+        else:
+            minutes = pd.Series(480, index=df_clean.index)
+        day_scope = df_clean['day_scope'] if 'day_scope' in df_clean.columns else pd.Series('WEEKDAY', index=df_clean.index)
+        self._bulk_insert(ShiftORM.__table__, [
+            {"shift_code": code, "sector_id": sector_id, "minutes": int(mins), "day_scope": scope}
+            for code, mins, scope in zip(df_clean['shift_code'], minutes, day_scope)
+        ])
         self.session.commit()
 
     def save_weekday_template(self, df_slots, sector_id: str = "CAIXA"):
@@ -460,15 +602,171 @@ class SqlAlchemyRepository:
         if sector_id == "CAIXA":
             self.session.query(CycleTemplateORM).filter(CycleTemplateORM.source == "TEMPLATE_BASE").delete(synchronize_session=False)
         day_col = 'day_name' if 'day_name' in df_slots.columns else 'day_key'
-        for _, row in df_slots.iterrows():
-            self.session.add(CycleTemplateORM(
-                scale_id=1, # Default anchor
-                cycle_day=1, # This is a template, day mapping happens in engine
-                employee_id=row['employee_id'],
-                day_key=row[day_col], # SEG, TER, MON...
-                shift_code=row['shift_code'],
-                minutes=int(row.get('minutes_median', 0)),
-                status="WORK",
-                source=source_key
-            ))
+        minutes = df_slots['minutes_median'] if 'minutes_median' in df_slots.columns else pd.Series(0, index=df_slots.index)
+        self._bulk_insert(CycleTemplateORM.__table__, [
+            {
+                "scale_id": 1,  # Default anchor
+                "cycle_day": 1,  # This is a template, day mapping happens in engine
+                "employee_id": employee_id,
+                "day_key": day_key,  # SEG, TER, MON...
+                "shift_code": shift_code,
+                "minutes": int(mins),
+                "status": "WORK",
+                "source": source_key,
+            }
+            for employee_id, day_key, shift_code, mins in zip(
+                df_slots['employee_id'], df_slots[day_col], df_slots['shift_code'], minutes
+            )
+        ])
         self.session.commit()
+
+    # Escala oficial (schedule_runs / schedule_assignments / schedule_violations)
+    def save_schedule_run(
+        self,
+        sector_id: str,
+        period_start: date,
+        period_end: date,
+        assignments: pd.DataFrame,
+        violations: pd.DataFrame,
+        keep_runs: int = SCHEDULE_RUNS_KEPT,
+    ) -> int:
+        """
+        Grava uma geração oficial em lote (um INSERT por tabela, um commit) e descarta
+        as gerações mais antigas do setor além de `keep_runs`. Retorna o id da geração.
+        """
+        run = ScheduleRunORM(
+            sector_id=sector_id,
+            period_start=period_start,
+            period_end=period_end,
+            assignments_count=len(assignments),
+            violations_count=len(violations),
+        )
+        self.session.add(run)
+        self.session.flush()
+
+        if not assignments.empty:
+            n = len(assignments)
+            rows = pd.DataFrame({
+                "run_id": [run.id] * n,
+                "sector_id": [sector_id] * n,
+                "work_date": _python_dates(assignments["work_date"]),
+                "employee_id": assignments["employee_id"].astype(str).tolist(),
+                "status": assignments["status"].astype(str).tolist(),
+                "shift_code": _optional_strings(assignments["shift_code"]),
+                "minutes": assignments["minutes"].fillna(0).astype(int).tolist(),
+                "source_rule": _optional_strings(assignments["source_rule"]),
+            }, dtype=object)
+            self._bulk_insert(ScheduleAssignmentORM.__table__, rows.to_dict("records"))
+        if not violations.empty:
+            n = len(violations)
+            rows = pd.DataFrame({
+                "run_id": [run.id] * n,
+                "sector_id": [sector_id] * n,
+                "employee_id": violations["employee_id"].astype(str).tolist(),
+                "rule_code": violations["rule_code"].astype(str).tolist(),
+                "severity": violations["severity"].astype(str).tolist(),
+                "date_start": _python_dates(violations["date_start"]),
+                "date_end": _python_dates(violations["date_end"]),
+                "detail": _optional_strings(violations["detail"]),
+            }, dtype=object)
+            self._bulk_insert(ScheduleViolationORM.__table__, rows.to_dict("records"))
+
+        stale = (
+            select(ScheduleRunORM.id)
+            .where(ScheduleRunORM.sector_id == sector_id)
+            .order_by(ScheduleRunORM.id.desc())
+            .offset(keep_runs)
+        )
+        stale_ids = self.session.scalars(stale).all()
+        if stale_ids:
+            for table in (ScheduleAssignmentORM, ScheduleViolationORM):
+                self.session.query(table).filter(table.run_id.in_(stale_ids)).delete(synchronize_session=False)
+            self.session.query(ScheduleRunORM).filter(ScheduleRunORM.id.in_(stale_ids)).delete(synchronize_session=False)
+        self.session.commit()
+        return int(run.id)
+
+    def latest_schedule_run_id(self, sector_id: Optional[str] = None) -> Optional[int]:
+        """Geração oficial vigente: a mais recente do setor (ou de qualquer setor, sem filtro)."""
+        stmt = select(ScheduleRunORM.id).order_by(ScheduleRunORM.id.desc()).limit(1)
+        if sector_id:
+            stmt = stmt.where(ScheduleRunORM.sector_id == sector_id)
+        return self.session.scalars(stmt).first()
+
+    def schedule_run_sector(self, run_id: int) -> Optional[str]:
+        """Setor da geração `run_id` (None se ela não existe mais)."""
+        return self.session.scalars(select(ScheduleRunORM.sector_id).where(ScheduleRunORM.id == run_id)).first()
+
+    def _schedule_rows(
+        self,
+        table,
+        run_id: int,
+        columns: Optional[Sequence[str]],
+        default_columns: Sequence[str],
+        filters: list,
+        after_id: Optional[int],
+        limit: Optional[int],
+    ) -> pd.DataFrame:
+        """
+        Linhas de uma geração com filtros no SQL e paginação keyset por `id`
+        (WHERE id > after_id ORDER BY id LIMIT n). A coluna `id` sempre vem primeiro.
+        """
+        selected = [table.id] + [getattr(table, col) for col in (columns or default_columns)]
+        stmt = select(*selected).where(table.run_id == run_id, *filters)
+        if after_id is not None:
+            stmt = stmt.where(table.id > after_id)
+        stmt = stmt.order_by(table.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return self._read_frame(stmt)
+
+    def load_schedule_assignments_df(
+        self,
+        run_id: int,
+        period_start=None,
+        period_end=None,
+        *,
+        employee_id: Optional[str] = None,
+        status: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Alocações da geração (id + SCHEDULE_ASSIGNMENT_COLUMNS ou `columns`) no período, com filtros opcionais."""
+        filters = []
+        if period_start:
+            filters.append(ScheduleAssignmentORM.work_date >= period_start)
+        if period_end:
+            filters.append(ScheduleAssignmentORM.work_date <= period_end)
+        if employee_id:
+            filters.append(ScheduleAssignmentORM.employee_id == employee_id)
+        if status:
+            filters.append(ScheduleAssignmentORM.status == status)
+        return self._schedule_rows(
+            ScheduleAssignmentORM, run_id, columns, SCHEDULE_ASSIGNMENT_COLUMNS, filters, after_id, limit
+        )
+
+    def load_schedule_violations_df(
+        self,
+        run_id: int,
+        period_start=None,
+        period_end=None,
+        *,
+        employee_id: Optional[str] = None,
+        rule_code: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Violações da geração que tocam o período (date_start <= fim e date_end >= início)."""
+        filters = []
+        if period_start:
+            filters.append(ScheduleViolationORM.date_end >= period_start)
+        if period_end:
+            filters.append(ScheduleViolationORM.date_start <= period_end)
+        if employee_id:
+            filters.append(ScheduleViolationORM.employee_id == employee_id)
+        if rule_code:
+            filters.append(ScheduleViolationORM.rule_code == rule_code)
+        return self._schedule_rows(
+            ScheduleViolationORM, run_id, columns, SCHEDULE_VIOLATION_COLUMNS, filters, after_id, limit
+        )
@@ -280,7 +280,15 @@ export const api = {
       sector_id?: string
       risk_ack?: { actor_role: string; actor_name?: string; reason: string }
     }) =>
-      fetchApi<{ status: string; assignments_count: number; violations_count: number }>('/scale/generate', { method: 'POST', body: JSON.stringify(data) }),
+      fetchApi<{
+        status: string
+        assignments_count: number
+        violations_count: number
+        preferences_processed: number
+        exceptions_applied: number
+        run_id?: number | null
+        export_job_id?: string | null
+      }>('/scale/generate', { method: 'POST', body: JSON.stringify(data) }),
     simulate: (data: {
       period_start: string
       period_end: string
@@ -336,5 +344,16 @@ export const api = {
   export: {
     html: () => `${API_BASE}/scale/export/html/download`,
     markdown: () => `${API_BASE}/scale/export/markdown/download`,
+    job: (jobId: string, sectorId?: string) =>
+      fetchApi<{
+        job_id: string
+        status: 'PENDING' | 'RUNNING' | 'DONE' | 'FAILED'
+        created_at: string
+        sector_id?: string | null
+        started_at?: string | null
+        finished_at?: string | null
+        error?: string | null
+        files: Record<string, string>
+      }>(`/scale/export/jobs/${encodeURIComponent(jobId)}${buildQuery({ sector_id: sectorId })}`),
   },
 }
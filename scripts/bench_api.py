@@ -0,0 +1,64 @@
+"""Latência de endpoints da API via TestClient (sem rede).
+
+Compara a dependência atual `get_repo` com a versão anterior, que chamava
+`init_db()` (mkdir + create_all) em toda requisição.
+
+Uso (na raiz do projeto, com o banco já populado por scripts/seed.py):
+    PYTHONPATH=. python scripts/bench_api.py [n_requests]
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.src.infrastructure.database.setup import SessionLocal, init_db
+from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
+
+ENDPOINTS = ["/employees", "/scale/assignments"]
+
+
+def get_repo_with_init_db():
+    """Dependência antiga: schema reflection a cada requisição."""
+    init_db()
+    session = SessionLocal()
+    try:
+        yield SqlAlchemyRepository(session)
+    finally:
+        session.close()
+
+
+def _latencies(client: TestClient, path: str, n: int) -> list[float]:
+    client.get(path)  # aquecimento
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        res = client.get(path)
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert res.status_code == 200, (path, res.status_code)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = statistics.quantiles(samples, n=20)[-1]
+    return f"p50 {statistics.median(samples):7.2f} ms | p95 {p95:7.2f} ms"
+
+
+def main(n: int = 200) -> None:
+    with TestClient(app) as client:
+        for path in ENDPOINTS:
+            app.dependency_overrides[get_repo] = get_repo_with_init_db
+            before = _latencies(client, path, n)
+            app.dependency_overrides.clear()
+            after = _latencies(client, path, n)
+            print(f"{path:<20} init_db por requisição: {_summary(before)}")
+            print(f"{'':<20} sessão do pool:         {_summary(after)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,161 @@
+"""Escritas em lote do repositório/API vs gravação objeto a objeto (versão anterior).
+
+Uso (na raiz do projeto):
+    PYTHONPATH=. python scripts/bench_bulk_writes.py [repository endpoints]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.src.domain.models import DemandSlot, Employee, ExceptionType, ScheduleException
+from apps.backend.src.infrastructure.database.extended_orm import DemandProfileORM, ExceptionORM
+from apps.backend.src.infrastructure.database.migrations import run_migrations
+from apps.backend.src.infrastructure.database.setup import create_sqlite_engine
+from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
+
+START = date(2026, 1, 1)
+
+
+def demand_year() -> list:
+    return [
+        DemandSlot("BENCH", START + timedelta(days=d), f"{m // 60:02d}:{m % 60:02d}", 2)
+        for d in range(365)
+        for m in range(0, 24 * 60, 30)
+    ]
+
+
+def exceptions(count: int) -> list:
+    types = list(ExceptionType)
+    return [
+        ScheduleException("BENCH", f"E{k % 500:04d}", START + timedelta(days=k // 500), types[k % len(types)])
+        for k in range(count)
+    ]
+
+
+def save_demand_per_row(repo: SqlAlchemyRepository, items: list) -> None:
+    """save_demand_profile_bulk anterior: um objeto ORM por slot."""
+    dates = {i.work_date for i in items}
+    repo.session.query(DemandProfileORM).filter(
+        DemandProfileORM.sector_id == items[0].sector_id,
+        DemandProfileORM.work_date.in_(dates),
+    ).delete(synchronize_session=False)
+    for slot in items:
+        repo.session.add(DemandProfileORM(
+            sector_id=slot.sector_id, work_date=slot.work_date, slot_start=slot.slot_start, min_required=slot.min_required,
+        ))
+    repo.session.commit()
+
+
+def add_exception_per_row(repo: SqlAlchemyRepository, exc: ScheduleException) -> None:
+    """add_exception anterior: SELECT de checagem + INSERT + commit por item."""
+    existing = repo.session.query(ExceptionORM).filter(
+        ExceptionORM.sector_id == exc.sector_id,
+        ExceptionORM.employee_id == exc.employee_id,
+        ExceptionORM.exception_date == exc.exception_date,
+        ExceptionORM.exception_type == exc.exception_type.value,
+    ).first()
+    if not existing:
+        repo.session.add(ExceptionORM(
+            sector_id=exc.sector_id, employee_id=exc.employee_id, exception_date=exc.exception_date,
+            exception_type=exc.exception_type.value, note=exc.note,
+        ))
+        repo.session.commit()
+
+
+def _timed(Session: sessionmaker, fn) -> float:
+    with Session() as session:
+        repo = SqlAlchemyRepository(session)
+        t0 = time.perf_counter()
+        fn(repo)
+        return time.perf_counter() - t0
+
+
+def bench_repository() -> None:
+    print("== repositório: lote vs objeto a objeto ==")
+    slots = demand_year()
+    excs = exceptions(5000)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        run_migrations(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        t_rows = _timed(Session, lambda repo: save_demand_per_row(repo, slots))
+        t_bulk = _timed(Session, lambda repo: repo.save_demand_profile_bulk(slots))
+        print(f"demanda 365 dias x 48 slots ({len(slots)}): por objeto {t_rows:.3f}s | lote {t_bulk:.3f}s | {t_rows / t_bulk:.0f}x")
+
+        t_rows = _timed(Session, lambda repo: [add_exception_per_row(repo, e) for e in excs])
+        with Session() as session:
+            session.query(ExceptionORM).delete()
+            session.commit()
+        t_bulk = _timed(Session, lambda repo: repo.add_exceptions_bulk(excs))
+        print(f"{len(excs)} exceções: por item {t_rows:.3f}s | lote {t_bulk:.3f}s | {t_rows / t_bulk:.0f}x")
+        engine.dispose()
+
+
+def bench_endpoints(n_rows: int = 10_000) -> None:
+    """Calendário de férias de 500 colaboradores: um POST /exceptions por linha vs um /exceptions/bulk (NDJSON)."""
+    print(f"== API: {n_rows} exceções ==")
+    payload = [
+        {"sector_id": "BENCH", "employee_id": e.employee_id, "exception_date": str(e.exception_date), "exception_type": e.exception_type.value}
+        for e in exceptions(n_rows)
+    ]
+    ndjson = "\n".join(json.dumps(row) for row in payload)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        run_migrations(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        with Session() as session:
+            repo = SqlAlchemyRepository(session)
+            repo.add_sector("BENCH", "Bench")
+            repo.add_contract("H44_BENCH", "BENCH", 2640)
+            for i in range(500):
+                repo.add_employee(Employee(f"E{i:04d}", f"Colaborador {i}", "H44_BENCH", "BENCH"))
+
+        def override_repo():
+            with Session() as session:
+                yield SqlAlchemyRepository(session)
+
+        app.dependency_overrides[get_repo] = override_repo
+        try:
+            client = TestClient(app)
+            t0 = time.perf_counter()
+            for row in payload:
+                client.post("/exceptions", json=row)
+            t_rows = time.perf_counter() - t0
+            with Session() as session:
+                session.query(ExceptionORM).delete()
+                session.commit()
+            t0 = time.perf_counter()
+            res = client.post("/exceptions/bulk", content=ndjson, headers={"Content-Type": "application/x-ndjson"})
+            t_bulk = time.perf_counter() - t0
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+    body = res.json()
+    print(
+        f"POST por linha {t_rows:.2f}s | /bulk {t_bulk:.3f}s | {t_rows / t_bulk:.0f}x "
+        f"(criadas {body['created']}, duplicadas {body['duplicates']}, inválidas {body['invalid']})"
+    )
+
+
+BENCHMARKS = {
+    "repository": bench_repository,
+    "endpoints": bench_endpoints,
+}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        BENCHMARKS[name]()
@@ -0,0 +1,108 @@
+"""Teste de carga concorrente no SQLite: engine padrão vs perfil de desempenho.
+
+Leitores (colaboradores + exceções) e escritores (inserir/remover exceção) rodam
+em threads sobre cópias separadas do banco; mede operações/s e erros de lock.
+
+Uso (na raiz do projeto):
+    PYTHONPATH=. python scripts/bench_db_load.py [segundos] [leitores] [escritores]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from apps.backend.src.domain.models import Employee, ExceptionType, ScheduleException
+from apps.backend.src.infrastructure.database.migrations import run_migrations
+from apps.backend.src.infrastructure.database.setup import create_sqlite_engine
+from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
+
+N_EMPLOYEES = 200
+
+
+def _prepare(engine) -> sessionmaker:
+    run_migrations(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    with Session() as session:
+        repo = SqlAlchemyRepository(session)
+        repo.add_sector("CAIXA", "Caixa")
+        repo.add_contract("H44", "CAIXA", 2640)
+        for i in range(N_EMPLOYEES):
+            repo.add_employee(Employee(f"E{i:04d}", f"Colaborador {i}", "H44", "CAIXA"))
+    return Session
+
+
+def _run(Session: sessionmaker, seconds: float, readers: int, writers: int) -> dict:
+    stop = time.perf_counter() + seconds
+    counts = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def bump(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def reader() -> None:
+        while time.perf_counter() < stop:
+            try:
+                with Session() as session:
+                    repo = SqlAlchemyRepository(session)
+                    repo.load_employees()
+                    repo.load_exceptions(sector_id="CAIXA")
+                bump("reads")
+            except OperationalError:
+                bump("locked")
+
+    def writer(worker: int) -> None:
+        k = 0
+        while time.perf_counter() < stop:
+            exc = ScheduleException(
+                "CAIXA", f"E{(worker * 7 + k) % N_EMPLOYEES:04d}", date(2026, 1, 1) + timedelta(days=k % 365),
+                ExceptionType.VACATION,
+            )
+            k += 1
+            try:
+                with Session() as session:
+                    repo = SqlAlchemyRepository(session)
+                    repo.add_exception(exc)
+                    repo.remove_exception(exc.sector_id, exc.employee_id, exc.exception_date, exc.exception_type.value)
+                bump("writes")
+            except OperationalError:
+                bump("locked")
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return counts
+
+
+def main(seconds: float = 5.0, readers: int = 8, writers: int = 4) -> None:
+    print(f"== carga concorrente: {readers} leitores + {writers} escritores, {seconds:.0f}s ==")
+    with tempfile.TemporaryDirectory() as tmp:
+        profiles = {
+            "padrão": lambda url: create_engine(url, connect_args={"check_same_thread": False}),
+            "perfil WAL": create_sqlite_engine,
+        }
+        for name, factory in profiles.items():
+            engine = factory(f"sqlite:///{Path(tmp) / (name.replace(' ', '_') + '.db')}")
+            counts = _run(_prepare(engine), seconds, readers, writers)
+            engine.dispose()
+            print(
+                f"{name:<11} leituras {counts['reads'] / seconds:8.1f}/s | escritas {counts['writes'] / seconds:7.1f}/s"
+                f" | erros de lock {counts['locked']}"
+            )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 5.0, *(int(a) for a in args[1:3]))
@@ -0,0 +1,169 @@
+"""Benchmarks dos motores de domínio: versão vetorizada vs laço original.
+
+Uso (na raiz do projeto):
+    PYTHONPATH=. python scripts/bench_engines.py [projection scale_cycle streaks coverage intershift aggregates overlays ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from datetime import timedelta
+from typing import Callable
+
+from apps.backend.src.domain.aggregates import ScheduleAggregates
+from apps.backend.src.domain.engines import CycleGenerator, PolicyEngine
+from apps.backend.src.domain.models import ProjectionContext
+from tests.oracles import legacy_engines
+from tests.oracles.synthetic import (
+    ANCHOR,
+    synthetic_assignments,
+    synthetic_cycle,
+    synthetic_demand,
+    synthetic_exceptions,
+    synthetic_preferences,
+    synthetic_rotation,
+    synthetic_shifts,
+    synthetic_template,
+)
+
+
+def _timeit(fn: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_projection() -> None:
+    print("== project_cycle_to_period ==")
+    print(f"{'employees':>10} {'months':>7} {'rows':>9} {'loop (s)':>10} {'vector (s)':>11} {'speedup':>8}")
+    generator = CycleGenerator()
+    for n_employees in (50, 200, 1000):
+        cycle = synthetic_cycle(n_employees)
+        for months in (1, 3, 12):
+            ctx = ProjectionContext(
+                period_start=ANCHOR,
+                period_end=ANCHOR + timedelta(days=30 * months - 1),
+                sector_id="BENCH",
+                anchor_date=ANCHOR,
+            )
+            fast = generator.project_cycle_to_period(cycle, ctx)
+            t_loop = _timeit(lambda: legacy_engines.project_cycle_to_period_loop(cycle, ctx), repeat=1)
+            t_fast = _timeit(lambda: generator.project_cycle_to_period(cycle, ctx))
+            print(f"{n_employees:>10} {months:>7} {len(fast):>9} {t_loop:>10.3f} {t_fast:>11.4f} {t_loop / t_fast:>7.0f}x")
+
+
+def bench_scale_cycle() -> None:
+    print("== build_scale_cycle (rodízio de 52 escalas) ==")
+    print(f"{'employees':>10} {'rotations':>10} {'rows':>9} {'loop (s)':>10} {'keyed (s)':>10} {'speedup':>8}")
+    generator = CycleGenerator()
+    for n_employees in (50, 200):
+        rotation = synthetic_rotation(n_employees, 52)
+        template = synthetic_template(n_employees)
+        fast = generator.build_scale_cycle(rotation, template, "DOM_08_12_30", 270)
+        t_loop = _timeit(lambda: legacy_engines.build_scale_cycle_loop(rotation, template, "DOM_08_12_30", 270), repeat=1)
+        t_fast = _timeit(lambda: generator.build_scale_cycle(rotation, template, "DOM_08_12_30", 270))
+        print(f"{n_employees:>10} {len(rotation):>10} {len(fast):>9} {t_loop:>10.3f} {t_fast:>10.4f} {t_loop / t_fast:>7.0f}x")
+
+
+def bench_streaks() -> None:
+    print("== R1/R3 (kernel de sequências), 1000 colaboradores x 365 dias ==")
+    df = synthetic_assignments(1000, 365)
+    rules = {f"E{i:04d}": {"contract_code": "H44", "max_consecutive_sundays": 0} for i in range(1000)}
+    engine = PolicyEngine()
+    cases = [
+        ("R1", lambda: legacy_engines.validate_consecutive_days_loop(df, 5), lambda: engine.validate_consecutive_days(df, 5)),
+        ("R3", lambda: legacy_engines.validate_sunday_rotation_loop(df, rules), lambda: engine.validate_sunday_rotation(df, rules)),
+    ]
+    for name, loop_fn, fast_fn in cases:
+        t_loop = _timeit(loop_fn, repeat=1)
+        t_fast = _timeit(fast_fn)
+        print(f"{name}: {len(fast_fn())} violações | loop {t_loop:.3f}s | kernel {t_fast:.4f}s | {t_loop / t_fast:.0f}x")
+
+
+def bench_coverage() -> None:
+    print("== R5 cobertura (48 slots/dia), 200 colaboradores ==")
+    engine = PolicyEngine()
+    shifts = synthetic_shifts()
+    for n_days, run_loop in ((30, True), (365, False)):
+        df = synthetic_assignments(200, n_days)
+        slots = synthetic_demand(n_days, 20)
+        t_fast = _timeit(lambda: engine.validate_demand_coverage(df, slots, shifts))
+        line = f"{n_days:>3} dias ({len(slots)} slots): sweep {t_fast:.4f}s"
+        if run_loop:
+            t_loop = _timeit(lambda: legacy_engines.validate_demand_coverage_loop(df, slots, shifts), repeat=1)
+            line += f" | loop {t_loop:.2f}s | {t_loop / t_fast:.0f}x"
+        print(line)
+
+
+def bench_intershift() -> None:
+    print("== R2 intervalo entre jornadas, 1000 colaboradores x 365 dias ==")
+    df = synthetic_assignments(1000, 365)
+    shifts = synthetic_shifts()
+    constraints = {"min_intershift_rest_minutes": 660}
+    engine = PolicyEngine()
+    t_loop = _timeit(lambda: legacy_engines.validate_intershift_rest_loop(df, shifts, constraints), repeat=1)
+    t_fast = _timeit(lambda: engine.validate_intershift_rest(df, shifts, constraints))
+    print(f"loop {t_loop:.3f}s | vetorizado {t_fast:.4f}s | {t_loop / t_fast:.0f}x")
+
+
+def bench_aggregates() -> None:
+    print("== R4/R6 + resumos semanais, 1000 colaboradores x 365 dias ==")
+    df = synthetic_assignments(1000, 365)
+    targets = {f"E{i:04d}": {"weekly_minutes": 2400, "contract_code": "H40"} for i in range(1000)}
+    constraints = {"max_daily_minutes_operational": 585}
+    engine = PolicyEngine()
+
+    def loop_run():
+        legacy_engines.validate_weekly_hours_loop(df, targets)
+        legacy_engines.validate_daily_minutes_loop(df, constraints)
+
+    def aggregate_run():
+        aggregates = ScheduleAggregates.from_assignments(df)
+        engine.validate_weekly_hours(df, targets, aggregates=aggregates)
+        engine.validate_daily_minutes(df, constraints, aggregates=aggregates)
+        aggregates.weekly_totals("SUN_SAT")
+
+    t_loop = _timeit(loop_run, repeat=1)
+    t_fast = _timeit(aggregate_run)
+    t_build = _timeit(lambda: ScheduleAggregates.from_assignments(df))
+    print(f"loop {t_loop:.3f}s | agregado {t_fast:.4f}s (montagem {t_build:.4f}s) | {t_loop / t_fast:.0f}x")
+
+
+def bench_overlays() -> None:
+    print("== preferências + exceções, 200 colaboradores x 365 dias ==")
+    df = synthetic_assignments(200, 365)
+    shifts = synthetic_shifts()
+    generator = CycleGenerator()
+    for n_exc in (500, 5000):
+        exceptions = synthetic_exceptions(200, 365, n_exc)
+        preferences = synthetic_preferences(200, 365, n_exc // 5)
+        t_loop = _timeit(lambda: (
+            legacy_engines.apply_preferences_loop(df, preferences, shifts),
+            legacy_engines.apply_exceptions_loop(df, exceptions),
+        ), repeat=1)
+        t_fast = _timeit(lambda: (
+            generator.apply_preferences(df, preferences, shifts),
+            generator.apply_exceptions(df, exceptions),
+        ))
+        print(f"{n_exc:>5} exceções + {len(preferences)} pedidos: loop {t_loop:.3f}s | chaveado {t_fast:.4f}s | {t_loop / t_fast:.0f}x")
+
+
+BENCHMARKS = {
+    "projection": bench_projection,
+    "scale_cycle": bench_scale_cycle,
+    "streaks": bench_streaks,
+    "coverage": bench_coverage,
+    "intershift": bench_intershift,
+    "aggregates": bench_aggregates,
+    "overlays": bench_overlays,
+}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        BENCHMARKS[name]()
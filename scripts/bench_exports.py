@@ -0,0 +1,158 @@
+"""Export do calendário (HTML + Markdown) de escalas anuais.
+
+- render: busca célula a célula (versão anterior) vs grade pivotada uma vez. A busca
+  é cronometrada numa amostra de dias e extrapolada (a completa leva ~20 min com 200 colaboradores).
+- memory: pico de memória de export_calendar_files gravando em pedaços vs documento
+  inteiro em string + write_text (versão anterior).
+- jobs: tempo que o export ocupa no caminho da requisição (POST /scale/generate):
+  renderização inline vs enfileirar na ExportJobQueue, e quando o job termina.
+
+Uso (na raiz do projeto):
+    PYTHONPATH=. python scripts/bench_exports.py [render memory jobs]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from apps.backend.src.application.export_jobs import ExportJobQueue
+from apps.backend.src.domain.aggregates import ScheduleAggregates
+from apps.backend.src.infrastructure.presenters.export_calendar import (
+    CalendarGrid,
+    _cell_css,
+    _cell_value,
+    export_calendar_files,
+    export_html,
+    export_markdown,
+)
+
+START = date(2026, 1, 1)
+N_DAYS = 365
+SCAN_SAMPLE_DAYS = 14
+
+
+def synthetic_schedule(n_employees: int) -> pd.DataFrame:
+    rows = []
+    for i in range(n_employees):
+        for d in range(N_DAYS):
+            day = START + timedelta(days=d)
+            if (d + i) % 7 == 0:
+                rows.append((day, f"E{i:04d}", "FOLGA", "", 0))
+            elif day.weekday() == 6:
+                rows.append((day, f"E{i:04d}", "WORK", "DOM_08_12_30", 270))
+            else:
+                rows.append((day, f"E{i:04d}", "WORK", f"CAI{1 + i % 6}", 480))
+    return pd.DataFrame(rows, columns=["work_date", "employee_id", "status", "shift_code", "minutes"])
+
+
+def grid_by_scan(df: pd.DataFrame, emp_names: dict, max_days: int = None) -> list:
+    """Caminho anterior: um filtro do frame inteiro por (data, colaborador), repetido por formato."""
+    df = df.assign(work_date=pd.to_datetime(df["work_date"]))
+    dates = sorted(df["work_date"].drop_duplicates().tolist())[:max_days]
+    employees = sorted(df["employee_id"].unique().tolist(), key=lambda x: emp_names.get(x, x))
+    grid = []
+    for d in dates:
+        cells = []
+        for emp in employees:
+            r = df[(df["work_date"] == d) & (df["employee_id"] == emp)]
+            if len(r) == 0:
+                cells.append(("—", "cell-empty"))
+            else:
+                row = r.iloc[0].to_dict()
+                cells.append((_cell_value(row), _cell_css(row["status"], row["shift_code"])))
+        grid.append(cells)
+    return grid
+
+
+def bench_render(sizes=(50, 200)) -> None:
+    print("== render (grade + HTML + Markdown) ==")
+    print(f"{'employees':>10} {'cells':>8} {'scan x2 (s)':>12} {'pivot (s)':>10} {'total (s)':>11} {'speedup':>8}")
+    for n_employees in sizes:
+        df = synthetic_schedule(n_employees)
+        aggregates = ScheduleAggregates.from_assignments(df)
+        args = (df, [], {}, START, START + timedelta(days=N_DAYS - 1), {}, "MON_SUN", aggregates)
+
+        t0 = time.perf_counter()
+        grid_by_scan(df, {}, max_days=SCAN_SAMPLE_DAYS)
+        # Extrapolado para o ano; x2 porque HTML e Markdown refaziam a mesma busca.
+        t_scan = 2 * (time.perf_counter() - t0) * N_DAYS / SCAN_SAMPLE_DAYS
+
+        t0 = time.perf_counter()
+        grid = CalendarGrid.from_assignments(df)
+        t_pivot = time.perf_counter() - t0
+        export_html(*args, grid=grid)
+        export_markdown(*args, grid=grid)
+        t_total = time.perf_counter() - t0
+        print(f"{n_employees:>10} {len(df):>8} {t_scan:>12.2f} {t_pivot:>10.3f} {t_total:>11.3f} {t_scan / t_total:>7.0f}x")
+
+
+def write_whole_documents(output_path: Path, *args) -> None:
+    """Caminho anterior: documento inteiro em memória, depois write_text."""
+    (output_path / "escala_calendario.md").write_text(export_markdown(*args), encoding="utf-8")
+    (output_path / "escala_calendario.html").write_text(export_html(*args), encoding="utf-8")
+
+
+def _peak_mib(fn) -> float:
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def bench_memory(sizes=(200, 1000)) -> None:
+    print("== pico de memória de export_calendar_files (frame e agregados já prontos) ==")
+    print(f"{'employees':>10} {'HTML+MD (MiB)':>14} {'string (MiB)':>13} {'chunks (MiB)':>13}")
+    for n_employees in sizes:
+        df = synthetic_schedule(n_employees)
+        aggregates = ScheduleAggregates.from_assignments(df)
+        args = (df, [], {}, START, START + timedelta(days=N_DAYS - 1), {}, "MON_SUN", aggregates)
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            whole = _peak_mib(lambda: write_whole_documents(out, *args))
+            chunked = _peak_mib(lambda: export_calendar_files(out, *args))
+            size = sum(p.stat().st_size for p in out.iterdir()) / 2**20
+        print(f"{n_employees:>10} {size:>14.1f} {whole:>13.1f} {chunked:>13.1f}")
+
+
+def bench_jobs(sizes=(200, 1000)) -> None:
+    print("== export no caminho da requisição: inline vs ExportJobQueue ==")
+    print(f"{'employees':>10} {'inline (ms)':>12} {'submit (ms)':>12} {'job pronto (ms)':>16}")
+    for n_employees in sizes:
+        df = synthetic_schedule(n_employees)
+        aggregates = ScheduleAggregates.from_assignments(df)
+        args = (df, [], {}, START, START + timedelta(days=N_DAYS - 1), {}, "MON_SUN", aggregates)
+        queue = ExportJobQueue()
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            t0 = time.perf_counter()
+            export_calendar_files(out, *args)
+            t_inline = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            job_id = queue.submit(lambda: export_calendar_files(out, *args))
+            t_submit = time.perf_counter() - t0
+            queue.wait(job_id)
+            t_done = time.perf_counter() - t0
+            queue.shutdown()
+        print(f"{n_employees:>10} {t_inline * 1000:>12.1f} {t_submit * 1000:>12.2f} {t_done * 1000:>16.1f}")
+
+
+BENCHMARKS = {
+    "render": bench_render,
+    "memory": bench_memory,
+    "jobs": bench_jobs,
+}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        BENCHMARKS[name]()
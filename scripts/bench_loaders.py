@@ -0,0 +1,88 @@
+"""Leitura de exceções/demanda: hidratação ORM (versão anterior) vs select colunar -> DataFrame.
+
+Uso (na raiz do projeto):
+    PYTHONPATH=. python scripts/bench_loaders.py
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy.orm import sessionmaker
+
+from apps.backend.src.domain.models import DemandSlot, ExceptionType, ScheduleException
+from apps.backend.src.infrastructure.database.extended_orm import DemandProfileORM, ExceptionORM
+from apps.backend.src.infrastructure.database.migrations import run_migrations
+from apps.backend.src.infrastructure.database.setup import create_sqlite_engine
+from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
+
+START = date(2026, 1, 1)
+
+
+def load_exceptions_orm(repo: SqlAlchemyRepository) -> pd.DataFrame:
+    """Caminho anterior: instâncias ORM -> ScheduleException -> DataFrame."""
+    rows = repo.session.query(ExceptionORM).filter(ExceptionORM.sector_id == "BENCH").all()
+    excs = [
+        ScheduleException(r.sector_id, r.employee_id, r.exception_date, ExceptionType(r.exception_type), r.note or "")
+        for r in rows
+    ]
+    return pd.DataFrame([vars(e) for e in excs])
+
+
+def load_demand_orm(repo: SqlAlchemyRepository) -> pd.DataFrame:
+    rows = repo.session.query(DemandProfileORM).filter(DemandProfileORM.sector_id == "BENCH").all()
+    slots = [DemandSlot(r.sector_id, r.work_date, r.slot_start, r.min_required) for r in rows]
+    return pd.DataFrame([vars(s) for s in slots])
+
+
+def _measure(Session: sessionmaker, fn) -> tuple:
+    with Session() as session:
+        repo = SqlAlchemyRepository(session)
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        result = fn(repo)
+        elapsed = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return len(result), elapsed, peak / 2**20
+
+
+def main() -> None:
+    types = list(ExceptionType)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        run_migrations(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        with Session() as session:
+            repo = SqlAlchemyRepository(session)
+            repo.add_exceptions_bulk([
+                ScheduleException("BENCH", f"E{k % 1000:04d}", START + timedelta(days=k // 1000), types[k % len(types)])
+                for k in range(100_000)
+            ])
+            repo.save_demand_profile_bulk([
+                DemandSlot("BENCH", START + timedelta(days=d), f"{m // 60:02d}:{m % 60:02d}", 2)
+                for d in range(3 * 365)
+                for m in range(0, 24 * 60, 30)
+            ])
+
+        cases = [
+            ("exceções", load_exceptions_orm, lambda repo: repo.load_exceptions_df("BENCH")),
+            ("demanda", load_demand_orm, lambda repo: repo.load_demand_profile_df("BENCH")),
+        ]
+        for name, orm_fn, columnar_fn in cases:
+            rows, t_orm, mem_orm = _measure(Session, orm_fn)
+            _, t_col, mem_col = _measure(Session, columnar_fn)
+            print(
+                f"{name} ({rows} linhas): ORM {t_orm:.3f}s / pico {mem_orm:.0f} MiB | "
+                f"colunar {t_col:.3f}s / pico {mem_col:.0f} MiB | {t_orm / t_col:.1f}x"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
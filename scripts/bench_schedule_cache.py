@@ -0,0 +1,57 @@
+"""Simulações repetidas: pipeline recalculado a cada chamada vs resultado do SCHEDULE_CACHE.
+
+Mesmas entradas em todas as chamadas (como a UI simulando de novo sem editar nada);
+"sem cache" limpa o cache antes de cada requisição.
+
+Uso (na raiz do projeto, com o banco já populado por scripts/seed.py):
+    PYTHONPATH=. python scripts/bench_schedule_cache.py [n_requests]
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+from apps.backend.main import app
+from apps.backend.src.application.schedule_cache import SCHEDULE_CACHE
+
+PERIOD = {"period_start": "2026-01-01", "period_end": "2026-12-31", "sector_id": "CAIXA"}
+CASES = [
+    ("/scale/simulate", PERIOD),
+    ("/scale/weekly-analysis", {**PERIOD, "mode": "SIMULATION"}),
+]
+
+
+def _latencies(client: TestClient, path: str, body: dict, n: int, cold: bool) -> list[float]:
+    client.post(path, json=body)  # aquecimento
+    samples = []
+    for _ in range(n):
+        if cold:
+            SCHEDULE_CACHE.clear()
+        t0 = time.perf_counter()
+        res = client.post(path, json=body)
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert res.status_code == 200, (path, res.status_code)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = statistics.quantiles(samples, n=20)[-1]
+    return f"p50 {statistics.median(samples):7.1f} ms | p95 {p95:7.1f} ms"
+
+
+def main(n: int = 30) -> None:
+    with TestClient(app) as client:
+        for path, body in CASES:
+            before = _latencies(client, path, body, n, cold=True)
+            after = _latencies(client, path, body, n, cold=False)
+            print(f"{path:<24} sem cache: {_summary(before)}")
+            print(f"{'':<24} com cache: {_summary(after)}")
+    print("cache:", SCHEDULE_CACHE.stats())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
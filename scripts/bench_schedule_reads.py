@@ -0,0 +1,125 @@
+"""Latência de /scale/assignments sobre uma escala oficial de ~100k linhas (275 colaboradores x 365 dias).
+
+Compara a lista completa com as leituras filtradas/paginadas (filtros no SQL,
+cursor por id, projeção de campos) e, na mesma escala, a serialização por modelo
+Pydantic por linha (`response_model`) com o caminho rápido (registros -> JSON).
+
+Uso (na raiz do projeto):
+    PYTHONPATH=. python scripts/bench_schedule_reads.py [n_requests]
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+import apps.backend.routes.scale as scale_routes
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.schemas import AssignmentResponse
+from apps.backend.src.infrastructure.database.migrations import run_migrations
+from apps.backend.src.infrastructure.database.setup import create_sqlite_engine
+from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
+
+START = date(2026, 1, 1)
+N_EMPLOYEES = 275
+N_DAYS = 365
+
+
+def synthetic_schedule() -> pd.DataFrame:
+    days = [START + timedelta(days=d) for d in range(N_DAYS)]
+    rows = []
+    for i in range(N_EMPLOYEES):
+        for d, work_date in enumerate(days):
+            work = (d + i) % 7 != 0
+            rows.append((work_date, f"E{i:04d}", "WORK" if work else "FOLGA", f"CAI{1 + i % 6}" if work else "", 480 if work else 0, "TEMPLATE_BASE"))
+    return pd.DataFrame(rows, columns=["work_date", "employee_id", "status", "shift_code", "minutes", "source_rule"])
+
+
+def _latencies(client: TestClient, params: dict, n: int, path: str = "/scale/assignments") -> tuple[list[float], int]:
+    client.get(path, params=params)  # aquecimento
+    samples, size = [], 0
+    for _ in range(n):
+        t0 = time.perf_counter()
+        res = client.get(path, params=params)
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert res.status_code == 200, (params, res.status_code)
+        size = len(res.json())
+    return samples, size
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+    return f"p50 {statistics.median(samples):8.1f} ms | p95 {p95:8.1f} ms"
+
+
+def bench_serialization(schedule: pd.DataFrame, n: int) -> None:
+    """Mesmo frame, só a serialização: modelo por linha + response_model vs registros -> to_json."""
+    serialization_app = FastAPI()
+
+    @serialization_app.get("/models", response_model=list[AssignmentResponse])
+    def models():
+        return scale_routes._assignments_to_response(schedule, {})
+
+    @serialization_app.get("/fast", response_model=list[AssignmentResponse])
+    def fast():
+        return scale_routes._json_response(scale_routes._assignment_records(schedule, {}))
+
+    with TestClient(serialization_app) as client:
+        for label, path in (("modelos + response_model", "/models"), ("registros -> to_json", "/fast")):
+            samples, size = _latencies(client, {}, n, path)
+            print(f"{label:<24} {size:>7} linhas | {_summary(samples)}")
+
+
+def main(n: int = 30) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        run_migrations(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        schedule = synthetic_schedule()
+        with Session() as session:
+            run_id = SqlAlchemyRepository(session).save_schedule_run(
+                "BENCH", START, START + timedelta(days=N_DAYS - 1), schedule, pd.DataFrame()
+            )
+
+        def bench_repo():
+            session = Session()
+            try:
+                yield SqlAlchemyRepository(session)
+            finally:
+                session.close()
+
+        app.dependency_overrides[get_repo] = bench_repo
+        cursor = f"{run_id}.{len(schedule) // 2}"
+        cases = [
+            ("lista completa", {}, max(3, n // 10)),
+            ("mês (period_start/end)", {"period_start": "2026-06-01", "period_end": "2026-06-30"}, n),
+            ("um colaborador", {"employee_id": "E0137"}, n),
+            ("folgas do mês", {"status": "FOLGA", "period_start": "2026-06-01", "period_end": "2026-06-30"}, n),
+            ("página de 500 (cursor)", {"limit": 500, "cursor": cursor}, n),
+            ("página de 500 + fields", {"limit": 500, "cursor": cursor, "fields": "work_date,employee_id,status"}, n),
+        ]
+        try:
+            with TestClient(app) as client:
+                print(f"escala de {len(schedule)} linhas ({N_EMPLOYEES} colaboradores x {N_DAYS} dias)")
+                for label, params, repeat in cases:
+                    samples, size = _latencies(client, params, repeat)
+                    print(f"{label:<24} {size:>7} linhas | {_summary(samples)}")
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+        print("serialização da lista completa:")
+        bench_serialization(schedule, max(3, n // 10))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
@@ -0,0 +1,119 @@
+"""/scale/simulate: resposta JSON única vs NDJSON em blocos (Accept: application/x-ndjson).
+
+Servidor uvicorn real numa thread (TestClient não transmite em blocos). O motor é
+substituído por um frame sintético de n_employees x 365 dias, para medir só a
+serialização: tempo até o primeiro byte, tempo total e pico de memória (tracemalloc).
+
+Uso (na raiz do projeto):
+    PYTHONPATH=. python scripts/bench_simulate_stream.py [n_employees ...]
+"""
+
+from __future__ import annotations
+
+import socket
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+import httpx
+import pandas as pd
+import uvicorn
+
+import apps.backend.routes.scale as scale_routes
+from apps.backend.main import app
+from apps.backend.schemas import PreflightResponse
+
+START = date(2026, 1, 1)
+N_DAYS = 365
+PAYLOAD = {"period_start": "2026-01-01", "period_end": "2026-12-31", "sector_id": "CAIXA"}
+FORMATS = {"json": "application/json", "ndjson": "application/x-ndjson"}
+
+
+def synthetic_result(n_employees: int) -> dict:
+    days = [START + timedelta(days=d) for d in range(N_DAYS)]
+    rows = [
+        (day, f"E{i:04d}", "WORK" if (d + i) % 7 else "FOLGA", f"CAI{1 + i % 6}" if (d + i) % 7 else "", 480 if (d + i) % 7 else 0, "TEMPLATE_BASE")
+        for i in range(n_employees)
+        for d, day in enumerate(days)
+    ]
+    assignments = pd.DataFrame(rows, columns=["work_date", "employee_id", "status", "shift_code", "minutes", "source_rule"])
+    violations = [
+        {"employee_id": f"E{i:04d}", "rule_code": "R4_WEEKLY_TARGET", "severity": "MEDIUM",
+         "date_start": START, "date_end": START + timedelta(days=6), "detail": "2400/2640"}
+        for i in range(n_employees)
+    ]
+    return {
+        "status": "SUCCESS",
+        "assignments_count": len(assignments),
+        "violations_count": len(violations),
+        "preferences_processed": 0,
+        "exceptions_applied": 0,
+        "preview_assignments": assignments,
+        "preview_violations": violations,
+    }
+
+
+class _SyntheticOrchestrator:
+    result: dict = {}
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def run(self, *args, **kwargs):
+        return dict(self.result)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _request(client: httpx.Client, url: str, accept: str) -> tuple[float, float, int]:
+    """(tempo até o primeiro byte, tempo total, bytes) descartando o corpo à medida que chega."""
+    t0 = time.perf_counter()
+    ttfb, size = None, 0
+    with client.stream("POST", url, json=PAYLOAD, headers={"Accept": accept}) as res:
+        assert res.status_code == 200, res.status_code
+        for chunk in res.iter_raw():
+            if ttfb is None:
+                ttfb = time.perf_counter() - t0
+            size += len(chunk)
+    return ttfb, time.perf_counter() - t0, size
+
+
+def main(sizes: list[int]) -> None:
+    scale_routes.ValidationOrchestrator = _SyntheticOrchestrator
+    scale_routes._build_preflight = lambda req, repo: PreflightResponse(
+        mode="NORMAL", blockers=[], critical_warnings=[], can_proceed=True, ack_required=False
+    )
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    url = f"http://127.0.0.1:{port}/scale/simulate"
+    try:
+        with httpx.Client(timeout=600) as client:
+            print(f"{'employees':>10} {'rows':>8} {'format':>7} {'MiB':>7} {'TTFB (s)':>9} {'total (s)':>10} {'peak MiB':>9}")
+            for n_employees in sizes:
+                _SyntheticOrchestrator.result = synthetic_result(n_employees)
+                rows = _SyntheticOrchestrator.result["assignments_count"]
+                for name, accept in FORMATS.items():
+                    _request(client, url, accept)  # aquecimento
+                    ttfb, total, size = _request(client, url, accept)
+                    tracemalloc.start()
+                    _request(client, url, accept)
+                    peak = tracemalloc.get_traced_memory()[1] / 2**20
+                    tracemalloc.stop()
+                    print(f"{n_employees:>10} {rows:>8} {name:>7} {size / 2**20:>7.1f} {ttfb:>9.3f} {total:>10.3f} {peak:>9.1f}")
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50, 275, 1000])
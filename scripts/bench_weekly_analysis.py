@@ -0,0 +1,114 @@
+"""/scale/weekly-analysis SIMULATION numa escala sintética (n_employees x 365 dias).
+
+O motor é substituído por um frame pronto (mesmo resultado do orquestrador), para medir
+só o resumo semanal sobre os agregados do motor: caminho anterior (um WeeklySummaryRow
+por linha + response_model) vs linhas montadas coluna a coluna -> JSON.
+
+Uso (na raiz do projeto):
+    PYTHONPATH=. python scripts/bench_weekly_analysis.py [n_employees ...]
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import apps.backend.routes.scale as scale_routes
+from apps.backend.main import app
+from apps.backend.schemas import WeeklyAnalysisResponse, WeeklySummaryRow
+from apps.backend.src.domain.aggregates import ScheduleAggregates, target_profile
+
+START = date(2026, 1, 1)
+N_DAYS = 365
+BODY = {"period_start": "2026-01-01", "period_end": "2026-12-31", "sector_id": "CAIXA", "mode": "SIMULATION"}
+
+
+def synthetic_schedule(n_employees: int) -> pd.DataFrame:
+    rows = []
+    for i in range(n_employees):
+        for d in range(N_DAYS):
+            work = (d + i) % 7 != 0
+            rows.append((START + timedelta(days=d), f"E{i:04d}", "WORK" if work else "FOLGA", f"CAI{1 + i % 6}" if work else "", 480 if work else 0))
+    return pd.DataFrame(rows, columns=["work_date", "employee_id", "status", "shift_code", "minutes"])
+
+
+def previous_rows(aggregates: ScheduleAggregates, week_definition: str) -> list[WeeklySummaryRow]:
+    """Caminho anterior: um WeeklySummaryRow por (colaborador, semana)."""
+    weekly = aggregates.weekly_totals(week_definition)
+    rows = []
+    for employee_id, week_start, minutes in zip(weekly["employee_id"], weekly["week_start"], weekly["minutes"]):
+        target, contract_code = target_profile({"contract_code": "UNKNOWN", "weekly_minutes": 2640})
+        delta = int(minutes) - target
+        rows.append(WeeklySummaryRow(
+            window=week_definition, week_start=str(week_start), week_end=str(week_start + timedelta(days=6)),
+            employee_id=str(employee_id), employee_name=None, contract_code=contract_code,
+            actual_minutes=int(minutes), target_minutes=target, delta_minutes=delta,
+            status="OK" if abs(delta) <= 120 else "OUT",
+        ))
+    return rows
+
+
+def _timed(client: TestClient, path: str, body: dict, n: int) -> list[float]:
+    client.post(path, json=body)  # aquecimento
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        res = client.post(path, json=body)
+        samples.append((time.perf_counter() - t0) * 1000)
+        assert res.status_code == 200, (path, res.status_code)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+    return f"p50 {statistics.median(samples):8.1f} ms | p95 {p95:8.1f} ms"
+
+
+def main(sizes=(50, 275)) -> None:
+    for n_employees in sizes:
+        df = synthetic_schedule(n_employees)
+        result = {"preview_assignments": df, "aggregates": ScheduleAggregates.from_assignments(df)}
+
+        class _Orchestrator:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            def run(self, *args, **kwargs):
+                return dict(result)
+
+        previous_app = FastAPI()
+
+        @previous_app.post("/weekly", response_model=WeeklyAnalysisResponse)
+        def previous():
+            return WeeklyAnalysisResponse(
+                period_start=BODY["period_start"], period_end=BODY["period_end"], sector_id="CAIXA",
+                policy_week_definition="MON_SUN", tolerance_minutes=120,
+                summaries_mon_sun=previous_rows(result["aggregates"], "MON_SUN"),
+                summaries_sun_sat=previous_rows(result["aggregates"], "SUN_SAT"),
+                external_dependencies_open=[],
+            )
+
+        original = scale_routes.ValidationOrchestrator
+        scale_routes.ValidationOrchestrator = _Orchestrator
+        try:
+            with TestClient(previous_app) as client:
+                before = _timed(client, "/weekly", BODY, 5)
+            with TestClient(app) as client:
+                after = _timed(client, "/scale/weekly-analysis", BODY, 5)
+                listed = _timed(client, "/scale/weekly-analysis", {**BODY, "week_definitions": ["MON_SUN", "SUN_SAT"]}, 5)
+        finally:
+            scale_routes.ValidationOrchestrator = original
+        print(f"{n_employees} colaboradores x {N_DAYS} dias ({len(df)} linhas)")
+        print(f"  anterior                     {_summary(before)}")
+        print(f"  colunas -> JSON              {_summary(after)}")
+        print(f"  week_definitions=[2 cortes]  {_summary(listed)}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(a) for a in sys.argv[1:]) or (50, 275))
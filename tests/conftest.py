@@ -5,3 +5,33 @@ from pathlib import Path
 # Add project root to path for imports
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from apps.backend.src.infrastructure.database.setup import init_db
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _migrated_db():
+    """A API não prepara o schema por requisição; os testes usam TestClient sem lifespan."""
+    init_db()
+
+
+@pytest.fixture
+def memory_repo():
+    """Repositório sobre SQLite em memória, já migrado (uma conexão compartilhada)."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from apps.backend.src.infrastructure.database.migrations import run_migrations
+    from apps.backend.src.infrastructure.repositories_db import SqlAlchemyRepository
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    run_migrations(engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield SqlAlchemyRepository(session)
+    finally:
+        session.close()
+        engine.dispose()
@@ -0,0 +1 @@
+"""Implementações de referência usadas só pelos testes e benchmarks (oráculos de regressão)."""
@@ -0,0 +1,447 @@
+"""
+Implementações originais (laço Python) dos motores de domínio.
+
+Mantidas apenas como oráculo de regressão, fora do pacote da aplicação: os testes
+comparam as versões vetorizadas de `apps/backend/src/domain/engines.py` com estas,
+e `scripts/bench_engines.py` mede o ganho.
+"""
+import pandas as pd
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+from apps.backend.src.domain.models import ProjectionContext, Shift, Violation, ViolationSeverity
+
+
+def build_scale_cycle_loop(
+    sunday_rotation_df: pd.DataFrame,
+    weekday_template: pd.DataFrame,
+    sunday_shift_code: str = "H_DOM",
+    sunday_minutes: int = 300,
+) -> pd.DataFrame:
+    """Ciclo base linha a linha + sobrescrita do rodízio com máscaras no frame inteiro (versão original)."""
+    if sunday_rotation_df.empty:
+        return pd.DataFrame()
+
+    scale_count = int(sunday_rotation_df['scale_index'].max()) if 'scale_index' in sunday_rotation_df.columns else 1
+    
+    template_map = {}
+    for _, row in weekday_template.iterrows():
+        template_map[(row['employee_id'], row['day_key'])] = (row['shift_code'], row['minutes'])
+
+    employees = weekday_template['employee_id'].unique()
+    cycle_week_order = ["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"]
+    
+    rows = []
+    
+    for scale_id in range(1, scale_count + 1):
+        for emp_id in employees:
+            for day_idx, day_key in enumerate(cycle_week_order):
+                cycle_day = (scale_id - 1) * 7 + day_idx + 1
+                
+                if day_key == "SUN":
+                    status = "FOLGA"
+                    shift = ""
+                    mins = 0
+                else:
+                    res = template_map.get((emp_id, day_key))
+                    if res:
+                        status = "WORK"
+                        shift, mins = res
+                    else:
+                        status = "FOLGA"
+                        shift, mins = "", 0
+                
+                rows.append({
+                    "scale_id": scale_id,
+                    "cycle_day": cycle_day,
+                    "employee_id": emp_id,
+                    "day_key": day_key,
+                    "status": status,
+                    "shift_code": shift,
+                    "minutes": mins,
+                    "source": "TEMPLATE_BASE"
+                })
+
+    df = pd.DataFrame(rows)
+    
+    for _, rot in sunday_rotation_df.iterrows():
+        if 'scale_index' not in rot: continue
+        
+        scale = int(rot['scale_index'])
+        emp = rot['employee_id']
+        sunday_cycle_day = (scale - 1) * 7 + 1 
+        
+        mask_sun = (df['scale_id'] == scale) & (df['employee_id'] == emp) & (df['cycle_day'] == sunday_cycle_day)
+        df.loc[mask_sun, ['status', 'shift_code', 'minutes', 'source']] = \
+            ['WORK', sunday_shift_code, sunday_minutes, 'ROTATION_SUNDAY']
+        
+        if 'folga_date' in rot and pd.notna(rot['folga_date']):
+            f_date = pd.to_datetime(rot['folga_date'])
+            s_date = pd.to_datetime(rot['sunday_date'])
+            delta = (f_date - s_date).days
+            
+            if 0 <= delta <= 6:
+                comp_cycle_day = sunday_cycle_day + delta
+                mask_folga = (df['scale_id'] == scale) & (df['employee_id'] == emp) & (df['cycle_day'] == comp_cycle_day)
+                df.loc[mask_folga, ['status', 'shift_code', 'minutes', 'source']] = \
+                    ['FOLGA', '', 0, 'ROTATION_COMPENSATION']
+
+    return df
+
+
+def project_cycle_to_period_loop(cycle_template: pd.DataFrame, context: ProjectionContext) -> pd.DataFrame:
+    """Projeção dia a dia com filtro booleano por data (versão original)."""
+    if cycle_template.empty: return pd.DataFrame()
+
+    cycle_len = int(cycle_template['cycle_day'].max())
+    anchor = context.anchor_date if context.anchor_date else context.period_start
+    rows = []
+    cursor = context.period_start
+
+    while cursor <= context.period_end:
+        offset = (cursor - anchor).days
+        cycle_day = (offset % cycle_len) + 1
+        day_defs = cycle_template[cycle_template['cycle_day'] == cycle_day]
+
+        for _, d in day_defs.iterrows():
+            rows.append({
+                "work_date": cursor,
+                "employee_id": d['employee_id'],
+                "status": d['status'],
+                "shift_code": d['shift_code'],
+                "minutes": d['minutes'],
+                "source_rule": d['source']
+            })
+
+        cursor += timedelta(days=1)
+
+    return pd.DataFrame(rows)
+
+
+def validate_consecutive_days_loop(day_assignments: pd.DataFrame, max_days: int = 6) -> List[Violation]:
+    violations = []
+    if day_assignments.empty: return violations
+
+    df = day_assignments.sort_values(['employee_id', 'work_date'])
+    
+    for employee_id, group in df.groupby('employee_id'):
+        streak = 0
+        streak_start = None
+        
+        for _, row in group.iterrows():
+            if row['status'] == 'WORK':
+                streak += 1
+                if streak == 1:
+                    streak_start = row['work_date']
+                
+                if streak > max_days:
+                    violations.append(Violation(
+                        employee_id=employee_id,
+                        rule_code="R1_MAX_CONSECUTIVE",
+                        severity=ViolationSeverity.CRITICAL,
+                        date_start=streak_start,
+                        date_end=row['work_date'],
+                        detail=f"Trabalhou {streak} dias seguidos (Max: {max_days})",
+                        evidence={"streak": streak}
+                    ))
+            else:
+                streak = 0
+                streak_start = None
+    
+    return violations
+
+
+def validate_sunday_rotation_loop(
+    day_assignments: pd.DataFrame,
+    contract_rules: Dict[str, Any],
+) -> List[Violation]:
+    """
+    R3: Valida rodízio de domingos conforme lei (CLT 386 e Lei 10.101/2000).
+    Busca 'max_consecutive_sundays' no contract_rules.
+    - Mulheres: 1:2 (máx 1 domingo trabalhado)
+    - Homens: 1:3 (máx 2 domingos trabalhados)
+    """
+    violations = []
+    if day_assignments.empty:
+        return violations
+
+    df = day_assignments.copy()
+    df["work_date"] = pd.to_datetime(df["work_date"])
+    sundays = df[df["work_date"].dt.weekday == 6].sort_values(["employee_id", "work_date"])
+
+    for employee_id, group in sundays.groupby("employee_id"):
+        # Pega regra do contrato do colaborador
+        profile = contract_rules.get(employee_id, {})
+        max_consecutive = int(profile.get("max_consecutive_sundays", 2))
+        contract_code = str(profile.get("contract_code", "UNKNOWN"))
+
+        consecutive_count = 0
+        for _, row in group.iterrows():
+            if row["status"] == "WORK":
+                consecutive_count += 1
+                if consecutive_count > max_consecutive:
+                    violations.append(
+                        Violation(
+                            employee_id=employee_id,
+                            rule_code="R3_SUNDAY_ROTATION",
+                            severity=ViolationSeverity.CRITICAL,
+                            date_start=row["work_date"].date(),
+                            date_end=row["work_date"].date(),
+                            detail=(
+                                f"[{contract_code}] Domingo trabalhado consecutivo #{consecutive_count} "
+                                f"(Máximo permitido pela lei: {max_consecutive})"
+                            ),
+                            evidence={
+                                "consecutive_count": consecutive_count,
+                                "max_allowed": max_consecutive,
+                                "contract_code": contract_code,
+                            },
+                        )
+                    )
+            else:
+                consecutive_count = 0
+    return violations
+
+
+def shift_to_datetime_range(shift: Shift, work_date: date) -> tuple:
+    """Retorna (start_dt, end_dt) para o turno na data."""
+    default_start = "08:00"
+    if shift.start_time and shift.end_time:
+        start_str, end_str = shift.start_time, shift.end_time
+    else:
+        h, m = divmod(shift.minutes, 60)
+        start_str = default_start
+        end_h = 8 + h
+        end_m = m
+        if end_m >= 60:
+            end_h += 1
+            end_m -= 60
+        end_str = f"{end_h:02d}:{end_m:02d}"
+    start_dt = datetime.combine(work_date, datetime.strptime(start_str, "%H:%M").time())
+    end_dt = datetime.combine(work_date, datetime.strptime(end_str, "%H:%M").time())
+    if end_dt <= start_dt:
+        end_dt += timedelta(days=1)
+    return start_dt, end_dt
+
+
+def shift_overlaps_slot(shift: Shift, work_date: date, slot_start: str) -> bool:
+    """Verifica se o turno cobre o slot (ex.: 08:00 = 08:00-08:30)."""
+    start_dt, end_dt = shift_to_datetime_range(shift, work_date)
+    slot_parts = slot_start.split(":")
+    slot_h, slot_m = int(slot_parts[0]), int(slot_parts[1]) if len(slot_parts) > 1 else 0
+    slot_begin = datetime.combine(work_date, datetime.strptime(slot_start, "%H:%M").time())
+    slot_end = slot_begin + timedelta(minutes=30)
+    return start_dt < slot_end and end_dt > slot_begin
+
+
+def validate_demand_coverage_loop(
+    day_assignments: pd.DataFrame,
+    demand_slots: list,
+    shifts: Dict[str, Shift],
+) -> List[Violation]:
+    """
+    Valida cobertura mínima por faixa horária.
+    Se demand_slots vazio, retorna lista vazia.
+    """
+    violations = []
+    if not demand_slots or day_assignments.empty or not shifts:
+        return violations
+
+    df = day_assignments[day_assignments["status"] == "WORK"].copy()
+    df["work_date"] = pd.to_datetime(df["work_date"])
+
+    for slot in demand_slots:
+        day_assigns = df[df["work_date"] == pd.Timestamp(slot.work_date)]
+        count = 0
+        for _, row in day_assigns.iterrows():
+            shift = shifts.get(row["shift_code"]) if row["shift_code"] else None
+            if shift and shift_overlaps_slot(shift, slot.work_date, slot.slot_start):
+                count += 1
+        if count < slot.min_required:
+            violations.append(Violation(
+                employee_id="COBERTURA",  # Violação de setor, não de pessoa
+                rule_code="R5_DEMAND_COVERAGE",
+                severity=ViolationSeverity.MEDIUM,
+                date_start=slot.work_date,
+                date_end=slot.work_date,
+                detail=f"Cobertura insuficiente em {slot.work_date} às {slot.slot_start}: {count} pessoas (mínimo: {slot.min_required})",
+                evidence={"slot": slot.slot_start, "actual": count, "min_required": slot.min_required},
+            ))
+    return violations
+
+
+def validate_intershift_rest_loop(
+    day_assignments: pd.DataFrame,
+    shifts: Dict[str, Shift],
+    constraints: Dict[str, Any],
+) -> List[Violation]:
+    """
+    R2: Valida intervalo mínimo entre jornadas (CLT Art. 66).
+    min_intershift_rest_minutes padrão 660 (11h).
+    """
+    violations = []
+    min_rest = int(constraints.get("min_intershift_rest_minutes", 660))
+    if day_assignments.empty or not shifts:
+        return violations
+
+    df = day_assignments[day_assignments["status"] == "WORK"].copy()
+    df["work_date"] = pd.to_datetime(df["work_date"])
+    df = df.sort_values(["employee_id", "work_date"])
+
+    for employee_id, group in df.groupby("employee_id"):
+        rows = list(group.itertuples())
+        for i in range(len(rows) - 1):
+            curr, nxt = rows[i], rows[i + 1]
+            curr_date = curr.work_date.date() if hasattr(curr.work_date, "date") else curr.work_date
+            nxt_date = nxt.work_date.date() if hasattr(nxt.work_date, "date") else nxt.work_date
+            delta_days = (nxt_date - curr_date).days
+            if delta_days > 1:
+                continue
+            shift_curr = shifts.get(curr.shift_code) if curr.shift_code else None
+            shift_nxt = shifts.get(nxt.shift_code) if nxt.shift_code else None
+            if not shift_curr or not shift_nxt:
+                continue
+            _, end_curr = shift_to_datetime_range(shift_curr, curr_date)
+            start_nxt, _ = shift_to_datetime_range(shift_nxt, nxt_date)
+            if delta_days == 1:
+                rest_minutes = (start_nxt - end_curr).total_seconds() / 60
+            else:
+                rest_minutes = (start_nxt - end_curr).total_seconds() / 60
+            if rest_minutes < min_rest:
+                violations.append(Violation(
+                    employee_id=employee_id,
+                    rule_code="R2_MIN_INTERSHIFT_REST",
+                    severity=ViolationSeverity.CRITICAL,
+                    date_start=curr_date,
+                    date_end=nxt_date,
+                    detail=f"Intervalo entre jornadas {int(rest_minutes)} min (mínimo: {min_rest})",
+                    evidence={"rest_minutes": rest_minutes, "min_required": min_rest},
+                ))
+    return violations
+
+
+def validate_weekly_hours_loop(
+    day_assignments: pd.DataFrame,
+    contract_targets: Dict[str, Any],
+    tolerance: int = 120,
+) -> List[Violation]:
+    violations = []
+    if day_assignments.empty: return violations
+
+    df = day_assignments.copy()
+    df['work_date'] = pd.to_datetime(df['work_date'])
+    df['week_start'] = df['work_date'] - pd.to_timedelta(df['work_date'].dt.weekday, unit='D')
+    
+    grouped = df.groupby(['employee_id', 'week_start'])['minutes'].sum().reset_index()
+    
+    for _, row in grouped.iterrows():
+        emp_id = row['employee_id']
+        actual = row['minutes']
+        profile = contract_targets.get(emp_id, {"weekly_minutes": 2640, "contract_code": "UNKNOWN"})
+        if isinstance(profile, dict):
+            target = int(profile.get("weekly_minutes", 2640))
+            contract_code = str(profile.get("contract_code", "UNKNOWN"))
+        else:
+            target = int(profile)
+            contract_code = "UNKNOWN"
+        
+        delta = actual - target
+        
+        if abs(delta) > tolerance:
+            severity = ViolationSeverity.HIGH if abs(delta) > 600 else ViolationSeverity.MEDIUM
+            violations.append(Violation(
+                employee_id=emp_id,
+                rule_code="R4_WEEKLY_TARGET",
+                severity=severity,
+                date_start=row['week_start'].date(),
+                date_end=(row['week_start'] + timedelta(days=6)).date(),
+                detail=f"[{contract_code}] Desvio de {delta} min (Meta: {target}, Real: {actual})",
+                evidence={"delta": delta, "actual": actual, "target": target, "contract_code": contract_code}
+            ))
+
+    return violations
+
+
+def validate_daily_minutes_loop(
+    day_assignments: pd.DataFrame,
+    constraints: Dict[str, Any],
+) -> List[Violation]:
+    """
+    R6: valida limite diário operacional de minutos por colaborador.
+    """
+    violations = []
+    if day_assignments.empty:
+        return violations
+
+    op_limit = int(constraints.get("max_daily_minutes_operational", 585))  # ~9h45
+    hard_limit = int(constraints.get("max_daily_minutes_hard", 600))  # 10h
+
+    grouped = (
+        day_assignments.groupby(["employee_id", "work_date"], as_index=False)["minutes"].sum()
+    )
+    for _, row in grouped.iterrows():
+        minutes = int(row["minutes"])
+        if minutes <= op_limit:
+            continue
+        severity = ViolationSeverity.CRITICAL if minutes > hard_limit else ViolationSeverity.HIGH
+        violations.append(
+            Violation(
+                employee_id=str(row["employee_id"]),
+                rule_code="R6_MAX_DAILY_MINUTES",
+                severity=severity,
+                date_start=row["work_date"],
+                date_end=row["work_date"],
+                detail=(
+                    f"Carga diária {minutes} min excede limite operacional "
+                    f"({op_limit} min; teto duro {hard_limit} min)"
+                ),
+                evidence={
+                    "minutes": minutes,
+                    "operational_limit": op_limit,
+                    "hard_limit": hard_limit,
+                },
+            )
+        )
+    return violations
+
+
+def apply_preferences_loop(final_assignments: pd.DataFrame, preferences: list, shifts: Dict[str, Shift]) -> tuple:
+    """Passo 5 original do orquestrador: uma máscara no frame inteiro por pedido aprovado."""
+    final_assignments = final_assignments.copy()
+    processed_requests = []
+    approved = [p for p in preferences if p.decision.value == "APPROVED"]
+    for pref in approved:
+        mask = (final_assignments["employee_id"] == pref.employee_id) & \
+               (pd.to_datetime(final_assignments["work_date"]) == pd.Timestamp(pref.request_date))
+        if not mask.any():
+            continue
+        if pref.request_type.value == "FOLGA_ON_DATE":
+            final_assignments.loc[mask, ["status", "shift_code", "minutes", "source_rule"]] = ["FOLGA", "", 0, "PREFERENCE_APPLIED"]
+            processed_requests.append({"request_id": pref.request_id, "applied": True})
+        elif pref.request_type.value == "AVOID_SUNDAY_DATE":
+            final_assignments.loc[mask, ["status", "shift_code", "minutes", "source_rule"]] = ["FOLGA", "", 0, "PREFERENCE_APPLIED"]
+            processed_requests.append({"request_id": pref.request_id, "applied": True})
+        elif pref.request_type.value == "SHIFT_CHANGE_ON_DATE" and pref.target_shift_code:
+            target_shift = shifts.get(pref.target_shift_code)
+            new_mins = int(target_shift.minutes) if target_shift else 480
+            final_assignments.loc[mask, ["shift_code", "minutes", "source_rule"]] = [pref.target_shift_code, new_mins, "PREFERENCE_APPLIED"]
+            processed_requests.append({"request_id": pref.request_id, "applied": True})
+    return final_assignments, processed_requests
+
+
+def apply_exceptions_loop(final_assignments: pd.DataFrame, exceptions: list) -> tuple:
+    """Passo 5b original do orquestrador: uma máscara no frame inteiro por exceção."""
+    final_assignments = final_assignments.copy()
+    exceptions_applied = 0
+    for exc in exceptions:
+        mask = (final_assignments["employee_id"] == exc.employee_id) & \
+               (pd.to_datetime(final_assignments["work_date"]) == pd.Timestamp(exc.exception_date))
+        if mask.any():
+            # Converte WORK em ABSENCE (ou FOLGA se já era folga — mantém)
+            work_mask = mask & (final_assignments["status"] == "WORK")
+            if work_mask.any():
+                final_assignments.loc[work_mask, ["status", "shift_code", "minutes", "source_rule"]] = [
+                    "ABSENCE", "", 0, f"EXCEPTION_{exc.exception_type.value}"
+                ]
+                exceptions_applied += 1
+    return final_assignments, exceptions_applied
@@ -0,0 +1,121 @@
+"""Dados sintéticos (mosaico, rodízio, ciclo, alocações, turnos, demanda, exceções, pedidos) dos testes e benchmarks."""
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+
+from apps.backend.src.domain.engines import CycleGenerator
+from apps.backend.src.domain.models import (
+    DemandSlot,
+    ExceptionType,
+    PreferenceRequest,
+    ProjectionContext,
+    RequestDecision,
+    RequestType,
+    ScheduleException,
+    Shift,
+    ShiftDayScope,
+)
+
+WEEKDAYS = ["MON", "TUE", "WED", "THU", "FRI", "SAT"]
+ANCHOR = date(2026, 1, 4)  # domingo
+
+
+def synthetic_template(n_employees: int) -> pd.DataFrame:
+    """Mosaico SEG-SAB com uma folga semanal rotativa por colaborador."""
+    rows = []
+    for i in range(n_employees):
+        for d_idx, day in enumerate(WEEKDAYS):
+            if d_idx == i % 6:
+                continue
+            rows.append({"employee_id": f"E{i:04d}", "day_key": day, "shift_code": f"CAI{1 + i % 6}", "minutes": 480})
+    return pd.DataFrame(rows)
+
+
+def synthetic_rotation(n_employees: int, n_scales: int) -> pd.DataFrame:
+    """Rodízio de domingos: cada colaborador trabalha 1 a cada 3 escalas, com folga compensatória."""
+    rows = []
+    for scale in range(1, n_scales + 1):
+        sunday = ANCHOR + timedelta(weeks=scale - 1)
+        for i in range(n_employees):
+            if (i + scale) % 3:
+                continue
+            rows.append({
+                "scale_index": scale,
+                "employee_id": f"E{i:04d}",
+                "sunday_date": sunday,
+                "folga_date": sunday + timedelta(days=1 + i % 6),
+            })
+    return pd.DataFrame(rows)
+
+
+def synthetic_cycle(n_employees: int, n_scales: int = 6) -> pd.DataFrame:
+    return CycleGenerator().build_scale_cycle(
+        synthetic_rotation(n_employees, n_scales),
+        synthetic_template(n_employees),
+        "DOM_08_12_30",
+        270,
+    )
+
+
+def synthetic_assignments(n_employees: int, n_days: int) -> pd.DataFrame:
+    """Frame de alocações projetado (colaborador x dia) a partir do ciclo sintético."""
+    ctx = ProjectionContext(
+        period_start=ANCHOR,
+        period_end=ANCHOR + timedelta(days=n_days - 1),
+        sector_id="BENCH",
+        anchor_date=ANCHOR,
+    )
+    return CycleGenerator().project_cycle_to_period(synthetic_cycle(n_employees), ctx)
+
+
+def synthetic_shifts() -> dict:
+    shifts = {
+        f"CAI{k}": Shift(f"CAI{k}", 480, ShiftDayScope.WEEKDAY, "BENCH", f"{6 + k:02d}:00", f"{14 + k:02d}:00")
+        for k in range(1, 7)
+    }
+    shifts["DOM_08_12_30"] = Shift("DOM_08_12_30", 270, ShiftDayScope.SUNDAY, "BENCH", "08:00", "12:30")
+    return shifts
+
+
+def synthetic_demand(n_days: int, min_required: int) -> list:
+    """48 slots de 30 min por dia."""
+    return [
+        DemandSlot("BENCH", ANCHOR + timedelta(days=d), f"{m // 60:02d}:{m % 60:02d}", min_required)
+        for d in range(n_days)
+        for m in range(0, 24 * 60, 30)
+    ]
+
+
+def synthetic_exceptions(n_employees: int, n_days: int, count: int, seed: int = 0) -> list:
+    """Férias/atestados aleatórios (com repetições de chave) dentro do período."""
+    rng = random.Random(seed)
+    types = list(ExceptionType)
+    return [
+        ScheduleException(
+            "BENCH",
+            f"E{rng.randrange(n_employees):04d}",
+            ANCHOR + timedelta(days=rng.randrange(n_days)),
+            rng.choice(types),
+        )
+        for _ in range(count)
+    ]
+
+
+def synthetic_preferences(n_employees: int, n_days: int, count: int, seed: int = 0) -> list:
+    """Pedidos misturados (aprovados/rejeitados, turno inexistente, colaborador fora da escala)."""
+    rng = random.Random(seed)
+    prefs = []
+    for k in range(count):
+        request_type = rng.choice(list(RequestType))
+        target = rng.choice(["CAI1", "CAI3", "XYZ", None]) if request_type == RequestType.SHIFT_CHANGE_ON_DATE else None
+        prefs.append(PreferenceRequest(
+            request_id=f"P{k}",
+            employee_id=f"E{rng.randrange(n_employees + 5):04d}",  # alguns fora da escala
+            request_date=ANCHOR + timedelta(days=rng.randrange(n_days)),
+            request_type=request_type,
+            priority="MEDIUM",
+            target_shift_code=target,
+            decision=rng.choice([RequestDecision.APPROVED, RequestDecision.APPROVED, RequestDecision.REJECTED]),
+        ))
+    return prefs
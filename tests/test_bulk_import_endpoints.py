@@ -0,0 +1,118 @@
+"""Regressão: /exceptions/bulk e /preferences/bulk (array JSON ou NDJSON, status por item, um INSERT)."""
+import json
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.src.domain.models import Employee, ExceptionType, ScheduleException
+
+
+@pytest.fixture
+def client(memory_repo):
+    memory_repo.add_sector("CAIXA", "Caixa")
+    memory_repo.add_contract("H44", "CAIXA", 2640)
+    for i in range(3):
+        memory_repo.add_employee(Employee(f"E{i}", f"Colaborador {i}", "H44", "CAIXA"))
+    app.dependency_overrides[get_repo] = lambda: memory_repo
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _statuses(body):
+    return [(r["index"], r["status"]) for r in body["results"]]
+
+
+def test_exceptions_bulk_reports_each_row_and_inserts_once(client, memory_repo):
+    memory_repo.add_exception(ScheduleException("CAIXA", "E0", date(2026, 3, 1), ExceptionType.VACATION))
+    inserts = []
+    event.listen(
+        memory_repo.session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: inserts.append(statement) if statement.startswith("INSERT") else None,
+    )
+    payload = [
+        {"employee_id": "E0", "exception_date": "2026-03-01", "exception_type": "VACATION"},  # já no banco
+        {"employee_id": "E1", "exception_date": "2026-03-01", "exception_type": "VACATION"},
+        {"employee_id": "E1", "exception_date": "2026-03-01", "exception_type": "VACATION"},  # repetido no lote
+        {"employee_id": "E2", "exception_date": "2026-03-02", "exception_type": "FERIAS"},
+        {"employee_id": "X9", "exception_date": "2026-03-02", "exception_type": "BLOCK"},
+        {"employee_id": "E2", "exception_date": "não é data", "exception_type": "BLOCK"},
+        {"employee_id": "E2", "exception_date": "2026-03-03", "exception_type": "MEDICAL_LEAVE", "note": "atestado"},
+    ]
+    res = client.post("/exceptions/bulk", json=payload)
+
+    assert res.status_code == 200
+    body = res.json()
+    assert _statuses(body) == [
+        (0, "DUPLICATE"), (1, "CREATED"), (2, "DUPLICATE"), (3, "INVALID"), (4, "INVALID"), (5, "INVALID"), (6, "CREATED"),
+    ]
+    assert (body["created"], body["duplicates"], body["invalid"]) == (2, 2, 3)
+    assert "FERIAS" in body["results"][3]["error"]
+    assert "X9" in body["results"][4]["error"]
+    assert body["results"][5]["error"].startswith("exception_date")
+    assert len(inserts) == 1
+    assert len(memory_repo.load_exceptions("CAIXA")) == 3
+
+
+def test_exceptions_bulk_accepts_ndjson_stream(client, memory_repo):
+    lines = [
+        json.dumps({"employee_id": f"E{i % 3}", "exception_date": str(date(2026, 4, 1) + timedelta(days=i)), "exception_type": "VACATION"})
+        for i in range(30)
+    ]
+    lines.insert(5, "{quebrado")
+    lines.insert(6, "")
+    res = client.post(
+        "/exceptions/bulk",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert (body["created"], body["duplicates"], body["invalid"]) == (30, 0, 1)
+    assert body["results"][5] == {"index": 5, "status": "INVALID", "error": "JSON inválido"}
+    assert len(memory_repo.load_exceptions("CAIXA")) == 30
+
+
+def test_bulk_rejects_non_list_body(client):
+    assert client.post("/exceptions/bulk", json={"employee_id": "E0"}).status_code == 422
+    assert client.post("/preferences/bulk", content="{", headers={"Content-Type": "application/json"}).status_code == 422
+
+
+def test_preferences_bulk_dedupes_by_request_id(client, memory_repo):
+    base = {"employee_id": "E0", "request_date": "2026-03-10", "request_type": "FOLGA_ON_DATE"}
+    assert client.post("/preferences", json={**base, "request_id": "P1"}).status_code == 200
+    payload = [
+        {**base, "request_id": "P1"},
+        {**base, "request_id": "P2"},
+        {**base, "request_id": "P2", "note": "repetido"},
+        {**base, "request_id": "P3", "request_type": "QUALQUER"},
+        {**base, "request_id": "P4", "employee_id": "E2", "request_type": "SHIFT_CHANGE_ON_DATE", "target_shift_code": "CAI1"},
+    ]
+    body = client.post("/preferences/bulk", json=payload).json()
+    assert _statuses(body) == [(0, "DUPLICATE"), (1, "CREATED"), (2, "DUPLICATE"), (3, "INVALID"), (4, "CREATED")]
+    prefs = {p.request_id: p for p in memory_repo.load_preferences()}
+    assert sorted(prefs) == ["P1", "P2", "P4"]
+    assert prefs["P4"].target_shift_code == "CAI1"
+    assert prefs["P2"].decision.value == "PENDING"
+
+
+def test_ndjson_results_point_at_physical_lines(client, memory_repo):
+    ok = {"employee_id": "E0", "exception_date": "2026-05-01", "exception_type": "VACATION"}
+    payload = "\n".join([
+        json.dumps(ok),
+        "",
+        "   ",
+        json.dumps({**ok, "exception_type": "QUALQUER"}),
+        "{quebrado",
+        json.dumps({**ok, "exception_date": "2026-05-02"}),
+    ])
+    res = client.post("/exceptions/bulk", content=payload, headers={"Content-Type": "application/x-ndjson"})
+    body = res.json()
+    assert [(r["index"], r["status"]) for r in body["results"]] == [(0, "CREATED"), (3, "INVALID"), (4, "INVALID"), (5, "CREATED")]
+    assert body["results"][2]["error"] == "JSON inválido"
@@ -0,0 +1,76 @@
+"""Regressão: grade do calendário montada uma vez (pivot data x colaborador) equivale à busca célula a célula."""
+import random
+import re
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from apps.backend.src.infrastructure.presenters import export_calendar
+from apps.backend.src.infrastructure.presenters.export_calendar import CalendarGrid, _cell_css, _cell_value
+
+
+def _random_schedule(seed: int) -> pd.DataFrame:
+    """Datas em str e date, colaborador/dia duplicado e ausente, turnos fora do SHIFT_SHORT."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(6):
+        for d in range(35):
+            if rng.random() < 0.1:
+                continue
+            status = rng.choice(["WORK", "WORK", "FOLGA", "ABSENCE"])
+            shift = rng.choice(["CAI1", "DOM_08_12_30", "H_DOM", "TURNO_LONGO", ""]) if status == "WORK" else ""
+            work_date = date(2026, 3, 1) + timedelta(days=d)
+            rows.append({
+                "work_date": str(work_date) if rng.random() < 0.5 else work_date,
+                "employee_id": f"E{i}",
+                "status": status,
+                "shift_code": shift,
+                "minutes": 480,
+            })
+            if rng.random() < 0.1:
+                rows.append({"work_date": work_date, "employee_id": f"E{i}", "status": "WORK", "shift_code": "CAI3", "minutes": 60})
+    rng.shuffle(rows)
+    return pd.DataFrame(rows)
+
+
+def _cell_by_scan(df: pd.DataFrame, day: pd.Timestamp, employee_id: str) -> tuple:
+    """Busca original: varredura do frame por célula, primeira linha do par."""
+    match = df[(df["work_date"] == day) & (df["employee_id"] == employee_id)]
+    if match.empty:
+        return "—", "cell-empty"
+    row = match.iloc[0].to_dict()
+    return _cell_value(row), _cell_css(row["status"], row["shift_code"])
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_grid_matches_per_cell_scan(seed):
+    df = _random_schedule(seed)
+    names = {"E0": "Zeca", "E1": "Ana", "E2": "Bia"}
+    grid = CalendarGrid.from_assignments(df, names)
+
+    scan = df.assign(work_date=pd.to_datetime(df["work_date"]))
+    assert grid.employees == ["E1", "E2", "E3", "E4", "E5", "E0"]
+    assert grid.dates == sorted(scan["work_date"].unique())
+    for i, day in enumerate(grid.dates):
+        for j, employee_id in enumerate(grid.employees):
+            assert (grid.values[i, j], grid.css[i, j]) == _cell_by_scan(scan, day, employee_id)
+
+
+def test_export_files_build_one_grid_for_both_formats(tmp_path, monkeypatch):
+    df = _random_schedule(0)
+    calls = []
+    build = CalendarGrid.from_assignments.__func__
+
+    def counting(cls, *args, **kwargs):
+        calls.append(1)
+        return build(cls, *args, **kwargs)
+
+    monkeypatch.setattr(CalendarGrid, "from_assignments", classmethod(counting))
+    paths = export_calendar.export_calendar_files(tmp_path, df, [], {}, date(2026, 3, 1), date(2026, 4, 4))
+
+    assert len(calls) == 1
+    html = paths["html"].read_text(encoding="utf-8")
+    markdown = paths["markdown"].read_text(encoding="utf-8")
+    n_days = df["work_date"].astype(str).nunique()
+    assert html.count('<tr><th class="col-date">') == len(re.findall(r"^\| \d\d/\d\d \|", markdown, re.M)) == n_days
@@ -0,0 +1,125 @@
+"""Regressão: loaders colunares (select -> DataFrame) sem hidratar ORM, e motores aceitando frames."""
+from datetime import date
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.src.domain.engines import CycleGenerator, PolicyEngine
+from apps.backend.src.domain.models import DemandSlot, Employee, ExceptionType, ScheduleException
+from apps.backend.src.infrastructure.database.extended_orm import (
+    CycleTemplateORM,
+    DemandProfileORM,
+    ExceptionORM,
+    SundayRotationORM,
+)
+from tests.oracles.synthetic import synthetic_assignments, synthetic_demand, synthetic_exceptions, synthetic_shifts
+
+
+@pytest.fixture
+def seeded_repo(memory_repo):
+    repo = memory_repo
+    repo.add_sector("CAIXA", "Caixa")
+    repo.add_contract("H44", "CAIXA", 2640)
+    for i in range(3):
+        repo.add_employee(Employee(f"E{i}", f"Colaborador {i}", "H44", "CAIXA"))
+    repo.add_exceptions_bulk([
+        ScheduleException("CAIXA", "E0", date(2026, 2, 2), ExceptionType.VACATION, "praia"),
+        ScheduleException("CAIXA", "E1", date(2026, 2, 3), ExceptionType.BLOCK),
+        ScheduleException("ACOUGUE", "X", date(2026, 2, 3), ExceptionType.BLOCK),
+    ])
+    repo.save_demand_profile_bulk([DemandSlot("CAIXA", date(2026, 2, 2), f"{h:02d}:00", 2) for h in range(8, 12)])
+    repo.save_sunday_rotation(pd.DataFrame([
+        {"scale_index": 1, "employee_id": "E0", "sunday_date": "2026-02-01", "folga_date": "2026-02-04"},
+        {"scale_index": 2, "employee_id": "E1", "sunday_date": "2026-02-08", "folga_date": None},
+    ]))
+    repo.save_weekday_template(pd.DataFrame([
+        {"employee_id": "E0", "day_key": "MON", "shift_code": "CAI1", "minutes_median": 480},
+    ]), "CAIXA")
+    return repo
+
+
+def test_loaders_read_columns_without_orm_instances(seeded_repo):
+    hydrated = []
+
+    def on_load(target, context):
+        hydrated.append(type(target).__name__)
+
+    mappers = (ExceptionORM, DemandProfileORM, SundayRotationORM, CycleTemplateORM)
+    for mapper in mappers:
+        event.listen(mapper, "load", on_load)
+    try:
+        exceptions = seeded_repo.load_exceptions_df("CAIXA", date(2026, 2, 1), date(2026, 2, 28))
+        demand = seeded_repo.load_demand_profile_df("CAIXA")
+        rotation = seeded_repo.load_sunday_rotation("CAIXA")
+        template = seeded_repo.load_weekday_template_data("CAIXA")
+        listed = seeded_repo.load_exceptions("CAIXA")
+    finally:
+        for mapper in mappers:
+            event.remove(mapper, "load", on_load)
+    assert hydrated == []
+
+    assert list(exceptions.columns) == ["sector_id", "employee_id", "exception_date", "exception_type", "note"]
+    assert exceptions["employee_id"].tolist() == ["E0", "E1"]
+    assert exceptions["exception_date"].tolist() == [date(2026, 2, 2), date(2026, 2, 3)]
+    assert [(e.employee_id, e.exception_type, e.note) for e in listed] == [
+        ("E0", ExceptionType.VACATION, "praia"),
+        ("E1", ExceptionType.BLOCK, ""),
+    ]
+    assert list(demand.columns) == ["sector_id", "work_date", "slot_start", "min_required"]
+    assert demand["min_required"].tolist() == [2, 2, 2, 2]
+    assert rotation["sunday_date"].tolist() == [date(2026, 2, 1), date(2026, 2, 8)]
+    assert template[["day_key", "minutes"]].values.tolist() == [["MON", 480]]
+
+
+def test_empty_loaders_keep_columns(memory_repo):
+    assert memory_repo.load_exceptions_df("CAIXA").empty
+    assert list(memory_repo.load_demand_profile_df("CAIXA").columns) == ["sector_id", "work_date", "slot_start", "min_required"]
+    assert memory_repo.load_weekday_template_data("CAIXA").empty
+    assert memory_repo.load_sunday_rotation("CAIXA").empty
+
+
+def test_engines_accept_frames_and_lists_alike():
+    df = synthetic_assignments(20, 60)
+    exceptions = synthetic_exceptions(20, 60, 150, seed=3)
+    frame = pd.DataFrame({
+        "employee_id": [e.employee_id for e in exceptions],
+        "exception_date": [e.exception_date for e in exceptions],
+        "exception_type": [e.exception_type.value for e in exceptions],
+    })
+    from_list = CycleGenerator().apply_exceptions(df, exceptions)
+    from_frame = CycleGenerator().apply_exceptions(df, frame)
+    assert from_list[1] == from_frame[1] > 0
+    pd.testing.assert_frame_equal(from_list[0], from_frame[0])
+
+    slots = synthetic_demand(60, 6)
+    slots_frame = pd.DataFrame({
+        "work_date": [s.work_date for s in slots],
+        "slot_start": [s.slot_start for s in slots],
+        "min_required": [s.min_required for s in slots],
+    })
+    engine = PolicyEngine()
+    expected = engine.validate_demand_coverage(df, slots, synthetic_shifts())
+    assert expected
+    assert engine.validate_demand_coverage(df, slots_frame, synthetic_shifts()) == expected
+
+
+def test_list_routes_serialize_from_frames(seeded_repo):
+    app.dependency_overrides[get_repo] = lambda: seeded_repo
+    try:
+        client = TestClient(app)
+        rotation = client.get("/sunday-rotation").json()
+        template = client.get("/weekday-template").json()
+        exceptions = client.get("/exceptions", params={"period_start": "2026-02-03"}).json()
+        demand = client.get("/demand-profile").json()
+    finally:
+        app.dependency_overrides.clear()
+    assert rotation[1] == {"scale_index": 2, "employee_id": "E1", "sunday_date": "2026-02-08", "folga_date": None}
+    assert template == [{"employee_id": "E0", "day_key": "MON", "shift_code": "CAI1", "minutes": 480}]
+    assert exceptions == [
+        {"sector_id": "CAIXA", "employee_id": "E1", "exception_date": "2026-02-03", "exception_type": "BLOCK", "note": None}
+    ]
+    assert demand[0] == {"sector_id": "CAIXA", "work_date": "2026-02-02", "slot_start": "08:00", "min_required": 2}
@@ -0,0 +1,58 @@
+"""Regressão: perfil de desempenho do SQLite (PRAGMAs por conexão e pool)."""
+import threading
+
+from sqlalchemy import text
+
+from apps.backend.src.infrastructure.database.setup import create_sqlite_engine
+
+
+def _pragma(conn, name):
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_engine_profile_applies_pragmas(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    with engine.connect() as conn:
+        assert _pragma(conn, "journal_mode") == "wal"
+        assert _pragma(conn, "synchronous") == 1  # NORMAL
+        assert _pragma(conn, "busy_timeout") == 5000
+        assert _pragma(conn, "temp_store") == 2  # MEMORY
+        assert _pragma(conn, "cache_size") == -64000
+    assert engine.pool.size() == 10
+
+
+def test_engine_profile_reads_env_overrides(tmp_path, monkeypatch):
+    monkeypatch.setenv("ESCALAFLOW_SQLITE_SYNCHRONOUS", "FULL")
+    monkeypatch.setenv("ESCALAFLOW_SQLITE_POOL_SIZE", "3")
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    with engine.connect() as conn:
+        assert _pragma(conn, "synchronous") == 2
+    assert engine.pool.size() == 3
+
+    memory = create_sqlite_engine("sqlite://")
+    with memory.connect() as conn:
+        assert _pragma(conn, "temp_store") == 2
+
+
+def test_concurrent_writers_share_pool_without_lock_errors(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE hits (worker INTEGER, n INTEGER)"))
+    errors = []
+
+    def write(worker):
+        try:
+            for n in range(25):
+                with engine.begin() as conn:
+                    conn.execute(text("INSERT INTO hits VALUES (:w, :n)"), {"w": worker, "n": n})
+        except Exception as exc:  # pragma: no cover - falha do teste
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(w,)) for w in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM hits")).scalar() == 150
@@ -0,0 +1,105 @@
+"""Regressão: consultas quentes do repositório usam índice (EXPLAIN QUERY PLAN)."""
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from apps.backend.src.domain.models import DemandSlot, ExceptionType, ScheduleException
+from apps.backend.src.infrastructure.database import migrations
+
+
+@contextmanager
+def _captured_selects(repo):
+    statements = []
+    engine = repo.session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def _plans(repo, statements):
+    plans = []
+    for statement, parameters in statements:
+        rows = repo.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        plans.append(" | ".join(row[-1] for row in rows))
+    return plans
+
+
+def test_load_exceptions_and_demand_use_index_range_scans(memory_repo):
+    with _captured_selects(memory_repo) as statements:
+        memory_repo.load_exceptions(sector_id="CAIXA", period_start=date(2026, 1, 1), period_end=date(2026, 12, 31))
+        memory_repo.load_demand_profile("CAIXA", date(2026, 1, 1), date(2026, 12, 31))
+    exceptions_plan, demand_plan = _plans(memory_repo, statements)
+    assert "USING INDEX ix_exceptions_sector_date (sector_id=? AND exception_date>? AND exception_date<?)" in exceptions_plan
+    assert "USING INDEX uq_demand_profile_sector_date_slot (sector_id=? AND work_date>? AND work_date<?)" in demand_plan
+
+
+def test_natural_key_inserts_rely_on_unique_indexes(memory_repo):
+    exc = ScheduleException("CAIXA", "ALICE", date(2026, 2, 2), ExceptionType.VACATION)
+    slot = DemandSlot("CAIXA", date(2026, 2, 2), "08:00", 2)
+    with _captured_selects(memory_repo) as statements:
+        memory_repo.add_exception(exc)
+        memory_repo.add_exception(exc)  # repetida: ON CONFLICT DO NOTHING
+        memory_repo.add_demand_slot(slot)
+        memory_repo.add_demand_slot(DemandSlot("CAIXA", date(2026, 2, 2), "08:00", 5))
+    assert statements == []  # sem SELECT de checagem por item
+    assert len(memory_repo.load_exceptions(sector_id="CAIXA")) == 1
+    assert [s.min_required for s in memory_repo.load_demand_profile("CAIXA")] == [2]
+
+
+def test_template_and_rotation_loads_use_indexes(memory_repo):
+    memory_repo.add_sector("CAIXA", "Caixa")
+    with _captured_selects(memory_repo) as statements:
+        memory_repo.load_weekday_template_data("CAIXA")
+        memory_repo.load_sunday_rotation("CAIXA")
+    # CAIXA sem mosaico namespaced ainda tenta o legado: a rotação é o último SELECT.
+    template_plan, rotation_plan = _plans(memory_repo, [statements[0], statements[-1]])
+    assert "USING INDEX ix_cycle_templates_source (source=?)" in template_plan
+    # Consulta real do repositório: join com employees do setor, ordenada por id.
+    assert "ix_employees_sector_id (sector_id=?)" in rotation_plan
+    assert "USING INDEX ix_sunday_rotations_employee_id (employee_id=?)" in rotation_plan
+
+
+def test_index_migration_dedupes_existing_rows(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE exceptions (id INTEGER PRIMARY KEY, sector_id VARCHAR, employee_id VARCHAR,"
+            " exception_date DATE, exception_type VARCHAR, note VARCHAR)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE demand_profile (id INTEGER PRIMARY KEY, sector_id VARCHAR, work_date DATE,"
+            " slot_start VARCHAR, min_required INTEGER)"
+        ))
+        for note in ("primeira", "repetida"):
+            conn.execute(text(
+                "INSERT INTO exceptions (sector_id, employee_id, exception_date, exception_type, note)"
+                " VALUES ('CAIXA', 'ALICE', '2026-02-02', 'VACATION', :note)"
+            ), {"note": note})
+        for minimum in (1, 3):
+            conn.execute(text(
+                "INSERT INTO demand_profile (sector_id, work_date, slot_start, min_required)"
+                " VALUES ('CAIXA', '2026-02-02', '08:00', :m)"
+            ), {"m": minimum})
+
+    migrations.run_migrations(engine)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT note FROM exceptions")).scalars().all() == ["primeira"]
+        assert conn.execute(text("SELECT min_required FROM demand_profile")).scalars().all() == [3]
+        with pytest.raises(IntegrityError):
+            conn.execute(text(
+                "INSERT INTO exceptions (sector_id, employee_id, exception_date, exception_type)"
+                " VALUES ('CAIXA', 'ALICE', '2026-02-02', 'VACATION')"
+            ))
+    index_names = {ix["name"] for ix in inspect(engine).get_indexes("sunday_rotations")}
+    assert "ix_sunday_rotations_employee_id" in index_names
@@ -0,0 +1,83 @@
+"""Regressão: migrações versionadas rodam uma vez, v1 é congelada e get_repo não toca no schema."""
+from sqlalchemy import create_engine, inspect, text
+
+from apps.backend import deps
+from apps.backend.src.infrastructure.database import migrations
+from apps.backend.src.infrastructure.database.orm_models import Base
+
+
+def test_migrations_apply_once_and_record_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    assert migrations.run_migrations(engine) == [number for number, _, _ in migrations.MIGRATIONS]
+    assert migrations.run_migrations(engine) == []
+
+    tables = set(inspect(engine).get_table_names())
+    assert {"schema_migrations", "employees", "exceptions", "demand_profile"} <= tables
+    with engine.connect() as conn:
+        assert migrations.current_version(conn) == migrations.MIGRATIONS[-1][0]
+
+
+def test_migrations_adopt_database_created_before_versioning(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.sqlite'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE sectors (sector_id VARCHAR PRIMARY KEY, name VARCHAR, active BOOLEAN)"))
+        conn.execute(text("INSERT INTO sectors VALUES ('CAIXA', 'Caixa', 1)"))
+    migrations.run_migrations(engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT name FROM sectors")).scalar_one() == "Caixa"
+    assert "employees" in inspect(engine).get_table_names()
+
+
+def test_get_repo_does_not_run_schema_setup(monkeypatch):
+    calls = []
+    monkeypatch.setattr(migrations, "run_migrations", lambda engine: calls.append(engine))
+    gen = deps.get_repo()
+    repo = next(gen)
+    assert repo.session is not None
+    gen.close()
+    assert calls == []
+
+
+def _schema(engine):
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT type, name FROM sqlite_master WHERE name NOT LIKE 'sqlite_%' AND name != 'schema_migrations'"
+        ))
+        return set(rows)
+
+
+def test_initial_schema_is_frozen_and_later_migrations_reach_orm(tmp_path):
+    v1 = create_engine(f"sqlite:///{tmp_path / 'v1.sqlite'}")
+    with v1.begin() as conn:
+        migrations._initial_schema(conn)
+    assert _schema(v1) == {
+        ("table", name)
+        for name in (
+            "sectors", "governance_audit_events", "shifts", "demand_profile", "contracts",
+            "employees", "preferences", "cycle_templates", "sunday_rotations", "exceptions",
+        )
+    }
+
+    migrated = create_engine(f"sqlite:///{tmp_path / 'migrated.sqlite'}")
+    migrations.run_migrations(migrated)
+    orm = create_engine(f"sqlite:///{tmp_path / 'orm.sqlite'}")
+    Base.metadata.create_all(orm)
+    assert _schema(migrated) == _schema(orm)
+    for table in Base.metadata.tables:
+        assert _table_shape(migrated, table) == _table_shape(orm, table), table
+
+
+def _table_shape(engine, table):
+    """Colunas (tipo, nulo, PK) e índices (colunas, único) como o SQLite os guardou."""
+    inspector = inspect(engine)
+    columns = [(c["name"], str(c["type"]), c["nullable"], c["primary_key"]) for c in inspector.get_columns(table)]
+    indexes = sorted((ix["name"], tuple(ix["column_names"]), bool(ix["unique"])) for ix in inspector.get_indexes(table))
+    return columns, indexes
+
+
+def test_numbered_migrations_do_not_follow_the_orm(tmp_path, monkeypatch):
+    # DDL congelado: mexer nos índices do ORM não muda o que as migrações já numeradas criam.
+    monkeypatch.setattr(Base.metadata.tables["employees"], "indexes", set())
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    migrations.run_migrations(engine)
+    assert "ix_employees_sector_id" in {ix["name"] for ix in inspect(engine).get_indexes("employees")}
@@ -0,0 +1,171 @@
+"""Regressão: export do calendário em segundo plano (fila de jobs, status e rotas de export)."""
+import threading
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+import apps.backend.routes.scale as scale_routes
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.schemas import PreflightResponse
+from apps.backend.src.application.export_jobs import DONE, FAILED, RUNNING, ExportJobQueue
+
+
+def _write_exports(tmp_path):
+    html = tmp_path / "escala_calendario.html"
+    markdown = tmp_path / "escala_calendario.md"
+    html.write_text("<html>calendario</html>", encoding="utf-8")
+    markdown.write_text("# EscalaFlow", encoding="utf-8")
+    return {"html": html, "markdown": markdown}
+
+
+def _fail():
+    raise OSError("disco cheio")
+
+
+def test_queue_records_result_and_error(tmp_path):
+    queue = ExportJobQueue()
+    try:
+        ok = queue.wait(queue.submit(lambda: _write_exports(tmp_path)), timeout=5)
+        failed = queue.wait(queue.submit(_fail), timeout=5)
+    finally:
+        queue.shutdown()
+
+    assert ok.status == DONE
+    assert ok.files["html"].endswith("escala_calendario.html")
+    assert ok.started_at is not None and ok.finished_at is not None
+    assert failed.status == FAILED
+    assert failed.error == "OSError: disco cheio"
+    assert queue.latest().job_id == failed.job_id
+    assert queue.get("nao-existe") is None
+
+
+def test_queue_keeps_only_recent_finished_jobs(tmp_path):
+    queue = ExportJobQueue(max_jobs=3)
+    try:
+        ids = [queue.submit(lambda: {}) for _ in range(6)]
+        queue.wait(ids[-1], timeout=5)
+        queue.submit(lambda: {})
+    finally:
+        queue.shutdown()
+
+    assert queue.get(ids[0]) is None
+    assert queue.get(ids[-1]) is not None
+
+
+def test_export_routes_serve_last_complete_file_while_job_runs(tmp_path, monkeypatch):
+    queue = ExportJobQueue()
+    monkeypatch.setattr(scale_routes, "EXPORT_JOBS", queue)
+    monkeypatch.setattr(scale_routes, "OUTPUT", tmp_path)
+    release = threading.Event()
+
+    def slow_render():
+        release.wait(5)
+        (tmp_path / "escala_calendario.html").write_text("<html>nova</html>", encoding="utf-8")
+        return {"html": tmp_path / "escala_calendario.html"}
+
+    client = TestClient(app)
+    try:
+        assert client.get("/scale/export/html").status_code == 404  # nenhum export ainda
+        _write_exports(tmp_path)
+        job_id = queue.submit(slow_render, sector_id="CAIXA")
+        during = client.get("/scale/export/html")
+        running = client.get(f"/scale/export/jobs/{job_id}", params={"sector_id": "CAIXA"})
+
+        release.set()
+        queue.wait(job_id, timeout=5)
+        status = client.get(f"/scale/export/jobs/{job_id}", params={"sector_id": "CAIXA"})
+        other_sector = client.get(f"/scale/export/jobs/{job_id}", params={"sector_id": "ACOUGUE"})
+        after = client.get("/scale/export/html")
+        download = client.get("/scale/export/markdown/download")
+    finally:
+        release.set()
+        queue.shutdown()
+
+    assert during.status_code == 200
+    assert during.text == "<html>calendario</html>"
+    assert running.json()["status"] in ("PENDING", RUNNING)
+    assert status.status_code == 200
+    assert status.json()["status"] == DONE
+    assert status.json()["sector_id"] == "CAIXA"
+    assert other_sector.status_code == 404
+    assert after.text == "<html>nova</html>"
+    assert "attachment" in download.headers["content-disposition"]
+    assert client.get("/scale/export/jobs/nao-existe").status_code == 404
+
+
+def test_failed_job_keeps_previous_export(tmp_path, monkeypatch):
+    queue = ExportJobQueue()
+    monkeypatch.setattr(scale_routes, "EXPORT_JOBS", queue)
+    monkeypatch.setattr(scale_routes, "OUTPUT", tmp_path)
+    _write_exports(tmp_path)  # arquivos completos de uma geração anterior
+    try:
+        job_id = queue.submit(_fail, sector_id="CAIXA")
+        queue.wait(job_id, timeout=5)
+    finally:
+        queue.shutdown()
+
+    client = TestClient(app)
+    status = client.get(f"/scale/export/jobs/{job_id}").json()
+    res = client.get("/scale/export/html")
+
+    assert status["status"] == FAILED
+    assert status["error"] == "OSError: disco cheio"
+    assert res.status_code == 200
+    assert res.text == "<html>calendario</html>"
+
+
+def test_latest_job_is_scoped_by_sector():
+    queue = ExportJobQueue()
+    try:
+        caixa = queue.submit(lambda: {}, sector_id="CAIXA")
+        acougue = queue.submit(lambda: {}, sector_id="ACOUGUE")
+        queue.wait(acougue, timeout=5)
+    finally:
+        queue.shutdown()
+
+    assert queue.latest("CAIXA").job_id == caixa
+    assert queue.latest("ACOUGUE").job_id == acougue
+    assert queue.latest().job_id == acougue
+    assert queue.latest("PADARIA") is None
+
+
+def test_generate_returns_export_job_id(memory_repo, monkeypatch):
+    queue = ExportJobQueue()
+    seen = {}
+
+    class FakeOrchestrator:
+        def __init__(self, export_jobs=None, **kwargs):
+            seen["export_jobs"] = export_jobs
+
+        def run(self, context, policy_path):
+            return {
+                "status": "SUCCESS",
+                "assignments_count": 0,
+                "violations_count": 0,
+                "preferences_processed": 0,
+                "export_job_id": seen["export_jobs"].submit(lambda: {}, sector_id=context.sector_id),
+                "run_id": 1,
+            }
+
+    monkeypatch.setattr(scale_routes, "EXPORT_JOBS", queue)
+    monkeypatch.setattr(scale_routes, "ValidationOrchestrator", FakeOrchestrator)
+    monkeypatch.setattr(
+        scale_routes,
+        "_build_preflight",
+        lambda req, repo: PreflightResponse(mode="NORMAL", blockers=[], critical_warnings=[], can_proceed=True, ack_required=False),
+    )
+    app.dependency_overrides[get_repo] = lambda: memory_repo
+    try:
+        res = TestClient(app).post(
+            "/scale/generate",
+            json={"period_start": "2026-03-01", "period_end": "2026-03-31", "sector_id": "CAI"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+        queue.shutdown()
+
+    assert res.status_code == 200
+    assert seen["export_jobs"] is queue
+    job_id = res.json()["export_job_id"]
+    assert queue.get(job_id).sector_id == "CAI"
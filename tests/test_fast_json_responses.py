@@ -0,0 +1,140 @@
+"""Regressão: o caminho rápido de JSON das listas de escala produz o mesmo conteúdo e o mesmo schema dos modelos Pydantic."""
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+import apps.backend.routes.scale as scale_routes
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.schemas import AssignmentResponse, PreflightResponse, ScaleSimulateResponse, ViolationResponse
+from apps.backend.src.domain.aggregates import ScheduleAggregates
+
+
+def _assignments(n_days: int = 14, employees=("ALICE", "BRUNO")) -> pd.DataFrame:
+    rows = []
+    for d in range(n_days):
+        for i, employee_id in enumerate(employees):
+            work = (d + i) % 7 != 0
+            rows.append({
+                "work_date": date(2026, 2, 1) + timedelta(days=d),
+                "employee_id": employee_id,
+                "status": "WORK" if work else "FOLGA",
+                "shift_code": "CAI1" if work else "",
+                "minutes": 480 if work else 0,
+                "source_rule": "TEMPLATE_BASE",
+            })
+    return pd.DataFrame(rows)
+
+
+def _violations() -> pd.DataFrame:
+    return pd.DataFrame([
+        {"employee_id": "ALICE", "rule_code": "R1_MAX_CONSECUTIVE ", "severity": "CRITICAL",
+         "date_start": date(2026, 2, 2), "date_end": date(2026, 2, 9), "detail": "7 dias"},
+        {"employee_id": "COBERTURA", "rule_code": "R5_DEMAND_COVERAGE", "severity": "MEDIUM",
+         "date_start": date(2026, 2, 3), "date_end": date(2026, 2, 3), "detail": "slot 08:00"},
+    ])
+
+
+def test_official_lists_match_model_serialization(memory_repo):
+    memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 2, 14), _assignments(), _violations())
+    run_id = memory_repo.latest_schedule_run_id("CAIXA")
+    app.dependency_overrides[get_repo] = lambda: memory_repo
+    try:
+        client = TestClient(app)
+        assignments = client.get("/scale/assignments")
+        violations = client.get("/scale/violations")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert assignments.headers["content-type"] == "application/json"
+    expected_assignments = scale_routes._assignments_to_response(memory_repo.load_schedule_assignments_df(run_id), {})
+    expected_violations = scale_routes._violations_to_response(memory_repo.load_schedule_violations_df(run_id), {})
+    assert assignments.json() == [row.model_dump() for row in expected_assignments]
+    assert violations.json() == [row.model_dump() for row in expected_violations]
+    assert TypeAdapter(list[AssignmentResponse]).validate_json(assignments.content) == expected_assignments
+    assert TypeAdapter(list[ViolationResponse]).validate_json(violations.content) == expected_violations
+
+
+def _fake_simulation(monkeypatch) -> None:
+    class _FakeOrchestrator:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def run(self, *args, **kwargs):
+            return {
+                "status": "SUCCESS",
+                "assignments_count": 28,
+                "violations_count": 2,
+                "preferences_processed": 0,
+                "exceptions_applied": 0,
+                "preview_assignments": _assignments(),
+                "preview_violations": _violations().to_dict("records"),
+                "aggregates": ScheduleAggregates.from_assignments(_assignments()),
+            }
+
+    monkeypatch.setattr(scale_routes, "ValidationOrchestrator", _FakeOrchestrator)
+    monkeypatch.setattr(
+        scale_routes,
+        "_build_preflight",
+        lambda req, repo: PreflightResponse(mode="NORMAL", blockers=[], critical_warnings=[], can_proceed=True, ack_required=False),
+    )
+
+
+def test_simulate_json_validates_against_response_model(monkeypatch):
+    _fake_simulation(monkeypatch)
+    res = TestClient(app).post(
+        "/scale/simulate", json={"period_start": "2026-02-01", "period_end": "2026-02-14", "sector_id": "CAIXA"}
+    )
+    body = ScaleSimulateResponse.model_validate_json(res.content)
+    assert len(body.assignments) == 28
+    assert body.violations[0].rule_code == "R1_MAX_CONSECUTIVE"
+    assert body.violations[0].rule_label == "Dias consecutivos (máx. 6)"
+
+
+def test_openapi_still_documents_response_models():
+    paths = app.openapi()["paths"]
+
+    def schema(path, method):
+        return paths[path][method]["responses"]["200"]["content"]["application/json"]["schema"]
+
+    assert schema("/scale/assignments", "get")["items"]["$ref"].endswith("/AssignmentResponse")
+    assert schema("/scale/violations", "get")["items"]["$ref"].endswith("/ViolationResponse")
+    assert schema("/scale/simulate", "post")["$ref"].endswith("/ScaleSimulateResponse")
+
+
+def _declared_model(path: str, method: str):
+    for route in scale_routes.router.routes:
+        if route.path == path and method.upper() in route.methods:
+            return route.response_model
+    raise AssertionError(f"rota {method} {path} não encontrada")
+
+
+PERIOD = {"period_start": "2026-02-01", "period_end": "2026-02-14", "sector_id": "CAIXA"}
+FAST_PATH_CALLS = [
+    ("get", "/scale/assignments", None),
+    ("get", "/scale/violations", None),
+    ("post", "/scale/simulate", PERIOD),
+    ("post", "/scale/weekly-analysis", {**PERIOD, "mode": "SIMULATION"}),
+    ("post", "/scale/weekly-analysis", {**PERIOD, "mode": "SIMULATION", "week_definitions": ["SUN_SAT"]}),
+]
+
+
+@pytest.mark.parametrize("method,path,body", FAST_PATH_CALLS)
+def test_fast_path_body_is_exactly_the_declared_response_model(memory_repo, monkeypatch, method, path, body):
+    """O corpo montado à mão valida no `response_model` da rota e não tem campo a mais nem a menos."""
+    memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 2, 14), _assignments(), _violations())
+    _fake_simulation(monkeypatch)
+    app.dependency_overrides[get_repo] = lambda: memory_repo
+    try:
+        client = TestClient(app)
+        res = client.get(path) if method == "get" else client.post(path, json=body)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert res.status_code == 200
+    adapter = TypeAdapter(_declared_model(path, method))
+    parsed = adapter.validate_json(res.content)
+    assert adapter.dump_python(parsed, mode="json") == res.json()
@@ -0,0 +1,60 @@
+"""Regressão: cache de policy (mtime/tamanho) e invalidação pelas rotas de configuração."""
+import json
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from apps.backend.main import app
+import apps.backend.routes.config as config_routes
+from apps.backend.src.domain.policy_loader import POLICY_CACHE, PolicyCache, PolicyLoader
+
+ROOT = Path(__file__).resolve().parents[1]
+EXAMPLE_POLICY = ROOT / "schemas" / "compliance_policy.example.json"
+
+client = TestClient(app)
+
+
+def test_cache_reuses_policy_until_file_changes(tmp_path):
+    policy_path = tmp_path / "policy.json"
+    policy_path.write_text(EXAMPLE_POLICY.read_text(encoding="utf-8"), encoding="utf-8")
+    cache = PolicyCache()
+    loader = PolicyLoader(schemas_path=ROOT / "schemas", cache=cache)
+
+    first = loader.load_policy(policy_path)
+    assert loader.load_policy(policy_path) is first
+    assert cache.load_data(policy_path) is cache.load_data(policy_path)
+    assert cache.stats() == {"hits": 3, "misses": 1, "entries": 1}
+    assert first == PolicyLoader(schemas_path=ROOT / "schemas").load_policy(policy_path)
+
+    copy = cache.load_data(policy_path, copy=True)
+    copy["constraints"]["min_intershift_rest_minutes"] = 1
+    assert cache.load_data(policy_path)["constraints"].get("min_intershift_rest_minutes") != 1
+
+    data = json.loads(policy_path.read_text(encoding="utf-8"))
+    data["policy_version"] = "changed"
+    policy_path.write_text(json.dumps(data), encoding="utf-8")
+    stat = policy_path.stat()
+    os.utime(policy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    reloaded = loader.load_policy(policy_path)
+    assert reloaded is not first
+    assert reloaded.policy_version == "changed"
+    assert cache.misses == 2
+
+
+def test_config_writes_invalidate_shared_cache(tmp_path, monkeypatch):
+    policy_path = tmp_path / "policy.json"
+    policy_path.write_text(json.dumps({"runtime_mode": {"mode": "NORMAL"}}), encoding="utf-8")
+    monkeypatch.setattr(config_routes, "POLICY_PATH", policy_path)
+
+    assert client.get("/config/runtime-mode").json()["mode"] == "NORMAL"
+    before = client.get("/config/policy-cache").json()
+    assert client.get("/config/runtime-mode").json()["mode"] == "NORMAL"
+    after_hit = POLICY_CACHE.stats()
+    assert after_hit["hits"] == before["hits"] + 1
+    assert after_hit["misses"] == before["misses"]
+
+    ok = client.patch("/config/runtime-mode", json={"mode": "ESTRITO", "actor_role": "ADMIN"})
+    assert ok.status_code == 200
+    assert client.get("/config/runtime-mode").json()["mode"] == "ESTRITO"
+    assert POLICY_CACHE.stats()["misses"] > after_hit["misses"]
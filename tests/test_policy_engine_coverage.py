@@ -0,0 +1,64 @@
+"""Regressão R5: cobertura por varredura de intervalos equivale ao laço original."""
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from apps.backend.src.domain.engines import PolicyEngine
+from apps.backend.src.domain.models import DemandSlot, Shift, ShiftDayScope
+from tests.oracles import legacy_engines
+
+
+SHIFTS = {
+    "CAI1": Shift("CAI1", 480, ShiftDayScope.WEEKDAY, "CAIXA", "08:00", "16:00"),
+    "CAI2": Shift("CAI2", 420, ShiftDayScope.WEEKDAY, "CAIXA", "13:30", "20:30"),
+    "NOITE": Shift("NOITE", 480, ShiftDayScope.WEEKDAY, "CAIXA", "22:00", "06:00"),
+    "SEMHORA": Shift("SEMHORA", 330, ShiftDayScope.WEEKDAY, "CAIXA"),
+    "DOM_08_12_30": Shift("DOM_08_12_30", 270, ShiftDayScope.SUNDAY, "CAIXA", "08:00", "12:30"),
+}
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_demand_coverage_matches_loop(seed):
+    rng = random.Random(seed)
+    start = date(2026, 2, 1)
+    codes = list(SHIFTS) + ["", "DESCONHECIDO"]
+    rows = [
+        {
+            "work_date": start + timedelta(days=rng.randrange(10)),
+            "employee_id": f"E{i}",
+            "status": rng.choice(["WORK", "WORK", "WORK", "FOLGA"]),
+            "shift_code": rng.choice(codes),
+            "minutes": 480,
+        }
+        for i in range(120)
+    ]
+    slots = [
+        DemandSlot("CAIXA", start + timedelta(days=d), f"{h:02d}:{m:02d}", rng.randint(0, 6))
+        for d in range(11)
+        for h in range(0, 24, 2)
+        for m in (0, 15, 30)
+    ]
+    df = pd.DataFrame(rows)
+    engine = PolicyEngine()
+    result = engine.validate_demand_coverage(df, slots, SHIFTS)
+    assert result
+    assert result == legacy_engines.validate_demand_coverage_loop(df, slots, SHIFTS)
+
+
+def test_demand_coverage_counts_half_open_slot_boundaries():
+    df = pd.DataFrame(
+        [
+            {"work_date": date(2026, 2, 9), "employee_id": "ALICE", "status": "WORK", "shift_code": "CAI1", "minutes": 480},
+            {"work_date": date(2026, 2, 9), "employee_id": "BRUNO", "status": "WORK", "shift_code": "CAI2", "minutes": 420},
+        ]
+    )
+    slots = [
+        DemandSlot("CAIXA", date(2026, 2, 9), "07:30", 1),  # antes do início
+        DemandSlot("CAIXA", date(2026, 2, 9), "15:30", 2),  # os dois cobrem
+        DemandSlot("CAIXA", date(2026, 2, 9), "16:00", 2),  # CAI1 já terminou
+    ]
+    violations = PolicyEngine().validate_demand_coverage(df, slots, SHIFTS)
+    assert [v.evidence["slot"] for v in violations] == ["07:30", "16:00"]
+    assert [v.evidence["actual"] for v in violations] == [0, 1]
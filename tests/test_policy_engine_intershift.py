@@ -0,0 +1,50 @@
+"""Propriedade R2: versão vetorizada == laço original em escalas aleatórias."""
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from apps.backend.src.domain.engines import PolicyEngine
+from apps.backend.src.domain.models import Shift, ShiftDayScope
+from tests.oracles import legacy_engines
+
+
+SHIFTS = {
+    "CAI1": Shift("CAI1", 480, ShiftDayScope.WEEKDAY, "CAIXA", "06:00", "14:00"),
+    "CAI2": Shift("CAI2", 480, ShiftDayScope.WEEKDAY, "CAIXA", "14:00", "22:00"),
+    "CAI3": Shift("CAI3", 420, ShiftDayScope.WEEKDAY, "CAIXA", "11:30", "18:30"),
+    "NOITE": Shift("NOITE", 480, ShiftDayScope.WEEKDAY, "CAIXA", "22:00", "06:00"),
+    "SEMHORA": Shift("SEMHORA", 330, ShiftDayScope.WEEKDAY, "CAIXA"),
+    "DOM_08_12_30": Shift("DOM_08_12_30", 270, ShiftDayScope.SUNDAY, "CAIXA", "08:00", "12:30"),
+}
+
+
+def _random_schedule(rng: random.Random) -> pd.DataFrame:
+    codes = list(SHIFTS) + ["", None, "XPTO"]
+    start = date(2026, 1, 1)
+    rows = []
+    for e in range(rng.randint(1, 12)):
+        day = 0
+        for _ in range(rng.randint(0, 40)):
+            day += rng.choice([0, 1, 1, 1, 1, 2, 3])  # repetições no dia, dias seguidos e buracos
+            rows.append(
+                {
+                    "work_date": start + timedelta(days=day),
+                    "employee_id": f"E{e:02d}",
+                    "status": rng.choice(["WORK"] * 6 + ["FOLGA", "ABSENCE"]),
+                    "shift_code": rng.choice(codes),
+                    "minutes": 480,
+                }
+            )
+    rng.shuffle(rows)
+    return pd.DataFrame(rows, columns=["work_date", "employee_id", "status", "shift_code", "minutes"])
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_vectorized_intershift_rest_matches_loop(seed):
+    rng = random.Random(seed)
+    df = _random_schedule(rng)
+    constraints = {"min_intershift_rest_minutes": rng.choice([480, 660, 720])}
+    expected = legacy_engines.validate_intershift_rest_loop(df, SHIFTS, constraints)
+    assert PolicyEngine().validate_intershift_rest(df, SHIFTS, constraints) == expected
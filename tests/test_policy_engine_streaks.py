@@ -0,0 +1,60 @@
+"""Regressão: kernel de sequências (R1/R3) equivale aos laços originais."""
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from apps.backend.src.domain.engines import PolicyEngine, find_streak_overruns
+from tests.oracles import legacy_engines
+
+
+def _random_schedule(seed: int, n_employees: int = 8, n_days: int = 60) -> pd.DataFrame:
+    rng = random.Random(seed)
+    start = date(2026, 1, 1)
+    rows = []
+    for i in range(n_employees):
+        for d in range(n_days):
+            if rng.random() < 0.05:
+                continue  # buracos no calendário não quebram a sequência
+            rows.append(
+                {
+                    "work_date": start + timedelta(days=d),
+                    "employee_id": f"E{rng.randint(0, n_employees)}" if rng.random() < 0.02 else f"E{i}",
+                    "status": "WORK" if rng.random() < 0.85 else rng.choice(["FOLGA", "ABSENCE"]),
+                    "minutes": 480,
+                }
+            )
+    rng.shuffle(rows)
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_consecutive_days_matches_loop(seed):
+    df = _random_schedule(seed)
+    result = PolicyEngine().validate_consecutive_days(df, max_days=4)
+    assert result
+    assert result == legacy_engines.validate_consecutive_days_loop(df, max_days=4)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sunday_rotation_matches_loop(seed):
+    df = _random_schedule(seed, n_days=200)
+    rules = {
+        "E0": {"contract_code": "H44_CAIXA", "max_consecutive_sundays": 1},
+        "E1": {"contract_code": "H36_CAIXA", "max_consecutive_sundays": 3},
+    }
+    result = PolicyEngine().validate_sunday_rotation(df, rules)
+    assert result
+    assert result == legacy_engines.validate_sunday_rotation_loop(df, rules)
+
+
+def test_streak_kernel_reports_every_row_past_threshold():
+    codes = np.array([0, 0, 0, 0, 1, 1, 1])
+    ordinals = np.array([3, 1, 2, 4, 1, 2, 3])
+    is_work = np.array([True, True, True, True, True, False, True])
+    out = find_streak_overruns(codes, ordinals, is_work, 2)
+    assert out.row.tolist() == [0, 3]
+    assert out.start.tolist() == [1, 1]
+    assert out.length.tolist() == [3, 4]
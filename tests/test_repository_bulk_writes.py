@@ -0,0 +1,141 @@
+"""Regressão: escritas em lote do repositório (executemany + ON CONFLICT)."""
+import sqlite3
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.src.domain.models import DemandSlot, Employee
+
+
+@pytest.fixture
+def write_log(memory_repo):
+    statements = []
+    engine = memory_repo.session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("INSERT", "DELETE")):
+            statements.append((statement.split()[0].upper(), executemany))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def _seed_sector(repo, sector_id="CAIXA", n=3):
+    repo.add_sector(sector_id, sector_id.title())
+    repo.add_contract(f"H44_{sector_id}", sector_id, 2640)
+    for i in range(n):
+        repo.add_employee(Employee(f"{sector_id}_{i}", f"Colaborador {i}", f"H44_{sector_id}", sector_id))
+
+
+def test_demand_bulk_replaces_dates_in_one_insert(memory_repo, write_log):
+    memory_repo.add_demand_slot(DemandSlot("CAIXA", date(2026, 1, 1), "07:00", 9))  # data fora do lote: mantida
+    memory_repo.add_demand_slot(DemandSlot("CAIXA", date(2026, 1, 2), "07:00", 9))  # data do lote: substituída
+    write_log.clear()
+
+    slots = [
+        DemandSlot("CAIXA", date(2026, 1, 2) + timedelta(days=d), f"{m // 60:02d}:{m % 60:02d}", 2)
+        for d in range(30)
+        for m in range(0, 24 * 60, 30)
+    ]
+    slots.append(DemandSlot("CAIXA", date(2026, 1, 2), "08:00", 4))  # repetido: vale o último
+    memory_repo.save_demand_profile_bulk(slots)
+
+    assert write_log == [("DELETE", False), ("INSERT", True)]
+    loaded = {(s.work_date, s.slot_start): s.min_required for s in memory_repo.load_demand_profile("CAIXA")}
+    assert len(loaded) == 30 * 48 + 1
+    assert loaded[(date(2026, 1, 1), "07:00")] == 9
+    assert loaded[(date(2026, 1, 2), "07:00")] == 2
+    assert loaded[(date(2026, 1, 2), "08:00")] == 4
+
+
+def test_sunday_rotation_bulk_save_validates_before_writing(memory_repo, write_log):
+    _seed_sector(memory_repo)
+    _seed_sector(memory_repo, "ACOUGUE", n=1)
+    rotation = pd.DataFrame(
+        [
+            {"scale_index": 1, "employee_id": "CAIXA_0", "sunday_date": "2026-02-01", "folga_date": "2026-02-03"},
+            {"scale_index": 2, "employee_id": "CAIXA_1", "sunday_date": date(2026, 2, 8), "folga_date": None},
+        ]
+    )
+    write_log.clear()
+    memory_repo.save_sunday_rotation(rotation, sector_id="CAIXA")
+    assert write_log == [("DELETE", False), ("INSERT", True)]
+
+    loaded = memory_repo.load_sunday_rotation("CAIXA").sort_values("scale_index")
+    assert loaded["sunday_date"].tolist() == [date(2026, 2, 1), date(2026, 2, 8)]
+    assert loaded["folga_date"].tolist()[0] == date(2026, 2, 3)
+    assert loaded["folga_date"].isna().tolist()[1]
+
+    intruder = pd.concat([rotation, pd.DataFrame([{
+        "scale_index": 3, "employee_id": "ACOUGUE_0", "sunday_date": "2026-02-15", "folga_date": None,
+    }])])
+    with pytest.raises(ValueError, match="ACOUGUE_0"):
+        memory_repo.save_sunday_rotation(intruder, sector_id="CAIXA")
+    memory_repo.session.rollback()
+    assert len(memory_repo.load_sunday_rotation("CAIXA")) == 2
+
+
+def test_template_and_shift_bulk_saves_keep_column_semantics(memory_repo):
+    _seed_sector(memory_repo)
+    slots = pd.DataFrame(
+        [
+            {"employee_id": "CAIXA_0", "day_key": "MON", "shift_code": "CAI1", "minutes": 480},
+            {"employee_id": "CAIXA_1", "day_key": "TUE", "shift_code": "CAI2", "minutes": 420},
+        ]
+    )
+    memory_repo.save_weekday_template(slots, "CAIXA")
+    template = memory_repo.load_weekday_template_data("CAIXA")
+    assert template["shift_code"].tolist() == ["CAI1", "CAI2"]
+    assert template["minutes"].tolist() == [0, 0]  # só minutes_median é persistido
+
+    memory_repo.save_weekday_template(slots.assign(minutes_median=[470, 410]), "CAIXA")
+    assert memory_repo.load_weekday_template_data("CAIXA")["minutes"].tolist() == [470, 410]
+
+    shifts = pd.DataFrame(
+        [
+            {"shift_code": "CAI1", "minutes": 480, "day_scope": "WEEKDAY"},
+            {"shift_code": "CAI1", "minutes": 999, "day_scope": "WEEKDAY"},
+            {"shift_code": "DOM", "minutes": 270, "day_scope": "SUNDAY"},
+        ]
+    )
+    memory_repo.save_shifts(shifts, "CAIXA")
+    loaded = memory_repo.load_shifts("CAIXA")
+    assert {code: s.minutes for code, s in loaded.items()} == {"CAI1": 480, "DOM": 270}
+
+
+def test_demand_bulk_endpoint_imports_payload_in_one_call(memory_repo):
+    app.dependency_overrides[get_repo] = lambda: memory_repo
+    try:
+        payload = [
+            {"sector_id": "CAIXA", "work_date": str(date(2026, 3, 1) + timedelta(days=d)), "slot_start": f"{h:02d}:00", "min_required": 1}
+            for d in range(7)
+            for h in range(24)
+        ]
+        res = TestClient(app).post("/demand-profile/bulk", json=payload + payload[:1])
+    finally:
+        app.dependency_overrides.clear()
+    assert res.status_code == 200
+    assert res.json() == {"ok": True, "count": 7 * 24}
+    assert len(memory_repo.load_demand_profile("CAIXA")) == 7 * 24
+
+
+def test_demand_bulk_replaces_more_dates_than_the_variable_limit(memory_repo):
+    # SQLite antigo (limite de 999 variáveis): um IN com todas as datas estouraria.
+    raw = memory_repo.session.connection().connection.dbapi_connection
+    previous = raw.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    try:
+        first = [DemandSlot("CAIXA", date(2026, 1, 1) + timedelta(days=d), "08:00", 1) for d in range(1500)]
+        memory_repo.save_demand_profile_bulk(first)
+        memory_repo.save_demand_profile_bulk([DemandSlot(s.sector_id, s.work_date, s.slot_start, 3) for s in first])
+    finally:
+        raw.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, previous)
+
+    loaded = memory_repo.load_demand_profile("CAIXA")
+    assert len(loaded) == 1500
+    assert {s.min_required for s in loaded} == {3}
@@ -0,0 +1,91 @@
+"""Regressão: R4/R6 e resumos semanais lidos de ScheduleAggregates equivalem ao agrupamento original."""
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from apps.backend.routes.scale import _build_weekly_summary_rows
+from apps.backend.src.domain.aggregates import ScheduleAggregates
+from apps.backend.src.domain.engines import PolicyEngine
+from apps.backend.src.infrastructure.presenters.export_calendar import _build_weekly_summary
+from tests.oracles import legacy_engines
+
+
+def _random_schedule(seed: int, n_employees: int = 6, n_days: int = 45) -> pd.DataFrame:
+    """Dias duplicados por colaborador (turno extra) e fora de ordem, como após overlays."""
+    rng = random.Random(seed)
+    start = date(2026, 1, 1)
+    rows = []
+    for i in range(n_employees):
+        for d in range(n_days):
+            work = rng.random() < 0.8
+            rows.append(
+                {
+                    "work_date": start + timedelta(days=d),
+                    "employee_id": f"E{i}",
+                    "status": "WORK" if work else "FOLGA",
+                    "minutes": rng.choice([270, 480, 560, 600]) if work else 0,
+                }
+            )
+            if rng.random() < 0.1:
+                rows.append({"work_date": start + timedelta(days=d), "employee_id": f"E{i}", "status": "WORK", "minutes": 60})
+    rng.shuffle(rows)
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_weekly_and_daily_rules_match_loop(seed):
+    df = _random_schedule(seed)
+    targets = {"E0": {"weekly_minutes": 1800, "contract_code": "H30"}, "E1": 2200}
+    constraints = {"max_daily_minutes_operational": 585, "max_daily_minutes_hard": 600}
+    engine = PolicyEngine()
+    aggregates = ScheduleAggregates.from_assignments(df)
+
+    weekly = engine.validate_weekly_hours(df, targets, aggregates=aggregates)
+    assert weekly
+    assert weekly == legacy_engines.validate_weekly_hours_loop(df, targets)
+    assert weekly == engine.validate_weekly_hours(df, targets)
+
+    daily = engine.validate_daily_minutes(df, constraints, aggregates=aggregates)
+    assert daily
+    assert daily == legacy_engines.validate_daily_minutes_loop(df, constraints)
+
+
+def test_week_totals_for_both_windows():
+    df = pd.DataFrame(
+        [
+            {"work_date": "2026-02-07", "employee_id": "ALICE", "minutes": 480},  # sábado
+            {"work_date": "2026-02-08", "employee_id": "ALICE", "minutes": 270},  # domingo
+            {"work_date": "2026-02-09", "employee_id": "ALICE", "minutes": 480},  # segunda
+            {"work_date": "2026-02-09", "employee_id": "ALICE", "minutes": 30},
+        ]
+    )
+    aggregates = ScheduleAggregates.from_assignments(df)
+    assert aggregates.daily["minutes"].tolist() == [480, 270, 510]
+
+    mon_sun = aggregates.weekly_totals("MON_SUN")
+    assert mon_sun["week_start"].tolist() == [date(2026, 2, 2), date(2026, 2, 9)]
+    assert mon_sun["minutes"].tolist() == [750, 510]
+
+    sun_sat = aggregates.weekly_totals("SUN_SAT")
+    assert sun_sat["week_start"].tolist() == [date(2026, 2, 1), date(2026, 2, 8)]
+    assert sun_sat["minutes"].tolist() == [480, 780]
+
+    with pytest.raises(ValueError):
+        aggregates.weekly_totals("TUE_MON")
+
+
+def test_summaries_share_aggregates_and_accept_profiles():
+    df = _random_schedule(7)
+    aggregates = ScheduleAggregates.from_assignments(df)
+    profiles = {"E0": {"weekly_minutes": 1800, "contract_code": "H30"}}
+
+    rows = _build_weekly_summary_rows(df, profiles, {}, tolerance=120, week_definition="SUN_SAT", aggregates=aggregates)
+    export_rows = _build_weekly_summary(df, profiles, "SUN_SAT", aggregates)
+    assert len(rows) == len(export_rows) == len(aggregates.weekly_totals("SUN_SAT"))
+    for row, export_row in zip(rows, export_rows):
+        assert row.week_start == str(export_row["week_start"])
+        assert row.actual_minutes == export_row["actual_minutes"]
+        assert row.target_minutes == export_row["target_minutes"]
+    assert {r["target_minutes"] for r in export_rows if r["employee_id"] == "E0"} == {1800}
@@ -0,0 +1,183 @@
+"""Regressão: resultados do pipeline reaproveitados por fingerprint das entradas (LRU em memória e em disco)."""
+import json
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.backend.main import app
+from apps.backend.src.application.schedule_cache import PIPELINE_VERSION, ScheduleCache, fingerprint
+from apps.backend.src.application.use_cases import ValidationOrchestrator
+from apps.backend.src.domain.models import Employee, ExceptionType, ProjectionContext, ScheduleException
+from apps.backend.src.domain.policy_loader import PolicyCache, PolicyLoader
+
+ROOT = Path(__file__).resolve().parents[1]
+POLICY_PATH = ROOT / "schemas" / "compliance_policy.example.json"
+SEED_PATH = ROOT / "data" / "fixtures" / "seed_supermercado_fernandes.json"
+CONTEXT = ProjectionContext(
+    period_start=date(2026, 2, 1),
+    period_end=date(2026, 3, 31),
+    sector_id="CAIXA",
+    anchor_scale_id=1,
+)
+
+
+@pytest.fixture
+def seeded_repo(memory_repo):
+    """Setor CAIXA do seed: contratos, colaboradores, mosaico e rodízio."""
+    seed = json.loads(SEED_PATH.read_text(encoding="utf-8"))
+    sector_id = seed["sector"]["sector_id"]
+    memory_repo.add_sector(sector_id, seed["sector"]["name"])
+    for contract in seed["contracts"]:
+        memory_repo.add_contract(contract["contract_code"], sector_id, int(contract["weekly_minutes"]))
+    for employee in seed["employees"]:
+        memory_repo.add_employee(
+            Employee(
+                employee_id=employee["employee_id"].upper(),
+                name=employee["name"],
+                contract_code=employee["contract_code"],
+                sector_id=sector_id,
+                rank=int(employee.get("rank", 99)),
+            )
+        )
+    memory_repo.save_weekday_template(pd.DataFrame(seed["weekday_template"]), sector_id=sector_id)
+    rotation = pd.DataFrame(seed["sunday_rotation"])
+    rotation["sunday_date"] = pd.to_datetime(rotation["sunday_date"]).dt.date
+    rotation["folga_date"] = pd.to_datetime(rotation["folga_date"]).dt.date
+    memory_repo.save_sunday_rotation(rotation, sector_id=sector_id)
+    return memory_repo
+
+
+def _orchestrator(repo, tmp_path, cache):
+    return ValidationOrchestrator(
+        repo=repo,
+        policy_loader=PolicyLoader(schemas_path=ROOT / "schemas", cache=PolicyCache()),
+        output_path=tmp_path,
+        schedule_cache=cache,
+    )
+
+
+def _simulate(orchestrator):
+    return orchestrator.run(CONTEXT, POLICY_PATH, persist_results=False, include_preview=True)
+
+
+def _count_builds(monkeypatch) -> list:
+    calls = []
+    build = ValidationOrchestrator._build_schedule
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return build(self, *args, **kwargs)
+
+    monkeypatch.setattr(ValidationOrchestrator, "_build_schedule", counting)
+    return calls
+
+
+def test_fingerprint_follows_content():
+    df = pd.DataFrame({"employee_id": ["E1", "E2"], "work_date": [date(2026, 3, 1), date(2026, 3, 2)]})
+
+    assert fingerprint(df, "CAIXA") == fingerprint(df.copy(), "CAIXA")
+    assert fingerprint(df, "CAIXA") != fingerprint(df.assign(employee_id=["E1", "E3"]), "CAIXA")
+    assert fingerprint(df, "CAIXA") != fingerprint(df[["work_date", "employee_id"]], "CAIXA")
+    assert fingerprint(df, "CAIXA") != fingerprint(df, "ACOUGUE")
+    assert fingerprint(df.iloc[:0], {}) != fingerprint(pd.DataFrame(), {})
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ScheduleCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats() == {"hits": 3, "misses": 1, "entries": 2}
+
+
+def test_cache_persists_on_disk(tmp_path):
+    ScheduleCache(max_entries=2, directory=tmp_path).put("a", {"rows": [1, 2]})
+    (tmp_path / f"v{PIPELINE_VERSION}-corrompido.pkl").write_bytes(b"nao e pickle")
+    restarted = ScheduleCache(max_entries=2, directory=tmp_path)
+
+    assert restarted.get("a") == {"rows": [1, 2]}
+    assert restarted.get("corrompido") is None
+    restarted.put("b", 2)
+    restarted.put("c", 3)
+    assert sorted(p.stem for p in tmp_path.glob("*.pkl")) == [f"v{PIPELINE_VERSION}-b", f"v{PIPELINE_VERSION}-c"]
+
+
+def test_pipeline_version_invalidates_disk_entries(tmp_path):
+    ScheduleCache(directory=tmp_path, version=1).put("a", "resultado antigo")
+    bumped = ScheduleCache(directory=tmp_path, version=2)
+
+    assert bumped.get("a") is None
+    bumped.put("a", "resultado novo")
+    assert [p.name for p in tmp_path.glob("*.pkl")] == ["v2-a.pkl"]
+    assert ScheduleCache(directory=tmp_path, version=2).get("a") == "resultado novo"
+
+
+def test_cached_frames_are_isolated_from_callers():
+    cache = ScheduleCache()
+    df = pd.DataFrame({"employee_id": ["E1"], "minutes": [480]})
+    cache.put("k", (df, {"E1": [1]}))
+    df.loc[0, "minutes"] = 0
+
+    first, extra = cache.get("k")
+    first.loc[0, "minutes"] = 1
+    extra["E1"].append(2)
+    second, second_extra = cache.get("k")
+
+    assert second.loc[0, "minutes"] == 480
+    assert second_extra == {"E1": [1]}
+    assert second is not first
+
+
+def test_repeated_simulation_reuses_cached_result(seeded_repo, tmp_path, monkeypatch):
+    calls = _count_builds(monkeypatch)
+    cache = ScheduleCache()
+    first = _simulate(_orchestrator(seeded_repo, tmp_path, cache))
+    second = _simulate(_orchestrator(seeded_repo, tmp_path, cache))
+    uncached = _simulate(_orchestrator(seeded_repo, tmp_path, None))
+
+    assert len(calls) == 2  # primeira simulação + a sem cache
+    assert cache.stats()["hits"] == 1
+    pd.testing.assert_frame_equal(second["preview_assignments"], uncached["preview_assignments"])
+    assert second["preview_violations"] == uncached["preview_violations"] == first["preview_violations"]
+    assert first["assignments_count"] > 0
+
+
+def test_changed_input_recomputes(seeded_repo, tmp_path, monkeypatch):
+    calls = _count_builds(monkeypatch)
+    cache = ScheduleCache()
+    before = _simulate(_orchestrator(seeded_repo, tmp_path, cache))
+    employee_id = before["preview_assignments"]["employee_id"].iloc[0]
+    seeded_repo.add_exception(
+        ScheduleException(
+            sector_id="CAIXA",
+            employee_id=employee_id,
+            exception_date=date(2026, 3, 10),
+            exception_type=ExceptionType.VACATION,
+        )
+    )
+    after = _simulate(_orchestrator(seeded_repo, tmp_path, cache))
+
+    assert len(calls) == 2
+    assert after["exceptions_applied"] == before["exceptions_applied"] + 1
+
+
+def test_disk_cache_survives_restart(seeded_repo, tmp_path, monkeypatch):
+    calls = _count_builds(monkeypatch)
+    first = _simulate(_orchestrator(seeded_repo, tmp_path, ScheduleCache(directory=tmp_path / "cache")))
+    restarted = _simulate(_orchestrator(seeded_repo, tmp_path, ScheduleCache(directory=tmp_path / "cache")))
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(restarted["preview_assignments"], first["preview_assignments"])
+    assert restarted["preview_violations"] == first["preview_violations"]
+
+
+def test_schedule_cache_stats_endpoint():
+    stats = TestClient(app).get("/config/schedule-cache").json()
+    assert set(stats) == {"hits", "misses", "entries"}
@@ -0,0 +1,77 @@
+"""Regressão: preferências/exceções aplicadas por chave equivalem aos laços originais do orquestrador."""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from apps.backend.src.domain.engines import CycleGenerator
+from apps.backend.src.domain.models import (
+    ExceptionType,
+    PreferenceRequest,
+    RequestDecision,
+    RequestType,
+    ScheduleException,
+)
+from tests.oracles import legacy_engines
+from tests.oracles.synthetic import synthetic_assignments, synthetic_exceptions, synthetic_preferences, synthetic_shifts
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_keyed_overlays_match_loop(seed):
+    df = synthetic_assignments(12, 42)
+    shifts = synthetic_shifts()
+    preferences = synthetic_preferences(12, 42, 80, seed=seed)
+    exceptions = synthetic_exceptions(12, 42, 120, seed=seed)
+    generator = CycleGenerator()
+
+    expected, expected_processed = legacy_engines.apply_preferences_loop(df, preferences, shifts)
+    result, processed = generator.apply_preferences(df, preferences, shifts)
+    assert processed
+    assert processed == expected_processed
+    pd.testing.assert_frame_equal(result, expected)
+
+    expected, expected_count = legacy_engines.apply_exceptions_loop(expected, exceptions)
+    result, count = generator.apply_exceptions(result, exceptions)
+    assert count
+    assert count == expected_count
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_preferences_on_same_key_compose_in_order():
+    df = pd.DataFrame(
+        [
+            {"work_date": date(2026, 2, 2), "employee_id": "ALICE", "status": "WORK", "shift_code": "CAI1", "minutes": 480, "source_rule": "T"},
+            {"work_date": date(2026, 2, 3), "employee_id": "ALICE", "status": "WORK", "shift_code": "CAI1", "minutes": 480, "source_rule": "T"},
+        ]
+    )
+
+    def pref(request_id, day, request_type, target=None):
+        return PreferenceRequest(
+            request_id, "ALICE", day, request_type, "HIGH", target_shift_code=target, decision=RequestDecision.APPROVED
+        )
+
+    preferences = [
+        pref("P1", date(2026, 2, 2), RequestType.FOLGA_ON_DATE),
+        pref("P2", date(2026, 2, 2), RequestType.SHIFT_CHANGE_ON_DATE, "CAI3"),  # mantém FOLGA, troca turno
+        pref("P3", date(2026, 2, 3), RequestType.SHIFT_CHANGE_ON_DATE, None),  # sem turno alvo: ignorado
+        pref("P4", date(2026, 3, 1), RequestType.FOLGA_ON_DATE),  # fora do período
+    ]
+    shifts = synthetic_shifts()
+    result, processed = CycleGenerator().apply_preferences(df, preferences, shifts)
+    assert [p["request_id"] for p in processed] == ["P1", "P2"]
+    assert result.iloc[0].to_dict() == {
+        "work_date": date(2026, 2, 2), "employee_id": "ALICE", "status": "FOLGA",
+        "shift_code": "CAI3", "minutes": 480, "source_rule": "PREFERENCE_APPLIED",
+    }
+    assert result.iloc[1]["source_rule"] == "T"
+    pd.testing.assert_frame_equal(result, legacy_engines.apply_preferences_loop(df, preferences, shifts)[0])
+
+    exceptions = [
+        ScheduleException("CAIXA", "ALICE", date(2026, 2, 2), ExceptionType.VACATION),  # dia já é FOLGA
+        ScheduleException("CAIXA", "ALICE", date(2026, 2, 3), ExceptionType.MEDICAL_LEAVE),
+        ScheduleException("CAIXA", "ALICE", date(2026, 2, 3), ExceptionType.BLOCK),  # repetida: vale a primeira
+    ]
+    result, applied = CycleGenerator().apply_exceptions(result, exceptions)
+    assert applied == 1
+    assert result["status"].tolist() == ["FOLGA", "ABSENCE"]
+    assert result.iloc[1]["source_rule"] == "EXCEPTION_MEDICAL_LEAVE"
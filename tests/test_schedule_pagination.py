@@ -0,0 +1,157 @@
+"""Regressão: /scale/assignments e /scale/violations com filtros no SQL, cursor de paginação e projeção de campos."""
+from datetime import date, timedelta
+
+import pandas as pd
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+
+
+def _assignments(n_days: int, employees=("ALICE", "BRUNO", "CARLA"), start=date(2026, 2, 1)) -> pd.DataFrame:
+    rows = []
+    for d in range(n_days):
+        for i, employee_id in enumerate(employees):
+            work = (d + i) % 7 != 0
+            rows.append({
+                "work_date": start + timedelta(days=d),
+                "employee_id": employee_id,
+                "status": "WORK" if work else "FOLGA",
+                "shift_code": "CAI1" if work else "",
+                "minutes": 480 if work else 0,
+                "source_rule": "TEMPLATE_BASE",
+            })
+    return pd.DataFrame(rows)
+
+
+def _violations() -> pd.DataFrame:
+    return pd.DataFrame([
+        {"employee_id": "ALICE", "rule_code": "R1_MAX_CONSECUTIVE", "severity": "CRITICAL",
+         "date_start": date(2026, 2, 2), "date_end": date(2026, 2, 9), "detail": "7 dias"},
+        {"employee_id": "BRUNO", "rule_code": "R4_WEEKLY_TARGET", "severity": "MEDIUM",
+         "date_start": date(2026, 2, 8), "date_end": date(2026, 2, 14), "detail": "2400/2640"},
+        {"employee_id": "COBERTURA", "rule_code": "R5_DEMAND_COVERAGE", "severity": "MEDIUM",
+         "date_start": date(2026, 3, 1), "date_end": date(2026, 3, 1), "detail": "slot 08:00"},
+    ])
+
+
+def _client(memory_repo) -> TestClient:
+    app.dependency_overrides[get_repo] = lambda: memory_repo
+    return TestClient(app)
+
+
+def _query_plan(memory_repo, read) -> str:
+    statements = []
+    engine = memory_repo.session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        read()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    statement, parameters = statements[-1]
+    return " | ".join(
+        row[-1] for row in memory_repo.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    )
+
+
+def test_filters_are_combined(memory_repo):
+    memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 3, 31), _assignments(59), _violations())
+    try:
+        client = _client(memory_repo)
+        bruno_folgas = client.get(
+            "/scale/assignments",
+            params={"employee_id": "BRUNO", "status": "FOLGA", "period_start": "2026-02-01", "period_end": "2026-02-28"},
+        ).json()
+        weekly = client.get("/scale/violations", params={"rule_code": "R4_WEEKLY_TARGET"}).json()
+        alice = client.get("/scale/violations", params={"employee_id": "ALICE", "period_start": "2026-02-05"}).json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [row["work_date"] for row in bruno_folgas] == ["2026-02-07", "2026-02-14", "2026-02-21", "2026-02-28"]
+    assert {row["employee_name"] for row in bruno_folgas} == {None}
+    assert [(v["employee_id"], v["rule_label"]) for v in weekly] == [("BRUNO", "Meta semanal de horas")]
+    assert [v["rule_code"] for v in alice] == ["R1_MAX_CONSECUTIVE"]
+
+
+def test_cursor_pages_cover_the_full_list_of_the_pinned_run(memory_repo):
+    memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 3, 31), _assignments(59), _violations())
+    try:
+        client = _client(memory_repo)
+        full = client.get("/scale/assignments", params={"sector_id": "CAIXA"})
+        assert "X-Next-Cursor" not in full.headers  # sem limit: lista completa, sem cursor
+
+        pages, cursor = [], None
+        while True:
+            params = {"sector_id": "CAIXA", "limit": 50}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get("/scale/assignments", params=params)
+            assert page.status_code == 200
+            pages.append(page.json())
+            cursor = page.headers.get("X-Next-Cursor")
+            if len(pages) == 1:
+                # Geração nova no meio da paginação não mistura resultados: o cursor fixa a geração.
+                memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 2, 7), _assignments(7, ("ZECA",)), pd.DataFrame())
+            if cursor is None:
+                break
+    finally:
+        app.dependency_overrides.clear()
+
+    rows = [row for page in pages for row in page]
+    assert len(pages) == -(-59 * 3 // 50)
+    assert all(len(page) == 50 for page in pages[:-1])
+    assert rows == full.json()
+
+
+def test_fields_projection(memory_repo):
+    memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 3, 31), _assignments(59), _violations())
+    try:
+        client = _client(memory_repo)
+        assignments = client.get(
+            "/scale/assignments", params={"fields": "work_date,employee_name,status", "limit": 2}
+        )
+        violations = client.get("/scale/violations", params={"fields": "rule_label"}).json()
+        bad_field = client.get("/scale/assignments", params={"fields": "work_date,salary"})
+        bad_cursor = client.get("/scale/assignments", params={"cursor": "abc"})
+        next_cursor = assignments.headers["X-Next-Cursor"]
+        other_sector = client.get("/scale/assignments", params={"sector_id": "ACOUGUE", "cursor": next_cursor, "limit": 2})
+        other_sector_violations = client.get("/scale/violations", params={"sector_id": "ACOUGUE", "cursor": next_cursor})
+        same_sector = client.get("/scale/assignments", params={"sector_id": "CAIXA", "cursor": next_cursor, "limit": 2})
+        removed_run = client.get("/scale/assignments", params={"cursor": "999.0"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert assignments.json() == [
+        {"work_date": "2026-02-01", "employee_name": None, "status": "FOLGA"},
+        {"work_date": "2026-02-01", "employee_name": None, "status": "WORK"},
+    ]
+    assert assignments.headers["X-Next-Cursor"].count(".") == 1
+    assert violations == [
+        {"rule_label": "Dias consecutivos (máx. 6)"},
+        {"rule_label": "Meta semanal de horas"},
+        {"rule_label": "Cobertura insuficiente"},
+    ]
+    assert bad_field.status_code == 422
+    assert "salary" in bad_field.json()["detail"]
+    assert bad_cursor.status_code == 400
+    assert other_sector.status_code == other_sector_violations.status_code == removed_run.status_code == 400
+    assert same_sector.status_code == 200 and len(same_sector.json()) == 2
+
+
+def test_page_and_employee_reads_use_run_indexes(memory_repo):
+    run_id = memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 3, 31), _assignments(59), _violations())
+
+    page = _query_plan(memory_repo, lambda: memory_repo.load_schedule_assignments_df(run_id, after_id=40, limit=20))
+    assert "ix_schedule_assignments_run_id (run_id=? AND rowid>?)" in page
+    assert "TEMP B-TREE" not in page  # ordem pelo índice, sem ordenar a geração inteira
+
+    employee = _query_plan(memory_repo, lambda: memory_repo.load_schedule_assignments_df(run_id, employee_id="BRUNO"))
+    assert "ix_schedule_assignments_run_employee (run_id=? AND employee_id=?)" in employee
+
+    rule = _query_plan(memory_repo, lambda: memory_repo.load_schedule_violations_df(run_id, rule_code="R5_DEMAND_COVERAGE"))
+    assert "ix_schedule_violations_run_rule (run_id=? AND rule_code=?)" in rule
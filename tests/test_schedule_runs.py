@@ -0,0 +1,107 @@
+"""Regressão: escala oficial persistida em schedule_runs/_assignments/_violations e lida por setor e período."""
+from datetime import date, timedelta
+
+import pandas as pd
+from fastapi.testclient import TestClient
+from sqlalchemy import event, func, select
+
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.src.infrastructure.database.extended_orm import ScheduleAssignmentORM, ScheduleRunORM
+
+
+def _assignments(n_days: int, employees=("ALICE", "BRUNO"), start=date(2026, 2, 1)) -> pd.DataFrame:
+    rows = []
+    for d in range(n_days):
+        for i, employee_id in enumerate(employees):
+            work = (d + i) % 7 != 0
+            rows.append({
+                "work_date": start + timedelta(days=d),
+                "employee_id": employee_id,
+                "status": "WORK" if work else "FOLGA",
+                "shift_code": "CAI1" if work else "",
+                "minutes": 480 if work else 0,
+                "source_rule": "TEMPLATE_BASE",
+            })
+    return pd.DataFrame(rows)
+
+
+def _violations() -> pd.DataFrame:
+    return pd.DataFrame([
+        {"employee_id": "ALICE", "rule_code": "R1_MAX_CONSECUTIVE", "severity": "CRITICAL",
+         "date_start": date(2026, 2, 2), "date_end": date(2026, 2, 9), "detail": "7 dias"},
+        {"employee_id": "COBERTURA", "rule_code": "R5_DEMAND_COVERAGE", "severity": "MEDIUM",
+         "date_start": date(2026, 3, 1), "date_end": date(2026, 3, 1), "detail": "slot 08:00"},
+    ])
+
+
+def test_latest_run_per_sector_is_official_and_reads_are_ranged(memory_repo):
+    first = memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 3, 31), _assignments(59), _violations())
+    other = memory_repo.save_schedule_run("ACOUGUE", date(2026, 2, 1), date(2026, 2, 28), _assignments(28, ("ZECA",)), pd.DataFrame())
+    official = memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 3, 31), _assignments(59), _violations())
+
+    assert memory_repo.latest_schedule_run_id("CAIXA") == official != first
+    assert memory_repo.latest_schedule_run_id("ACOUGUE") == other
+    assert memory_repo.latest_schedule_run_id() == official
+
+    march = memory_repo.load_schedule_assignments_df(official, date(2026, 3, 1), date(2026, 3, 31))
+    assert len(march) == 31 * 2
+    assert march["work_date"].min() == date(2026, 3, 1)
+    folga = march[march["status"] == "FOLGA"]
+    assert folga["shift_code"].isna().all()  # turno vazio gravado como NULL
+
+    # Violação que atravessa o início do período também aparece.
+    feb = memory_repo.load_schedule_violations_df(official, date(2026, 2, 5), date(2026, 2, 28))
+    assert feb["rule_code"].tolist() == ["R1_MAX_CONSECUTIVE"]
+    assert len(memory_repo.load_schedule_violations_df(official)) == 2
+
+
+def test_old_runs_are_pruned_per_sector(memory_repo):
+    memory_repo.save_schedule_run("ACOUGUE", date(2026, 2, 1), date(2026, 2, 7), _assignments(7, ("ZECA",)), pd.DataFrame())
+    for _ in range(4):
+        memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 2, 7), _assignments(7), _violations(), keep_runs=2)
+    session = memory_repo.session
+    runs = session.execute(select(ScheduleRunORM.sector_id, func.count()).group_by(ScheduleRunORM.sector_id)).all()
+    assert dict(runs) == {"ACOUGUE": 1, "CAIXA": 2}
+    assert session.scalar(select(func.count()).select_from(ScheduleAssignmentORM)) == 7 + 2 * 7 * 2
+
+
+def test_range_read_uses_run_date_index(memory_repo):
+    run_id = memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 3, 31), _assignments(59), _violations())
+    statements = []
+    engine = memory_repo.session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        memory_repo.load_schedule_assignments_df(run_id, date(2026, 3, 1), date(2026, 3, 31))
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    statement, parameters = statements[-1]
+    plan = " | ".join(
+        row[-1] for row in memory_repo.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    )
+    assert "ix_schedule_assignments_run_date (run_id=? AND work_date>? AND work_date<?)" in plan
+
+
+def test_official_endpoints_filter_by_sector_and_period(memory_repo):
+    memory_repo.save_schedule_run("CAIXA", date(2026, 2, 1), date(2026, 3, 31), _assignments(59), _violations())
+    memory_repo.save_schedule_run("ACOUGUE", date(2026, 2, 1), date(2026, 2, 28), _assignments(28, ("ZECA",)), pd.DataFrame())
+    app.dependency_overrides[get_repo] = lambda: memory_repo
+    try:
+        client = TestClient(app)
+        latest = client.get("/scale/assignments").json()
+        caixa_march = client.get(
+            "/scale/assignments", params={"sector_id": "CAIXA", "period_start": "2026-03-01", "period_end": "2026-03-07"}
+        ).json()
+        violations = client.get("/scale/violations", params={"sector_id": "CAIXA", "period_start": "2026-03-01"}).json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert {row["employee_id"] for row in latest} == {"ZECA"}  # sem setor: última geração
+    assert len(caixa_march) == 7 * 2
+    assert caixa_march[0]["work_date"] == "2026-03-01"
+    assert all(row["shift_code"] is None for row in caixa_march if row["status"] == "FOLGA")
+    assert [v["rule_code"] for v in violations] == ["R5_DEMAND_COVERAGE"]
@@ -0,0 +1,123 @@
+"""Regressão: escopo por setor via join/subconsulta em employees.sector_id (setores com mais de 1000 colaboradores)."""
+import sqlite3
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from apps.backend.src.infrastructure.database.orm_models import EmployeeORM
+
+N_EMPLOYEES = 1500
+
+
+@pytest.fixture
+def big_sector(memory_repo):
+    repo = memory_repo
+    repo.add_sector("CAIXA", "Caixa")
+    repo.add_sector("ACOUGUE", "Açougue")
+    repo.add_contract("H44", "CAIXA", 2640, max_consecutive_sundays=0)
+    repo.add_contract("H30", "ACOUGUE", 1800)
+    rows = [
+        {"employee_id": f"C{i:05d}", "name": f"Caixa {i}", "contract_code": "H44", "sector_id": "CAIXA", "rank": i, "active": True}
+        for i in range(N_EMPLOYEES)
+    ]
+    rows += [
+        {"employee_id": f"A{i:03d}", "name": f"Açougue {i}", "contract_code": "H30", "sector_id": "ACOUGUE", "rank": i, "active": True}
+        for i in range(10)
+    ]
+    rows.append({"employee_id": "C_SEM_CONTRATO", "name": "Sem", "contract_code": "XX", "sector_id": "CAIXA", "rank": 0, "active": True})
+    repo._bulk_insert(EmployeeORM.__table__, rows)
+    repo.session.commit()
+
+    # SQLite antigo (limite de 999 variáveis): um IN com os IDs do setor estouraria.
+    raw = repo.session.connection().connection.dbapi_connection
+    previous = raw.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    yield repo
+    raw.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, previous)
+
+
+def _rotation(prefix: str, n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "scale_index": [1 + i % 6 for i in range(n)],
+            "employee_id": [f"{prefix}{i:05d}" if prefix == "C" else f"{prefix}{i:03d}" for i in range(n)],
+            "sunday_date": [date(2026, 1, 4) + timedelta(weeks=i % 6) for i in range(n)],
+            "folga_date": [None] * n,
+        }
+    )
+
+
+def test_rotation_save_and_load_scale_past_variable_limit(big_sector):
+    repo = big_sector
+    repo.save_sunday_rotation(_rotation("A", 10), sector_id="ACOUGUE")
+
+    params = []
+    engine = repo.session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            params.append(len(parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        repo.save_sunday_rotation(_rotation("C", N_EMPLOYEES), sector_id="CAIXA")
+        loaded = repo.load_sunday_rotation("CAIXA")
+        repo.save_sunday_rotation(_rotation("C", 1200), sector_id="CAIXA")  # substitui só o CAIXA
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert max(params) <= 2  # setor_id (+ nada proporcional ao tamanho do setor)
+    assert len(loaded) == N_EMPLOYEES
+    assert loaded["employee_id"].str.startswith("C").all()
+    assert len(repo.load_sunday_rotation("CAIXA")) == 1200
+    assert len(repo.load_sunday_rotation("ACOUGUE")) == 10
+
+    with pytest.raises(ValueError, match="A000"):
+        repo.save_sunday_rotation(_rotation("A", 1), sector_id="CAIXA")
+
+
+def test_rotation_load_plan_uses_sector_index(big_sector):
+    repo = big_sector
+    statements = []
+    engine = repo.session.get_bind()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        repo.load_sunday_rotation("CAIXA")
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    statement, parameters = statements[-1]
+    plan = " | ".join(
+        row[-1] for row in repo.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    )
+    assert "ix_employees_sector_id (sector_id=?)" in plan
+    assert "ix_sunday_rotations_employee_id (employee_id=?)" in plan
+
+
+def test_contract_profiles_join_keeps_defaults(big_sector):
+    profiles = big_sector.load_contract_profiles("CAIXA")
+    assert len(profiles) == N_EMPLOYEES + 1
+    assert profiles["C00000"] == {"contract_code": "H44", "weekly_minutes": 2640, "max_consecutive_sundays": 2}
+    assert profiles["C_SEM_CONTRATO"] == {"contract_code": "XX", "weekly_minutes": 2640, "max_consecutive_sundays": 2}
+    assert big_sector.load_contract_targets("ACOUGUE") == {f"A{i:03d}": 1800 for i in range(10)}
+
+
+def test_existing_employee_ids_past_variable_limit(big_sector):
+    wanted = [f"C{i:05d}" for i in range(N_EMPLOYEES)] + ["A001", "NAO_EXISTE"]
+    assert big_sector.existing_employee_ids(iter(wanted)) == set(wanted) - {"NAO_EXISTE"}
+    assert big_sector.existing_employee_ids([]) == set()
+
+
+def test_rotation_load_keeps_insertion_order(big_sector):
+    rotation = _rotation("C", 3).iloc[::-1].reset_index(drop=True)
+    rotation.loc[3] = [9, "C00002", date(2026, 1, 4), date(2026, 1, 7)]  # repetida: a última gravada vale
+    big_sector.save_sunday_rotation(rotation, sector_id="CAIXA")
+
+    loaded = big_sector.load_sunday_rotation("CAIXA")
+
+    assert list(loaded["employee_id"]) == ["C00002", "C00001", "C00000", "C00002"]
+    assert list(loaded["scale_index"]) == list(rotation["scale_index"])
@@ -0,0 +1,55 @@
+"""Catálogo de turnos compilado: offsets inteiros usados pelas regras R2/R5."""
+from datetime import date, timedelta
+
+import pandas as pd
+
+from apps.backend.src.domain.engines import PolicyEngine
+from apps.backend.src.domain.models import Shift, ShiftDayScope
+from apps.backend.src.domain.shift_catalog import CompiledShiftCatalog
+from tests.oracles import legacy_engines
+
+
+SHIFTS = {
+    "CAI1": Shift("CAI1", 480, ShiftDayScope.WEEKDAY, "CAIXA", "08:00", "16:00"),
+    "NOITE": Shift("NOITE", 480, ShiftDayScope.WEEKDAY, "CAIXA", "22:00", "06:00"),
+    "SEMHORA": Shift("SEMHORA", 330, ShiftDayScope.WEEKDAY, "CAIXA"),
+    "ZERO": Shift("ZERO", 0, ShiftDayScope.WEEKDAY, "CAIXA"),
+}
+
+
+def test_catalog_resolves_default_start_and_overnight():
+    catalog = CompiledShiftCatalog.from_shifts(SHIFTS)
+    assert catalog.bounds("CAI1") == (480, 960)
+    assert catalog.bounds("NOITE") == (1320, 1800)
+    assert catalog.bounds("SEMHORA") == (480, 810)
+    assert catalog.bounds("ZERO") == (480, 1920)  # fim == início vira o dia seguinte
+    assert catalog.overnight.tolist() == [False, True, False, True]
+    assert catalog.lookup(["NOITE", "", None, "XPTO", "CAI1"]).tolist() == [1, -1, -1, -1, 0]
+
+
+def test_catalog_matches_datetime_ranges_of_original_engine():
+    catalog = CompiledShiftCatalog.from_shifts(SHIFTS)
+    day = date(2026, 2, 9)
+    midnight = pd.Timestamp(day)
+    for code, shift in SHIFTS.items():
+        start_dt, end_dt = legacy_engines.shift_to_datetime_range(shift, day)
+        start, end = catalog.bounds(code)
+        assert midnight + timedelta(minutes=start) == start_dt
+        assert midnight + timedelta(minutes=end) == end_dt
+
+
+def test_intershift_rest_with_catalog_matches_loop():
+    start = date(2026, 2, 9)
+    codes = ["NOITE", "CAI1", "SEMHORA", "", "NOITE", "NOITE", "CAI1", "XPTO", "CAI1"]
+    df = pd.DataFrame(
+        [
+            {"work_date": start + timedelta(days=i), "employee_id": "ALICE", "status": "WORK", "shift_code": c, "minutes": 480}
+            for i, c in enumerate(codes)
+        ]
+    )
+    constraints = {"min_intershift_rest_minutes": 660}
+    engine = PolicyEngine()
+    result = engine.validate_intershift_rest(df, CompiledShiftCatalog.from_shifts(SHIFTS), constraints)
+    assert result
+    assert result == engine.validate_intershift_rest(df, SHIFTS, constraints)
+    assert result == legacy_engines.validate_intershift_rest_loop(df, SHIFTS, constraints)
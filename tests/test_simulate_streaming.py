@@ -0,0 +1,98 @@
+"""Regressão: /scale/simulate com Accept NDJSON transmite as mesmas linhas da resposta JSON, em blocos."""
+import json
+from datetime import date, timedelta
+
+import pandas as pd
+from fastapi.testclient import TestClient
+
+import apps.backend.routes.scale as scale_routes
+from apps.backend.main import app
+from apps.backend.schemas import PreflightResponse
+
+PAYLOAD = {"period_start": "2026-02-01", "period_end": "2026-02-28", "sector_id": "CAIXA"}
+
+
+def _engine_frame(n_days: int = 28, employees=("ALICE", "BRUNO", "CARLA")) -> pd.DataFrame:
+    rows = []
+    for d in range(n_days):
+        for i, employee_id in enumerate(employees):
+            work = (d + i) % 7 != 0
+            rows.append({
+                "work_date": date(2026, 2, 1) + timedelta(days=d),
+                "employee_id": employee_id,
+                "status": "WORK" if work else "FOLGA",
+                "shift_code": "CAI1" if work else "",
+                "minutes": 480 if work else 0,
+                "source_rule": "TEMPLATE_BASE",
+                "day_key": "MON",  # colunas extras do motor não vazam para a resposta
+            })
+    return pd.DataFrame(rows)
+
+
+class _FakeOrchestrator:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def run(self, *args, **kwargs):
+        assignments = _engine_frame()
+        return {
+            "status": "SUCCESS",
+            "assignments_count": len(assignments),
+            "violations_count": 1,
+            "preferences_processed": 0,
+            "exceptions_applied": 2,
+            "preview_assignments": assignments,
+            "preview_violations": [
+                {"employee_id": "ALICE", "rule_code": "R1_MAX_CONSECUTIVE", "severity": "CRITICAL",
+                 "date_start": date(2026, 2, 2), "date_end": date(2026, 2, 9), "detail": "7 dias"},
+            ],
+        }
+
+
+def _patch(monkeypatch):
+    monkeypatch.setattr(scale_routes, "ValidationOrchestrator", _FakeOrchestrator)
+    monkeypatch.setattr(
+        scale_routes,
+        "_build_preflight",
+        lambda req, repo: PreflightResponse(
+            mode="NORMAL", blockers=[], critical_warnings=[], can_proceed=True, ack_required=False
+        ),
+    )
+
+
+def test_ndjson_stream_matches_json_response(monkeypatch):
+    _patch(monkeypatch)
+    monkeypatch.setattr(scale_routes, "STREAM_CHUNK_ROWS", 10)
+    client = TestClient(app)
+
+    as_json = client.post("/scale/simulate", json=PAYLOAD).json()
+    streamed = client.post("/scale/simulate", json=PAYLOAD, headers={"Accept": "application/x-ndjson"})
+
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in streamed.text.splitlines()]
+    summary = dict(lines[0])
+    assert summary.pop("type") == "summary"
+    assert summary == {k: v for k, v in as_json.items() if k not in ("assignments", "violations")}
+
+    assignments = [{k: v for k, v in line.items() if k != "type"} for line in lines if line["type"] == "assignment"]
+    violations = [{k: v for k, v in line.items() if k != "type"} for line in lines if line["type"] == "violation"]
+    assert assignments == as_json["assignments"]
+    assert violations == as_json["violations"]
+    assert assignments[0]["shift_code"] == ""
+    assert violations[0]["rule_label"] == "Dias consecutivos (máx. 6)"
+
+
+def test_ndjson_chunks_are_bounded():
+    frame = _engine_frame()
+    chunks = list(scale_routes._ndjson_chunks({"status": "SUCCESS"}, frame, pd.DataFrame(), {}, chunk_rows=25))
+    assert len(chunks) == 1 + -(-len(frame) // 25)  # summary + blocos de alocações; sem violações
+    assert [chunk.count(b"\n") for chunk in chunks[1:-1]] == [25] * (len(chunks) - 2)
+
+
+def test_plain_json_is_still_the_default(monkeypatch):
+    _patch(monkeypatch)
+    client = TestClient(app)
+    res = client.post("/scale/simulate", json=PAYLOAD, headers={"Accept": "application/json"})
+    assert res.headers["content-type"].startswith("application/json")
+    assert len(res.json()["assignments"]) == 28 * 3
@@ -0,0 +1,78 @@
+"""Regressão: export do calendário gerado em pedaços (arquivo e rotas) com o mesmo conteúdo do documento inteiro."""
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+from fastapi.testclient import TestClient
+
+import apps.backend.routes.scale as scale_routes
+from apps.backend.main import app
+from apps.backend.src.infrastructure.presenters.export_calendar import (
+    export_calendar_files,
+    export_html,
+    export_markdown,
+    iter_html,
+    iter_markdown,
+)
+
+START = date(2026, 3, 1)
+
+
+def _schedule(n_days: int = 21, employees=("E1", "E2", "E3")) -> pd.DataFrame:
+    rows = []
+    for d in range(n_days):
+        for i, employee_id in enumerate(employees):
+            work = (d + i) % 7 != 0
+            rows.append({
+                "work_date": START + timedelta(days=d),
+                "employee_id": employee_id,
+                "status": "WORK" if work else "FOLGA",
+                "shift_code": "CAI1" if work else "",
+                "minutes": 480 if work else 0,
+            })
+    return pd.DataFrame(rows)
+
+
+def _args(df: pd.DataFrame) -> tuple:
+    violations = [SimpleNamespace(employee_id="E1", detail="7 dias consecutivos")]
+    return (df, violations, {"E1": 1800}, START, START + timedelta(days=20), {"E1": "Ana"}, "MON_SUN")
+
+
+def test_chunks_join_to_the_full_documents():
+    df = _schedule()
+    html_chunks = list(iter_html(*_args(df)))
+    md_chunks = list(iter_markdown(*_args(df)))
+
+    assert "".join(html_chunks) == export_html(*_args(df))
+    assert "".join(md_chunks) == export_markdown(*_args(df))
+    # Uma linha da grade por pedaço: nenhum pedaço é o documento inteiro.
+    assert sum('<tr><th class="col-date">' in chunk for chunk in html_chunks) == 21
+    assert len(md_chunks) > 21
+    assert max(len(chunk) for chunk in html_chunks) < len("".join(html_chunks)) / 3
+
+
+def test_files_are_written_in_place_without_leftovers(tmp_path):
+    df = _schedule()
+    paths = export_calendar_files(tmp_path, *_args(df))
+
+    assert paths["html"].read_text(encoding="utf-8") == export_html(*_args(df))
+    assert paths["markdown"].read_text(encoding="utf-8") == export_markdown(*_args(df))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["escala_calendario.html", "escala_calendario.md"]
+
+
+def test_export_routes_serve_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(scale_routes, "OUTPUT", tmp_path)
+    client = TestClient(app)
+    assert client.get("/scale/export/html").status_code == 404
+
+    export_calendar_files(tmp_path, *_args(_schedule()))
+    html = client.get("/scale/export/html")
+    markdown = client.get("/scale/export/markdown")
+    download = client.get("/scale/export/markdown/download")
+
+    assert html.headers["content-type"] == "text/html; charset=utf-8"
+    assert html.text == (tmp_path / "escala_calendario.html").read_text(encoding="utf-8")
+    assert markdown.headers["content-type"] == "text/plain; charset=utf-8"
+    assert markdown.text.startswith("# EscalaFlow")
+    assert "attachment" in download.headers["content-disposition"]
+    assert download.content == markdown.content
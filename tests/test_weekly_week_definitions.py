@@ -0,0 +1,137 @@
+"""Regressão: resumo semanal com todos os cortes dos mesmos agregados (ordinais inteiros) e `week_definitions` na API."""
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import apps.backend.routes.scale as scale_routes
+from apps.backend.deps import get_repo
+from apps.backend.main import app
+from apps.backend.schemas import WeeklyAnalysisResponse
+from apps.backend.src.domain.aggregates import ScheduleAggregates, target_profile
+
+BODY = {"period_start": "2026-02-01", "period_end": "2026-03-15", "sector_id": "CAIXA", "mode": "SIMULATION"}
+
+
+def _random_schedule(seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(8):
+        for d in range(45):
+            if rng.random() < 0.15:
+                continue
+            work_date = date(2026, 2, 1) + timedelta(days=d)
+            rows.append({
+                "work_date": work_date if rng.random() < 0.5 else str(work_date),
+                "employee_id": f"E{rng.randint(0, 9)}",
+                "status": "WORK",
+                "shift_code": "CAI1",
+                "minutes": rng.choice([0, 270, 480, 300.5]),
+            })
+    rng.shuffle(rows)
+    return pd.DataFrame(rows)
+
+
+def _weekly_by_groupby(df: pd.DataFrame, week_definition: str) -> dict:
+    """Referência: groupby por (colaborador, início da semana) sobre datas."""
+    days = pd.to_datetime(df["work_date"])
+    offset = days.dt.weekday + (1 if week_definition == "SUN_SAT" else 0)
+    week_start = (days - pd.to_timedelta(offset % 7, unit="D")).dt.date
+    grouped = df.assign(week_start=week_start).groupby(["employee_id", "week_start"])["minutes"].sum()
+    return {(str(e), w): m for (e, w), m in grouped.items()}
+
+
+def _summary_by_loop(df, profiles, names, tolerance, week_definition) -> list[dict]:
+    """Referência: uma linha por (colaborador, semana) montada em Python."""
+    rows = []
+    for (employee_id, week_start), minutes in sorted(_weekly_by_groupby(df, week_definition).items()):
+        target, contract_code = target_profile(profiles.get(employee_id, {"contract_code": "UNKNOWN", "weekly_minutes": 2640}))
+        delta = int(minutes) - target
+        rows.append({
+            "window": week_definition,
+            "week_start": str(week_start),
+            "week_end": str(week_start + timedelta(days=6)),
+            "employee_id": employee_id,
+            "employee_name": names.get(employee_id),
+            "contract_code": contract_code,
+            "actual_minutes": int(minutes),
+            "target_minutes": target,
+            "delta_minutes": delta,
+            "status": "OK" if abs(delta) <= tolerance else "OUT",
+        })
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_weekly_totals_match_groupby_for_every_window(seed):
+    df = _random_schedule(seed)
+    aggregates = ScheduleAggregates.from_assignments(df)
+    shuffled = aggregates.daily.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+    for week_definition in ("MON_SUN", "SUN_SAT"):
+        expected = _weekly_by_groupby(df, week_definition)
+        for weekly in (aggregates.weekly_totals(week_definition), ScheduleAggregates._weekly_from_daily(shuffled)[week_definition]):
+            got = {(e, w): m for e, w, m in zip(weekly["employee_id"], weekly["week_start"], weekly["minutes"])}
+            assert got == pytest.approx(expected)
+            assert list(weekly["employee_id"]) == sorted(weekly["employee_id"])
+
+
+def test_empty_schedule_has_empty_windows():
+    aggregates = ScheduleAggregates.from_assignments(pd.DataFrame(columns=["work_date", "employee_id", "minutes"]))
+    assert all(weekly.empty for weekly in aggregates.weekly.values())
+    assert list(aggregates.weekly_totals("SUN_SAT").columns) == ["employee_id", "week_start", "week_start_ordinal", "minutes"]
+
+
+@pytest.mark.parametrize("week_definition", ["MON_SUN", "SUN_SAT"])
+def test_summary_records_match_row_by_row_build(week_definition):
+    df = _random_schedule(7)
+    profiles = {"E1": {"contract_code": "H30", "weekly_minutes": 1800}, "E2": 2200}
+    names = {"E1": "Ana", "E3": "Caio"}
+
+    records = scale_routes._weekly_summary_records(df, profiles, names, 120, week_definition)
+
+    assert records == _summary_by_loop(df, profiles, names, 120, week_definition)
+
+
+def _fake_simulation(monkeypatch, df: pd.DataFrame) -> None:
+    result = {"preview_assignments": df, "aggregates": ScheduleAggregates.from_assignments(df)}
+
+    class _FakeOrchestrator:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def run(self, *args, **kwargs):
+            return dict(result)
+
+    def no_rebuild(*args, **kwargs):
+        raise AssertionError("agregados do motor deveriam ser reaproveitados")
+
+    monkeypatch.setattr(scale_routes, "ValidationOrchestrator", _FakeOrchestrator)
+    monkeypatch.setattr(ScheduleAggregates, "from_assignments", no_rebuild)
+
+
+def test_endpoint_returns_requested_week_definitions(memory_repo, monkeypatch):
+    df = _random_schedule(3)
+    _fake_simulation(monkeypatch, df)
+    app.dependency_overrides[get_repo] = lambda: memory_repo
+    try:
+        client = TestClient(app)
+        legacy = client.post("/scale/weekly-analysis", json=BODY)
+        listed = client.post("/scale/weekly-analysis", json={**BODY, "week_definitions": ["sun_sat", "MON_SUN", "SUN_SAT"]})
+        invalid = client.post("/scale/weekly-analysis", json={**BODY, "week_definitions": ["TUE_MON"]})
+    finally:
+        app.dependency_overrides.clear()
+
+    legacy_body = WeeklyAnalysisResponse.model_validate_json(legacy.content)
+    listed_body = WeeklyAnalysisResponse.model_validate_json(listed.content)
+    assert legacy_body.summaries == {}
+    assert [row.model_dump() for row in legacy_body.summaries_sun_sat] == _summary_by_loop(df, {}, {}, legacy_body.tolerance_minutes, "SUN_SAT")
+    assert list(listed_body.summaries) == ["SUN_SAT", "MON_SUN"]
+    assert listed_body.summaries["MON_SUN"] == legacy_body.summaries_mon_sun
+    assert listed_body.summaries["SUN_SAT"] == legacy_body.summaries_sun_sat
+    assert listed_body.summaries_mon_sun == legacy_body.summaries_mon_sun  # campos originais sempre preenchidos
+    assert listed_body.summaries_sun_sat == legacy_body.summaries_sun_sat
+    assert invalid.status_code == 422
+    assert "TUE_MON" in invalid.json()["detail"]